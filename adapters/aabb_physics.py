@@ -0,0 +1,709 @@
+import math
+from bisect import bisect_left
+from typing import List, Tuple
+
+import numpy as np
+
+from domain.physics.constants import MAX_FALL_SPEED
+from domain.physics.physics_snapshot import PhysicsSnapshot
+from domain.physics.spatial_query import BoxHits, NearestHits, SegmentHits
+from domain.physics.state_blob import pack_arrays, unpack_arrays
+from domain.physics.vector2D import Vector2D
+from ports.physics_port import PhysicsPort
+
+# Tolerância para considerar duas caixas encostadas como em contato
+CONTACT_SLOP = 0.01
+
+# Até este número de corpos dinâmicos o passo roda corpo a corpo em Python:
+# o custo fixo de cada chamada NumPy passa do custo da conta em si
+SMALL_STEP_DYNAMICS = 16
+
+# Arrays por slot gravados por save_state
+SAVED_ARRAYS = (
+    'positions', 'previous', 'velocities', 'grounded',
+    'half_sizes', 'offsets', 'limits', 'inv_mass', 'slot_ids', 'forces'
+)
+
+
+def sweep_and_prune(query_min_x: np.ndarray, query_max_x: np.ndarray,
+                    sorted_min_x: np.ndarray, max_extent: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Candidatos de cada consulta entre intervalos ordenados pelo início em x.
+
+    Retorna uma janela (consultas x largura) de índices em sorted_min_x e a
+    máscara das posições válidas; max_extent é a largura do maior intervalo.
+    """
+    count = len(query_min_x)
+    bounds = np.searchsorted(sorted_min_x, np.concatenate((query_min_x - max_extent, query_max_x)))
+    lo, hi = bounds[:count], bounds[count:]
+    width = int((hi - lo).max()) if count else 0
+    candidates = lo[:, None] + np.arange(max(width, 0))
+    valid = candidates < hi[:, None]
+    np.minimum(candidates, max(len(sorted_min_x) - 1, 0), out=candidates)
+    return candidates, valid
+
+
+def penetrations(center_a: np.ndarray, half_a: np.ndarray,
+                 center_b: np.ndarray, half_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distância entre centros e sobreposição por eixo de vários pares de AABBs.
+
+    Os pares colidem onde a sobreposição é positiva nos dois eixos.
+    """
+    delta = center_b - center_a
+    overlap = half_a + half_b - np.abs(delta)
+    return delta, overlap
+
+
+class AABBPhysicsAdapter(PhysicsPort):
+    """Motor de caixas alinhadas aos eixos, especializado no mundo do runner.
+
+    Segue as mesmas convenções do PymunkPhysicsAdapter: a posição de um corpo
+    dinâmico é o centro da caixa e a de um corpo estático é a ponta esquerda
+    da linha central do segmento.
+    """
+
+    def __init__(self,
+                 gravity: Vector2D = Vector2D(0, 9.81),
+                 physics_hz: float = 120.0,
+                 max_steps_per_frame: int = 8,
+                 velocity_limit: Tuple[float, float] = (float('inf'), MAX_FALL_SPEED)):
+        self.default_gravity = gravity
+        self.gravity_multiplier = 1
+        self.gravity = np.array([gravity.x, gravity.y], dtype=np.float64)
+        self.default_velocity_limit = velocity_limit
+
+        self.fixed_dt = 1.0 / physics_hz
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0
+
+        self.state = PhysicsSnapshot()
+        self.next_id = 0
+        self._bind_arrays()
+
+        # Índices derivados, refeitos só quando corpos são criados ou removidos
+        self._index_dirty = True
+        self.dynamic_slots = np.empty(0, dtype=np.intp)
+        self.static_slots = np.empty(0, dtype=np.intp)
+        self.static_min_x = np.empty(0, dtype=np.float64)
+        self.max_static_extent = 0.0
+        # Contatos do último passo, convertidos em pares de slots só quando consultados
+        self.contact_slots = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+        self._raw_contacts = None
+
+    def _bind_arrays(self) -> None:
+        """Cria as views NumPy sobre os arrays do snapshot e ajusta os arrays internos"""
+        capacity = self.state.capacity
+        self.positions = np.frombuffer(self.state.positions, dtype=np.float64).reshape(capacity, 2)
+        self.previous = np.frombuffer(self.state.previous_positions, dtype=np.float64).reshape(capacity, 2)
+        self.velocities = np.frombuffer(self.state.velocities, dtype=np.float64).reshape(capacity, 2)
+        self.grounded = np.frombuffer(self.state.grounded, dtype=np.int8)
+        self.stamps = np.frombuffer(self.state.stamps, dtype=np.uint64)
+
+        self.half_sizes = self._resized(getattr(self, 'half_sizes', None), (capacity, 2))
+        self.offsets = self._resized(getattr(self, 'offsets', None), (capacity, 2))
+        self.forces = self._resized(getattr(self, 'forces', None), (capacity, 2))
+        self.limits = self._resized(getattr(self, 'limits', None), (capacity, 2))
+        self.inv_mass = self._resized(getattr(self, 'inv_mass', None), (capacity,))
+        self.slot_ids = self._resized(getattr(self, 'slot_ids', None), (capacity,), fill=-1, dtype=np.int64)
+
+    def _release_arrays(self) -> None:
+        # O array do snapshot não pode crescer enquanto houver views exportadas
+        self.positions = self.previous = self.velocities = self.grounded = self.stamps = None
+
+    @staticmethod
+    def _resized(current, shape, fill=0, dtype=np.float64) -> np.ndarray:
+        resized = np.full(shape, fill, dtype=dtype)
+        if current is not None:
+            resized[:len(current)] = current
+        return resized
+
+    def _create_body(self, position: Vector2D) -> int:
+        body_id = self.next_id
+        self.next_id += 1
+        if self.state.is_full():
+            self._release_arrays()
+            slot = self.state.allocate(body_id)
+            self._bind_arrays()
+        else:
+            slot = self.state.allocate(body_id)
+
+        self.slot_ids[slot] = body_id
+        self.positions[slot] = (position.x, position.y)
+        self.previous[slot] = (position.x, position.y)
+        self.velocities[slot] = 0.0
+        self.forces[slot] = 0.0
+        self.grounded[slot] = 0
+        self.state.touch(slot)
+        self._index_dirty = True
+        return slot
+
+    def create_dynamic_body(self, position: Vector2D, size: Tuple[float, float], mass: float) -> int:
+        slot = self._create_body(position)
+        self.half_sizes[slot] = (size[0] / 2, size[1] / 2)
+        self.offsets[slot] = 0.0
+        self.inv_mass[slot] = 1.0 / mass
+        self.limits[slot] = self.default_velocity_limit
+        return int(self.slot_ids[slot])
+
+    def create_static_body(self, position: Vector2D, size: Tuple[float, float]) -> int:
+        slot = self._create_body(position)
+        self.half_sizes[slot] = (size[0] / 2, size[1] / 2)
+        self.offsets[slot] = (size[0] / 2, 0.0)
+        self.inv_mass[slot] = 0.0
+        self.limits[slot] = 0.0
+        return int(self.slot_ids[slot])
+
+    def destroy_body(self, object_id: int) -> None:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return
+        self.slot_ids[slot] = -1
+        self.forces[slot] = 0.0
+        self.state.release(object_id)
+        first, second = self._contact_pairs()
+        keep = (first != slot) & (second != slot)
+        self.contact_slots = (first[keep], second[keep])
+        self._index_dirty = True
+
+    def reset(self) -> None:
+        self.state.clear()
+        self.slot_ids[:] = -1
+        self.forces[:] = 0.0
+        self.grounded[:] = 0
+        self.next_id = 0
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0
+        self.gravity_multiplier = 1
+        self.gravity[:] = (self.default_gravity.x, self.default_gravity.y)
+        self.contact_slots = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+        self._raw_contacts = None
+        self._index_dirty = True
+
+    def flip_gravity(self) -> None:
+        """Inverte a direção da gravidade"""
+        self.gravity_multiplier *= -1
+        self.gravity[1] = self.default_gravity.y * self.gravity_multiplier
+
+    def apply_force(self, object_id: int, force: Vector2D) -> None:
+        slot = self.state.slot_of(object_id)
+        if slot >= 0 and self.inv_mass[slot] > 0:
+            self.forces[slot] += (force.x, force.y)
+
+    def set_velocity(self, object_id: int, velocity: Vector2D) -> None:
+        slot = self.state.slot_of(object_id)
+        if slot >= 0:
+            max_x, max_y = self.limits[slot] if self.inv_mass[slot] > 0 else self.default_velocity_limit
+            self.state.write_velocity(
+                slot,
+                max(min(velocity.x, max_x), -max_x),
+                max(min(velocity.y, max_y), -max_y)
+            )
+
+    def set_velocity_limit(self, object_id: int, max_x: float, max_y: float) -> None:
+        slot = self.state.slot_of(object_id)
+        if slot >= 0 and self.inv_mass[slot] > 0:
+            self.limits[slot] = (max_x, max_y)
+            self._index_dirty = True
+
+    def get_velocity(self, object_id: int) -> Vector2D:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return Vector2D(0, 0)
+        return self.state.get_velocity(slot)
+
+    def get_position(self, object_id: int) -> Vector2D:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return Vector2D(0, 0)
+        return self.state.get_position(slot)
+
+    def set_position(self, object_id: int, position: Vector2D) -> None:
+        slot = self.state.slot_of(object_id)
+        if slot >= 0:
+            self.positions[slot] = (position.x, position.y)
+            self.previous[slot] = (position.x, position.y)
+            self.state.touch(slot)
+            if self.inv_mass[slot] == 0:
+                self._index_dirty = True
+
+    def get_interpolation_alpha(self) -> float:
+        return self.interpolation_alpha
+
+    def get_interpolated_position(self, object_id: int, alpha: float) -> Vector2D:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return Vector2D(0, 0)
+        return self.state.get_interpolated_position(slot, alpha)
+
+    def snapshot(self) -> PhysicsSnapshot:
+        return self.state
+
+    def save_state(self) -> bytes:
+        # Todo o estado do motor já vive em arrays indexados por slot: basta copiá-los
+        used = self.state.next_slot
+        return pack_arrays(
+            **{name: getattr(self, name)[:used] for name in SAVED_ARRAYS},
+            free_slots=np.array(self.state.free_slots, dtype=np.int64),
+            header=np.array([self.next_id, self.gravity_multiplier, self.accumulator])
+        )
+
+    def restore_state(self, blob: bytes) -> None:
+        data = unpack_arrays(blob)
+        next_id, gravity_multiplier, accumulator = data['header'].tolist()
+        slot_ids = data['slot_ids']
+        used = len(slot_ids)
+
+        self.reset()
+        self._release_arrays()
+        self.state.restore_slots(
+            {int(body_id): slot for slot, body_id in enumerate(slot_ids.tolist()) if body_id >= 0},
+            data['free_slots'].tolist(),
+            used
+        )
+        self._bind_arrays()
+        for name in SAVED_ARRAYS:
+            getattr(self, name)[:used] = data[name]
+        self.stamps[:used] = self.state.version
+
+        self.next_id = int(next_id)
+        self.accumulator = accumulator
+        self.interpolation_alpha = accumulator / self.fixed_dt
+        self.gravity_multiplier = int(gravity_multiplier)
+        self.gravity[1] = self.default_gravity.y * self.gravity_multiplier
+
+    def is_grounded(self, object_id: int) -> bool:
+        slot = self.state.slot_of(object_id)
+        return slot >= 0 and self.grounded[slot] != 0
+
+    def get_contacts(self, object_id: int) -> List[int]:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return []
+        first, second = self._contact_pairs()
+        others = np.concatenate((second[first == slot], first[second == slot]))
+        return self.slot_ids[others].tolist()
+
+    def _query_candidates(self, x_min: np.ndarray, x_max: np.ndarray,
+                          categories: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Corpos candidatos de cada consulta: slots, centros, meias dimensões e máscara (n x largura)"""
+        if self._index_dirty:
+            self._rebuild_index()
+
+        count = len(x_min)
+        parts = []
+        if categories & self.CATEGORY_GROUND and len(self.static_slots):
+            candidates, valid = sweep_and_prune(
+                x_min, x_max, self.static_min_x, self.max_static_extent
+            )
+            parts.append((
+                self.static_slots[candidates],
+                self.static_centers[candidates],
+                self.static_halves[candidates],
+                valid
+            ))
+        if categories & self.CATEGORY_DYNAMIC and len(self.dynamic_slots):
+            # Poucos corpos dinâmicos: todos são candidatos de todas as consultas
+            shape = (count, len(self.dynamic_slots))
+            parts.append((
+                np.broadcast_to(self.dynamic_slots, shape),
+                np.broadcast_to(self.positions[self.dynamic_slots], shape + (2,)),
+                np.broadcast_to(self.dynamic_half, shape + (2,)),
+                np.ones(shape, dtype=bool)
+            ))
+
+        if not parts:
+            return (np.empty((count, 0), dtype=np.intp), np.empty((count, 0, 2)),
+                    np.empty((count, 0, 2)), np.empty((count, 0), dtype=bool))
+        return tuple(np.concatenate(column, axis=1) for column in zip(*parts))
+
+    def cast_segments(self, starts: np.ndarray, ends: np.ndarray,
+                      radius: float = 0.0, categories: int = PhysicsPort.CATEGORY_ALL) -> SegmentHits:
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+        hits = SegmentHits.missed(ends)
+        ends = hits.points.copy()
+        slots, centers, halves, valid = self._query_candidates(
+            np.minimum(starts[:, 0], ends[:, 0]) - radius,
+            np.maximum(starts[:, 0], ends[:, 0]) + radius,
+            categories
+        )
+        if slots.shape[1] == 0:
+            return hits
+
+        # Interseção com as caixas aumentadas pelo raio, eixo por eixo (método das faixas)
+        start = starts[:, None, :]
+        direction = (ends - starts)[:, None, :]
+        halves = halves + radius
+        with np.errstate(divide='ignore', invalid='ignore'):
+            near = (centers - halves - start) / direction
+            far = (centers + halves - start) / direction
+        t_min = np.minimum(near, far)
+        t_max = np.maximum(near, far)
+        # Eixo sem movimento: a faixa vale para todo t se o início estiver dentro dela
+        still = direction == 0
+        inside = np.abs(start - centers) <= halves
+        t_min = np.where(still, -np.inf, t_min)
+        t_max = np.where(still, np.where(inside, np.inf, -np.inf), t_max)
+
+        enter = t_min.max(axis=2)
+        leave = t_max.min(axis=2)
+        crossing = valid & (enter <= leave) & (leave >= 0) & (enter <= 1)
+        fractions = np.where(crossing, np.maximum(enter, 0.0), np.inf)
+
+        best = fractions.argmin(axis=1)
+        rows = np.arange(len(starts))
+        found = crossing[rows, best]
+        if not found.any():
+            return hits
+
+        rows, best = rows[found], best[found]
+        axis = t_min[rows, best].argmax(axis=1)
+        fraction = fractions[rows, best]
+        # Quem já começa dentro do corpo não tem face de entrada
+        normal_sign = np.where(enter[rows, best] >= 0, -np.sign(direction[rows, 0, axis]), 0.0)
+
+        hits.ids[rows] = self.slot_ids[slots[rows, best]]
+        hits.fractions[rows] = fraction
+        hits.normals[rows, axis] = normal_sign
+        hits.points[rows] = starts[rows] + fraction[:, None] * direction[rows, 0] - hits.normals[rows] * radius
+        return hits
+
+    def query_boxes(self, boxes: np.ndarray, categories: int = PhysicsPort.CATEGORY_ALL) -> BoxHits:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        slots, centers, halves, valid = self._query_candidates(boxes[:, 0], boxes[:, 2], categories)
+
+        box_half = (boxes[:, 2:] - boxes[:, :2]) / 2
+        box_center = boxes[:, :2] + box_half
+        _, overlap = penetrations(box_center[:, None, :], box_half[:, None, :], centers, halves)
+        touching = valid & (overlap >= 0).all(axis=2)
+
+        # nonzero percorre linha a linha, então os IDs saem agrupados por caixa
+        rows, columns = np.nonzero(touching)
+        offsets = np.zeros(len(boxes) + 1, dtype=np.intp)
+        np.cumsum(touching.sum(axis=1), out=offsets[1:])
+        return BoxHits(ids=self.slot_ids[slots[rows, columns]], offsets=offsets)
+
+    def query_nearest(self, points: np.ndarray, max_distance: float,
+                      categories: int = PhysicsPort.CATEGORY_ALL) -> NearestHits:
+        hits = NearestHits.missed(points)
+        points = hits.points.copy()
+        slots, centers, halves, valid = self._query_candidates(
+            points[:, 0] - max_distance, points[:, 0] + max_distance, categories
+        )
+        if slots.shape[1] == 0:
+            return hits
+
+        delta = points[:, None, :] - centers
+        depth = halves - np.abs(delta)
+        inside = (depth >= 0).all(axis=2)
+        distances = np.where(
+            inside,
+            -depth.min(axis=2),
+            np.hypot(*np.maximum(-depth, 0.0).transpose(2, 0, 1))
+        )
+        distances = np.where(valid & (distances <= max_distance), distances, np.inf)
+
+        best = distances.argmin(axis=1)
+        rows = np.arange(len(points))
+        found = np.isfinite(distances[rows, best])
+        rows, best = rows[found], best[found]
+
+        center, half = centers[rows, best], halves[rows, best]
+        surface = np.clip(points[rows], center - half, center + half)
+        # Ponto interno: o mais próximo fica na face de menor profundidade
+        trapped = np.flatnonzero(inside[rows, best])
+        axis = depth[rows[trapped], best[trapped]].argmin(axis=1)
+        surface[trapped, axis] = (center[trapped, axis]
+                                  + np.copysign(half[trapped, axis], delta[rows[trapped], best[trapped], axis]))
+
+        hits.ids[rows] = self.slot_ids[slots[rows, best]]
+        hits.points[rows] = surface
+        hits.distances[rows] = distances[rows, best]
+        return hits
+
+    def _contact_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(self._raw_contacts, list):
+            # Passo em Python: os pares de slots já saem prontos
+            pairs = np.array(self._raw_contacts, dtype=np.intp).reshape(-1, 2)
+            self.contact_slots = (pairs[:, 0], pairs[:, 1])
+            self._raw_contacts = None
+        elif self._raw_contacts is not None:
+            candidates, touching, first, second = self._raw_contacts
+            rows, columns = np.nonzero(touching)
+            self.contact_slots = (
+                np.concatenate((self.dynamic_slots[rows], self.dynamic_slots[first])),
+                np.concatenate((self.static_slots[candidates[rows, columns]], self.dynamic_slots[second]))
+            )
+            self._raw_contacts = None
+        return self.contact_slots
+
+    def _rebuild_index(self) -> None:
+        # Os contatos pendentes usam os índices antigos
+        self._contact_pairs()
+
+        live = self.slot_ids[:self.state.next_slot] >= 0
+        dynamic = live & (self.inv_mass[:self.state.next_slot] > 0)
+        self.dynamic_slots = np.flatnonzero(dynamic)
+
+        # Cópias compactas do que não muda entre passos
+        self.dynamic_half = self.half_sizes[self.dynamic_slots]
+        self.dynamic_limits = self.limits[self.dynamic_slots]
+        self.dynamic_inv_mass = self.inv_mass[self.dynamic_slots, None]
+        self.dynamic_rows = np.arange(len(self.dynamic_slots))
+        self.max_dynamic_extent = float(2 * self.dynamic_half[:, 0].max()) if len(self.dynamic_slots) else 0.0
+
+        # Broadphase: estáticos ordenados pelo início do intervalo em x
+        statics = np.flatnonzero(live & ~dynamic)
+        centers = self.positions[statics] + self.offsets[statics]
+        halves = self.half_sizes[statics]
+        order = np.argsort(centers[:, 0] - halves[:, 0], kind='stable')
+        self.static_slots = statics[order]
+        self.static_centers = centers[order]
+        self.static_halves = halves[order]
+        self.static_min_x = self.static_centers[:, 0] - self.static_halves[:, 0]
+        self.max_static_extent = float(2 * halves[:, 0].max()) if len(statics) else 0.0
+
+        # As mesmas colunas como listas Python, para o passo com poucos corpos
+        self.small_dynamics = list(zip(
+            self.dynamic_slots.tolist(), self.dynamic_half.tolist(),
+            self.dynamic_limits.tolist(), self.dynamic_inv_mass[:, 0].tolist()
+        ))
+        self.static_slot_list = self.static_slots.tolist()
+        self.static_min_list = self.static_min_x.tolist()
+        self.static_boxes = np.hstack((self.static_centers, self.static_halves)).tolist()
+        self._index_dirty = False
+
+    def update(self, delta_time: float) -> None:
+        if self._index_dirty:
+            self._rebuild_index()
+
+        self.accumulator += delta_time
+        steps = 0
+
+        while self.accumulator >= self.fixed_dt and steps < self.max_steps_per_frame:
+            self._step(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+
+        if self.accumulator >= self.fixed_dt:
+            # Limite de passos atingido: descarta o atraso para evitar a espiral da morte
+            self.accumulator = 0.0
+
+        if steps > 0:
+            self.forces[self.dynamic_slots] = 0.0
+            self.state.version += 1
+            self.stamps[self.dynamic_slots] = self.state.version
+
+        self.interpolation_alpha = self.accumulator / self.fixed_dt
+
+    def _step(self, dt: float) -> None:
+        dynamic = self.dynamic_slots
+        if len(dynamic) == 0:
+            return
+        if len(dynamic) <= SMALL_STEP_DYNAMICS:
+            self._step_small(dt)
+            return
+
+        position = self.positions[dynamic]
+        self.previous[dynamic] = position
+
+        # Euler semi-implícito
+        velocity = self.velocities[dynamic]
+        velocity += (self.forces[dynamic] * self.dynamic_inv_mass + self.gravity) * dt
+        np.clip(velocity, -self.dynamic_limits, self.dynamic_limits, out=velocity)
+        position += velocity * dt
+
+        grounded, candidates, touching = self._resolve_static(position, velocity)
+        if len(dynamic) > 1:
+            first, second = self._resolve_dynamic(position, velocity)
+        else:
+            first = second = self.dynamic_rows[:0]
+        self._raw_contacts = (candidates, touching, first, second)
+
+        self.positions[dynamic] = position
+        self.velocities[dynamic] = velocity
+        self.grounded[dynamic] = grounded
+
+    def _resolve_static(self, position: np.ndarray,
+                        velocity: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Empurra os corpos dinâmicos para fora dos estáticos pelo eixo de menor penetração"""
+        half = self.dynamic_half
+        candidates, valid = sweep_and_prune(
+            position[:, 0] - half[:, 0],
+            position[:, 0] + half[:, 0],
+            self.static_min_x,
+            self.max_static_extent
+        )
+        delta, overlap = penetrations(
+            position[:, None, :], half[:, None, :],
+            self.static_centers[candidates], self.static_halves[candidates]
+        )
+        touching = valid & (overlap > -CONTACT_SLOP).all(axis=2)
+
+        # Empurrão só no eixo de menor penetração, para longe do estático
+        along_y = overlap[..., 1] <= overlap[..., 0]
+        push = np.copysign(np.maximum(overlap, 0.0), -delta)
+        push[..., 0] *= touching & ~along_y
+        push[..., 1] *= touching & along_y
+
+        # Vários contatos no mesmo eixo não somam: vale o maior empurrão em cada sentido
+        correction_up = np.maximum(push.max(axis=1, initial=0.0), 0.0)
+        correction_down = np.minimum(push.min(axis=1, initial=0.0), 0.0)
+        position += correction_up
+        position += correction_down
+
+        # Zera a velocidade na direção de cada contato
+        np.clip(
+            velocity,
+            np.where(correction_up > 0, 0.0, -np.inf),
+            np.where(correction_down < 0, 0.0, np.inf),
+            out=velocity
+        )
+
+        support = touching & along_y & ((delta[..., 1] > 0) == (self.gravity[1] > 0))
+        return support.any(axis=1), candidates, touching
+
+    def _resolve_dynamic(self, position: np.ndarray, velocity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Separa pares de corpos dinâmicos proporcionalmente ao inverso das massas"""
+        half = self.dynamic_half
+        min_x = position[:, 0] - half[:, 0]
+        order = np.argsort(min_x)
+        candidates, valid = sweep_and_prune(
+            min_x, position[:, 0] + half[:, 0], min_x[order], self.max_dynamic_extent
+        )
+        # Cada par aparece nas duas janelas: fica só a ocorrência com o menor índice primeiro
+        partners = order[candidates]
+        valid &= partners > self.dynamic_rows[:, None]
+        first, column = np.nonzero(valid)
+        second = partners[first, column]
+
+        delta, overlap = penetrations(position[first], half[first], position[second], half[second])
+        touching = (overlap > -CONTACT_SLOP).all(axis=1)
+        first, second = first[touching], second[touching]
+        if len(first) == 0:
+            return first, second
+        delta, overlap = delta[touching], overlap[touching]
+
+        inv_mass = self.dynamic_inv_mass[:, 0]
+        share = inv_mass[first] / (inv_mass[first] + inv_mass[second])
+        axis = (overlap[:, 1] <= overlap[:, 0]).astype(np.intp)
+        rows = np.arange(len(first))
+        depth = np.maximum(overlap[rows, axis], 0.0) * np.sign(delta[rows, axis])
+
+        np.add.at(position, (first, axis), -depth * share)
+        np.add.at(position, (second, axis), depth * (1.0 - share))
+
+        # Choque inelástico: os dois passam a ter a velocidade média no eixo do contato
+        mass_first = 1.0 / inv_mass[first]
+        mass_second = 1.0 / inv_mass[second]
+        shared = (velocity[first, axis] * mass_first + velocity[second, axis] * mass_second) / (mass_first + mass_second)
+        velocity[first, axis] = shared
+        velocity[second, axis] = shared
+
+        return first, second
+
+    def _step_small(self, dt: float) -> None:
+        """O mesmo passo de _step, corpo a corpo com floats do Python.
+
+        No jogo há um corpo dinâmico e algumas dezenas de estáticos ativos;
+        aí as dezenas de chamadas NumPy por passo custam mais que a conta.
+        As regras e a ordem das operações são as do caminho vetorizado.
+        """
+        gravity_x, gravity_y = self.gravity.tolist()
+        static_min_x = self.static_min_list
+        static_boxes = self.static_boxes
+        static_slots = self.static_slot_list
+        max_extent = self.max_static_extent
+        contacts = []
+        bodies = []
+
+        for slot, (half_x, half_y), (max_vx, max_vy), inv_mass in self.small_dynamics:
+            x, y = self.positions[slot].tolist()
+            vx, vy = self.velocities[slot].tolist()
+            force_x, force_y = self.forces[slot].tolist()
+            self.previous[slot] = (x, y)
+
+            # Euler semi-implícito
+            vx = min(max(vx + (force_x * inv_mass + gravity_x) * dt, -max_vx), max_vx)
+            vy = min(max(vy + (force_y * inv_mass + gravity_y) * dt, -max_vy), max_vy)
+            x += vx * dt
+            y += vy * dt
+
+            # Estáticos cujo início em x cai na janela do sweep-and-prune
+            start = bisect_left(static_min_x, x - half_x - max_extent)
+            stop = bisect_left(static_min_x, x + half_x)
+            up_x = up_y = down_x = down_y = 0.0
+            grounded = False
+            for index in range(start, stop):
+                center_x, center_y, other_x, other_y = static_boxes[index]
+                delta_x, delta_y = center_x - x, center_y - y
+                overlap_x = half_x + other_x - abs(delta_x)
+                overlap_y = half_y + other_y - abs(delta_y)
+                if overlap_x <= -CONTACT_SLOP or overlap_y <= -CONTACT_SLOP:
+                    continue
+                contacts.append((slot, static_slots[index]))
+                # Empurrão só no eixo de menor penetração; vale o maior em cada sentido
+                if overlap_y <= overlap_x:
+                    push = math.copysign(max(overlap_y, 0.0), -delta_y)
+                    up_y, down_y = max(up_y, push), min(down_y, push)
+                    if (delta_y > 0) == (gravity_y > 0):
+                        grounded = True
+                else:
+                    push = math.copysign(max(overlap_x, 0.0), -delta_x)
+                    up_x, down_x = max(up_x, push), min(down_x, push)
+            x = x + up_x + down_x
+            y = y + up_y + down_y
+
+            # Zera a velocidade na direção de cada contato
+            if up_x > 0:
+                vx = max(vx, 0.0)
+            if down_x < 0:
+                vx = min(vx, 0.0)
+            if up_y > 0:
+                vy = max(vy, 0.0)
+            if down_y < 0:
+                vy = min(vy, 0.0)
+            bodies.append([slot, half_x, half_y, inv_mass, x, y, vx, vy, grounded])
+
+        if len(bodies) > 1:
+            contacts.extend(self._resolve_dynamic_small(bodies))
+        for slot, _, _, _, x, y, vx, vy, grounded in bodies:
+            self.positions[slot] = (x, y)
+            self.velocities[slot] = (vx, vy)
+            self.grounded[slot] = grounded
+        self._raw_contacts = contacts
+
+    def _resolve_dynamic_small(self, bodies: List[list]) -> List[Tuple[int, int]]:
+        """_resolve_dynamic em Python, sobre as linhas [slot, meias dimensões, inv_mass, x, y, vx, vy, ...]"""
+        min_x = [body[4] - body[1] for body in bodies]
+        order = sorted(range(len(bodies)), key=min_x.__getitem__)
+        pairs = []
+        for first, body in enumerate(bodies):
+            window_start = min_x[first] - self.max_dynamic_extent
+            window_stop = body[4] + body[1]
+            for second in order:
+                if second <= first or not window_start <= min_x[second] < window_stop:
+                    continue
+                other = bodies[second]
+                delta = (other[4] - body[4], other[5] - body[5])
+                overlap = (body[1] + other[1] - abs(delta[0]), body[2] + other[2] - abs(delta[1]))
+                if overlap[0] > -CONTACT_SLOP and overlap[1] > -CONTACT_SLOP:
+                    axis = 1 if overlap[1] <= overlap[0] else 0
+                    pairs.append((first, second, axis, max(overlap[axis], 0.0) * ((delta[axis] > 0) - (delta[axis] < 0))))
+
+        # Como no caminho vetorizado: correções e velocidades calculadas antes de aplicar
+        shared = []
+        for first, second, axis, depth in pairs:
+            body, other = bodies[first], bodies[second]
+            mass_first, mass_second = 1.0 / body[3], 1.0 / other[3]
+            shared.append((body[6 + axis] * mass_first + other[6 + axis] * mass_second) / (mass_first + mass_second))
+        for first, second, axis, depth in pairs:
+            body, other = bodies[first], bodies[second]
+            bodies[first][4 + axis] -= depth * (body[3] / (body[3] + other[3]))
+        for first, second, axis, depth in pairs:
+            body, other = bodies[first], bodies[second]
+            bodies[second][4 + axis] += depth * (1.0 - body[3] / (body[3] + other[3]))
+        for (first, second, axis, _), velocity in zip(pairs, shared):
+            bodies[first][6 + axis] = velocity
+        for (first, second, axis, _), velocity in zip(pairs, shared):
+            bodies[second][6 + axis] = velocity
+        return [(bodies[first][0], bodies[second][0]) for first, second, _, _ in pairs]
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pygame
+
+from domain.animation.sprite_sheet import SpriteSheet
+
+BUNDLE_MAGIC = b"AORA"
+BUNDLE_VERSION = 2
+BUNDLE_EXTENSION = ".aora"
+# magic, versão, largura e altura do atlas, offset e tamanho do índice, offsets dos pixels e dos sons
+HEADER = struct.Struct("<4sHIIQQQQ")
+ALIGNMENT = 64
+# Pixels BGRA pré-multiplicados: no little-endian é o formato ARGB32 da tela
+PIXEL_FORMAT = "BGRA"
+PIXEL_BYTES = 4
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def source_fingerprint(path: str) -> Optional[List[int]]:
+    """Tamanho e mtime do arquivo de origem, gravados no índice para detectar pacotes desatualizados"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def manifest_hash(sheets: Iterable[SpriteSheet], sounds: Iterable[str]) -> str:
+    """Hash das folhas (caminho, quadros e tempos) e dos sons que o manifesto pede"""
+    manifest = {
+        "sheets": [[sheet.path, sheet.frames, sheet.frame_times] for sheet in sheets],
+        "sounds": list(sounds),
+    }
+    return hashlib.blake2b(json.dumps(manifest, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def pack_shelves(sizes: List[Tuple[int, int]], atlas_width: int) -> Tuple[List[Tuple[int, int]], int]:
+    """Posições de cada retângulo em prateleiras, dos mais altos para os mais baixos, e a altura total"""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if x + width > atlas_width:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+    return positions, y + shelf_height
+
+
+def bake_assets(path: str, sheets: Iterable[SpriteSheet], sounds: Iterable[str]) -> Dict:
+    """Empacota as folhas num atlas e os efeitos já decodificados num arquivo só; retorna o índice.
+
+    Os pixels são gravados pré-multiplicados no formato da tela, e os sons
+    como PCM no formato do mixer atual, então o jogo não decodifica nada.
+    """
+    sheets = list(sheets)
+    sounds = list(sounds)
+    surfaces = [pygame.image.load(sheet.path) for sheet in sheets]
+    sizes = [surface.get_size() for surface in surfaces]
+    # Atlas perto de quadrado, mas sempre cabendo a folha mais larga
+    atlas_width = max([math.isqrt(sum(width * height for width, height in sizes))] +
+                      [width for width, _ in sizes])
+    positions, atlas_height = pack_shelves(sizes, atlas_width)
+
+    atlas = pygame.Surface((atlas_width, max(atlas_height, 1)), pygame.SRCALPHA, 32)
+    atlas.fill((0, 0, 0, 0))
+    index = {"format": PIXEL_FORMAT + "_PREMULT", "manifest": manifest_hash(sheets, sounds),
+             "sheets": {}, "sounds": {}}
+    for sheet, surface, (x, y) in zip(sheets, surfaces, positions):
+        atlas.blit(surface, (x, y))
+        index["sheets"][sheet.path] = {
+            "rect": [x, y, *surface.get_size()],
+            "source": source_fingerprint(sheet.path),
+            "animations": {name: {"frames": [list(rect) for rect in rects],
+                                  "frame_time": sheet.frame_times[name]}
+                           for name, rects in sheet.frames.items()},
+        }
+    pixels = pygame.image.tobytes(atlas.premul_alpha(), PIXEL_FORMAT)
+
+    sound_data = []
+    offset = 0
+    if pygame.mixer.get_init() is None:
+        pygame.mixer.init()
+    index["mixer"] = list(pygame.mixer.get_init())
+    for sound_path in sounds:
+        raw = pygame.mixer.Sound(sound_path).get_raw()
+        index["sounds"][sound_path] = {"offset": offset, "size": len(raw),
+                                       "source": source_fingerprint(sound_path)}
+        sound_data.append(raw)
+        offset = _aligned(offset + len(raw))
+
+    encoded = json.dumps(index).encode("utf-8")
+    index_offset = _aligned(HEADER.size)
+    pixels_offset = _aligned(index_offset + len(encoded))
+    sounds_offset = _aligned(pixels_offset + len(pixels))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, atlas_width, atlas.get_height(),
+                               index_offset, len(encoded), pixels_offset, sounds_offset))
+        file.seek(index_offset)
+        file.write(encoded)
+        file.seek(pixels_offset)
+        file.write(pixels)
+        for sound_path, raw in zip(index["sounds"], sound_data):
+            file.seek(sounds_offset + index["sounds"][sound_path]["offset"])
+            file.write(raw)
+    os.replace(temporary, path)
+    return index
+
+
+class AssetBundle:
+    """Pacote de assets aberto com mmap: o atlas e os sons são views sobre o arquivo, sem decodificação.
+
+    Entradas cujo arquivo de origem mudou desde o bake (tamanho ou mtime
+    diferentes) são descartadas ao abrir, e o jogo carrega esses assets
+    soltos. Quadros e tempos das animações vêm sempre do manifesto.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, width, height, index_offset, index_size,
+         pixels_offset, sounds_offset) = HEADER.unpack_from(self.buffer)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError("Pacote de assets inválido")
+        self.index = json.loads(self.buffer[index_offset:index_offset + index_size])
+        self.stale = self._drop_stale_entries()
+        view = memoryview(self.buffer)
+        pixels = view[pixels_offset:pixels_offset + width * height * PIXEL_BYTES]
+        self.atlas = pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+        self.sounds_view = view[sounds_offset:]
+
+    def _drop_stale_entries(self) -> List[str]:
+        """Tira do índice as folhas e sons cuja origem mudou e retorna os caminhos.
+
+        Origem que não existe mais fica valendo: o pacote é a única cópia dela.
+        """
+        stale = []
+        for section in (self.index["sheets"], self.index["sounds"]):
+            for source, entry in list(section.items()):
+                current = source_fingerprint(source)
+                if current is not None and current != entry["source"]:
+                    stale.append(source)
+                    del section[source]
+        return stale
+
+    def matches_manifest(self, sheets: Iterable[SpriteSheet], sounds: Iterable[str]) -> bool:
+        return self.index["manifest"] == manifest_hash(sheets, sounds)
+
+    @classmethod
+    def open_if_exists(cls, path: str, sheets: Sequence[SpriteSheet] = (),
+                       sounds: Sequence[str] = ()) -> Optional["AssetBundle"]:
+        """Abre o pacote se ele existir e for válido; senão o jogo fica nos arquivos soltos.
+
+        Avisa uma vez se o pacote está desatualizado em relação às origens ou
+        ao manifesto (sheets e sounds), sugerindo um novo bake.
+        """
+        try:
+            bundle = cls(path)
+        except (OSError, ValueError, KeyError) as e:
+            if os.path.exists(path):
+                print(f"Erro ao abrir pacote de assets: {e}; rode python -m simulation.bake_assets")
+            return None
+        outdated = list(bundle.stale)
+        if (sheets or sounds) and not bundle.matches_manifest(sheets, sounds):
+            outdated.append("manifesto")
+        if outdated:
+            print(f"Pacote de assets desatualizado ({', '.join(outdated)}): "
+                  f"esses assets vêm dos arquivos soltos até rodar python -m simulation.bake_assets")
+        return bundle
+
+    def has_sheet(self, path: str) -> bool:
+        return path in self.index["sheets"]
+
+    def sheet(self, path: str) -> pygame.Surface:
+        """A folha como subsurface do atlas, com pixels pré-multiplicados"""
+        return self.atlas.subsurface(self.index["sheets"][path]["rect"])
+
+    def sound(self, path: str) -> Optional[pygame.mixer.Sound]:
+        """Efeito já decodificado, se o mixer estiver no mesmo formato usado no bake"""
+        entry = self.index["sounds"].get(path)
+        if entry is None or list(pygame.mixer.get_init() or ()) != self.index["mixer"]:
+            return None
+        return pygame.mixer.Sound(buffer=self.sounds_view[entry["offset"]:entry["offset"] + entry["size"]])
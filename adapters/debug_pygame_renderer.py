@@ -1,5 +1,6 @@
 from typing import Tuple, override
 import pygame
+from adapters.text_cache import TextCache
 from domain.physics.vector2D import Vector2D
 from ports.renderer_port import RendererPort
 
@@ -8,6 +9,7 @@ class DebugPygameRenderer(RendererPort):
         self.screen = screen
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
+        self.text_cache = TextCache()
         self.debug_mode = True
 
     @override    
@@ -23,14 +25,13 @@ class DebugPygameRenderer(RendererPort):
             
             pos_text = f"({int(position.x)},{int(position.y)})"
             size_text = f"{int(size[0])}x{int(size[1])}"
-            text_surface = self.font.render(pos_text, True, (255, 255, 0))
-            size_surface = self.font.render(size_text, True, (255, 255, 0))
-            self.screen.blit(text_surface, (position.x, position.y - 20))
-            self.screen.blit(size_surface, (position.x, position.y - 40))
+            self.text_cache.draw(self.screen, self.font, pos_text, (position.x, position.y - 20), (255, 255, 0))
+            self.text_cache.draw(self.screen, self.font, size_text, (position.x, position.y - 40), (255, 255, 0))
 
     @override    
     def draw_sprite(self, sprite, position: Vector2D):
-        self.screen.blit(sprite, (position.x, position.y))
+        # Sprites do TexturePort têm alpha pré-multiplicado
+        self.screen.blit(sprite, (position.x, position.y), special_flags=pygame.BLEND_PREMULTIPLIED)
         if self.debug_mode and sprite:
             pygame.draw.rect(self.screen, (0, 255, 0), 
                            (position.x, position.y, sprite.get_width(), sprite.get_height()), 1)
@@ -40,8 +41,7 @@ class DebugPygameRenderer(RendererPort):
         self.screen.fill((0, 0, 0))  # Preenche com preto
 
     def draw_text(self, text: str, x: int, y: int, color: Tuple[int, int, int]):
-        text_surface = self.font.render(text, True, color)
-        self.screen.blit(text_surface, (x, y))
+        self.text_cache.draw(self.screen, self.font, text, (x, y), color)
        
     def present(self):
         pygame.display.flip()
\ No newline at end of file
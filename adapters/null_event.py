@@ -0,0 +1,40 @@
+from typing import Callable, Iterable, Set, override
+from ports.event_port import EventPort
+
+class NullEvent(EventPort):
+    """Entrada sem janela: as teclas pressionadas são definidas por código"""
+
+    def __init__(self):
+        self.pressed: Set[str] = set()
+        self.frame = 0
+        self.running = True
+
+    @override
+    def is_key_pressed(self, key: str) -> bool:
+        return key in self.pressed
+
+    @override
+    def poll_events(self) -> bool:
+        self.frame += 1
+        return self.running
+
+    @override
+    def quit(self):
+        self.running = False
+
+    @override
+    def get_text_input(self):
+        return ("", False, False)
+
+
+class ScriptedEvent(NullEvent):
+    """Entrada que consulta, a cada quadro, as teclas pressionadas naquele quadro"""
+
+    def __init__(self, script: Callable[[int], Iterable[str]]):
+        super().__init__()
+        self.script = script
+
+    @override
+    def poll_events(self) -> bool:
+        self.pressed = set(self.script(self.frame))
+        return super().poll_events()
@@ -0,0 +1,13 @@
+from typing import override
+from ports.mixer_port import MixerPort
+
+class NullMixer(MixerPort):
+    """Mixer sem áudio, para rodar o jogo sem dispositivo de som"""
+
+    @override
+    def play_music(self, path: str, volume: float) -> None:
+        pass
+
+    @override
+    def play_sound(self, path: str, volume: float) -> None:
+        pass
@@ -0,0 +1,29 @@
+from typing import Tuple, override
+from domain.physics.vector2D import Vector2D
+from ports.renderer_port import RendererPort
+
+class NullRenderer(RendererPort):
+    """Renderer que descarta tudo, para rodar o jogo sem janela"""
+
+    def __init__(self):
+        self.frames_presented = 0
+
+    @override
+    def draw_rect(self, position: Vector2D, size: Tuple[int, int], color: Tuple[int, int, int]):
+        pass
+
+    @override
+    def draw_sprite(self, sprite, position: Vector2D):
+        pass
+
+    @override
+    def clear(self):
+        pass
+
+    @override
+    def draw_text(self, text: str, x: int, y: int, color: Tuple[int, int, int]):
+        pass
+
+    @override
+    def present(self):
+        self.frames_presented += 1
@@ -0,0 +1,26 @@
+from typing import Any, Dict, Tuple, override
+from ports.texture_port import TexturePort
+
+class NullTexture(TexturePort):
+    """Texturas vazias: as animações rodam, mas sem imagens carregadas"""
+
+    @override
+    def load_texture(self, path: str) -> Any:
+        return None
+
+    @override
+    def release_texture(self, path: str) -> None:
+        pass
+
+    @override
+    def get_sprite_from_sheet(self, texture: Any, rect: Tuple[int, int, int, int]) -> Any:
+        return None
+
+    @override
+    def flip_sprite(self, sprite: Any, flip_x: bool, flip_y: bool) -> Any:
+        return sprite
+
+    @override
+    def memory_usage(self) -> Dict[str, int]:
+        return {}
+
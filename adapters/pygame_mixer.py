@@ -0,0 +1,27 @@
+from typing import Dict, Optional, override
+import pygame
+from adapters.asset_bundle import AssetBundle
+from ports.mixer_port import MixerPort
+
+class PygameMixer(MixerPort):
+    def __init__(self, bundle: Optional[AssetBundle] = None):
+        # Efeitos são decodificados uma vez e reaproveitados; os do pacote já vêm decodificados
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.bundle = bundle
+
+    @override
+    def play_music(self, path: str, volume: float) -> None:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play()
+
+    @override
+    def play_sound(self, path: str, volume: float) -> None:
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = self.bundle.sound(path) if self.bundle is not None else None
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
+            self.sounds[path] = sound
+        sound.set_volume(volume)
+        sound.play()
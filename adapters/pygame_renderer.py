@@ -1,5 +1,6 @@
 from typing import Tuple, override
 import pygame
+from adapters.text_cache import TextCache
 from domain.physics.vector2D import Vector2D
 from ports.renderer_port import RendererPort
 
@@ -8,6 +9,7 @@ class PygameRenderer(RendererPort):
         self.screen = screen
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
+        self.text_cache = TextCache()
 
     @override    
     def draw_rect(self, position: Vector2D, size: Tuple[int, int], color: Tuple[int, int, int]):
@@ -15,15 +17,15 @@ class PygameRenderer(RendererPort):
 
     @override    
     def draw_sprite(self, sprite, position: Vector2D):
-        self.screen.blit(sprite, (position.x, position.y))
+        # Sprites do TexturePort têm alpha pré-multiplicado
+        self.screen.blit(sprite, (position.x, position.y), special_flags=pygame.BLEND_PREMULTIPLIED)
 
     @override  
     def clear(self):
         self.screen.fill((0, 0, 0))  # Fill with black
 
     def draw_text(self, text: str, x: int, y: int, color: Tuple[int, int, int]):
-       text_surface = self.font.render(text, True, color)
-       self.screen.blit(text_surface, (x, y))
+       self.text_cache.draw(self.screen, self.font, text, (x, y), color)
        
     def present(self):
        pygame.display.flip()
\ No newline at end of file
@@ -1,22 +1,36 @@
-from typing import Tuple
+from typing import Dict, Optional, Tuple, override
 import pygame
+from adapters.texture_cache import TextureCache, shared_texture_cache
 from ports.texture_port import TexturePort
 
 class PygameTexture(TexturePort):
+    def __init__(self, cache: Optional[TextureCache] = None):
+        # Texturas compartilhadas: recarregar o mesmo caminho não volta ao disco
+        self.cache = cache if cache is not None else shared_texture_cache
+
+    @override
     def load_texture(self, path: str) -> pygame.Surface:
         try:
-            return pygame.image.load(path)
+            return self.cache.acquire(path)
         except Exception as e:
             print(f"Erro ao carregar textura: {e}")
             return None
-            
+
+    @override
+    def release_texture(self, path: str) -> None:
+        self.cache.release(path)
+
+    @override
     def get_sprite_from_sheet(self, 
                            texture: pygame.Surface, 
                            rect: Tuple[int, int, int, int]) -> pygame.Surface:
-        frame = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
-        frame.blit(texture, (0, 0), rect)
-        return frame
+        return self.cache.sprite(texture, rect)
     
+    @override
     def flip_sprite(self, sprite: pygame.Surface, 
                    flip_x: bool, flip_y: bool) -> pygame.Surface:
-        return pygame.transform.flip(sprite, flip_x, flip_y)
\ No newline at end of file
+        return pygame.transform.flip(sprite, flip_x, flip_y)
+
+    @override
+    def memory_usage(self) -> Dict[str, int]:
+        return self.cache.memory_usage()
@@ -1,37 +1,154 @@
 import logging
-from typing import Dict, Set, Tuple
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
 import pymunk
+from pymunk._chipmunk_cffi import lib
+from domain.entity.ground_segment import PLATFORM_HEIGHT
+from domain.ground_generator import MAX_PLATFORM_WIDTH, MIN_PLATFORM_WIDTH
+from domain.physics.constants import MAX_FALL_SPEED
+from domain.physics.physics_snapshot import PhysicsSnapshot
+from domain.physics.spatial_query import BoxHits, NearestHits, SegmentHits
+from domain.physics.state_blob import pack_arrays, unpack_arrays
 from domain.physics.vector2D import Vector2D
 from ports.physics_port import PhysicsPort
 
 from pymunk.vec2d import Vec2d
 
-logging.basicConfig(level=logging.DEBUG)
+# Registro de um corpo no blob de save_state, na ordem das shapes no espaço
+BODY_RECORD = np.dtype([
+    ('id', '<i8'),
+    ('slot', '<i8'),
+    ('hashid', '<u8'),
+    ('dynamic', '?'),
+    ('position', '<f8', (2,)),
+    ('previous', '<f8', (2,)),
+    ('velocity', '<f8', (2,)),
+    ('angle', '<f8'),
+    ('angular_velocity', '<f8'),
+    ('size', '<f8', (2,)),
+    ('mass', '<f8'),
+    ('velocity_limit', '<f8', (2,)),
+])
+
+# Ponto de contato de um arbiter em cache, com os impulsos acumulados do warm start
+CONTACT_RECORD = np.dtype([
+    ('r1', '<f8', (2,)),
+    ('r2', '<f8', (2,)),
+    ('n_mass', '<f8'),
+    ('t_mass', '<f8'),
+    ('bounce', '<f8'),
+    ('jn_acc', '<f8'),
+    ('jt_acc', '<f8'),
+    ('j_bias', '<f8'),
+    ('bias', '<f8'),
+    ('hash', '<u8'),
+])
+MAX_ARBITER_CONTACTS = 2  # CP_MAX_CONTACTS_PER_ARBITER do Chipmunk
+
+# Arbiter em cache do pymunk, identificado pelos IDs dos dois corpos
+ARBITER_RECORD = np.dtype([
+    ('a', '<i8'),
+    ('b', '<i8'),
+    ('e', '<f8'),
+    ('u', '<f8'),
+    ('surface_vr', '<f8', (2,)),
+    ('n', '<f8', (2,)),
+    ('count', '<i4'),
+    ('swapped', '?'),
+    ('stamp', '<u8'),
+    ('state', '<i4'),
+    ('contacts', CONTACT_RECORD, (MAX_ARBITER_CONTACTS,)),
+])
+
+
+@dataclass
+class BroadphaseConfig:
+    """Estratégia de broadphase e iterações do solver do pymunk"""
+    strategy: str = "bbtree"  # "bbtree" ou "spatial_hash"
+    cell_size: float = 0.0
+    cell_count: int = 1000
+    iterations: int = 20
+
+    @classmethod
+    def spatial_hash_for_platforms(cls,
+                                   cell_count: int = 1000,
+                                   iterations: int = 20) -> "BroadphaseConfig":
+        """Hash espacial com células do tamanho médio das plataformas do GroundGenerator"""
+        mean_width = (MIN_PLATFORM_WIDTH + MAX_PLATFORM_WIDTH) / 2
+        return cls(
+            strategy="spatial_hash",
+            cell_size=max(mean_width, PLATFORM_HEIGHT),
+            cell_count=cell_count,
+            iterations=iterations
+        )
 
 class PymunkPhysicsAdapter(PhysicsPort):
-    def __init__(self, gravity: Vector2D = Vector2D(0, 9.81)):
+    def __init__(self,
+                 gravity: Vector2D = Vector2D(0, 9.81),
+                 physics_hz: float = 120.0,
+                 max_steps_per_frame: int = 8,
+                 max_pooled_static_bodies: int = 64,
+                 velocity_limit: Tuple[float, float] = (float('inf'), MAX_FALL_SPEED),
+                 broadphase: Optional[BroadphaseConfig] = None,
+                 max_substeps: int = 8):
         logging.debug("Inicializando PymunkPhysicsAdapter com gravidade: %s", gravity)
-        self.space = pymunk.Space()
-        self.space.gravity = (gravity.x, gravity.y)
         self.default_gravity = gravity
         self.gravity_multiplier = 1
         
-        self.space.iterations = 20
+        self.broadphase = broadphase or BroadphaseConfig()
+        if self.broadphase.strategy not in ("bbtree", "spatial_hash"):
+            raise ValueError(f"Estratégia de broadphase desconhecida: {self.broadphase.strategy}")
+        self.space = self._create_space()
         
         self.bodies: Dict[int, pymunk.Body] = {}
         self.shapes: Dict[int, pymunk.Shape] = {}
+        # Registro separado para que o custo por passo dependa só dos corpos dinâmicos
+        self.dynamic_bodies: Dict[int, pymunk.Body] = {}
+        self.default_velocity_limit = velocity_limit
+        self.velocity_limits: Dict[int, Tuple[float, float]] = {}
         self.next_id = 0
         
-        self.CATEGORY_DYNAMIC = 0b001
-        self.CATEGORY_GROUND = 0b010
-        self.CATEGORY_PLATFORM = 0b100
-
         self.grounded_bodies: Set[int] = set()
+
+        # Índice reverso shape -> id e contatos mantidos fora dos callbacks do pymunk
+        self.shape_to_body: Dict[pymunk.Shape, int] = {}
+        self.contacts: Dict[int, Set[int]] = {}
+        self.ground_contacts: Dict[int, Set[int]] = {}
+        self.contact_events: List[Tuple[bool, pymunk.Shape, pymunk.Shape, float]] = []
+
+        # Segmentos estáticos removidos ficam guardados para reaproveitamento
+        self.static_pool: List[Tuple[pymunk.Body, pymunk.Segment]] = []
+        self.max_pooled_static_bodies = max_pooled_static_bodies
+
+        # Visão em arrays do estado dos corpos, atualizada uma vez por update()
+        self.state = PhysicsSnapshot()
+
+        # Passo fixo: o acumulador guarda o tempo de frame ainda não simulado
+        self.fixed_dt = 1.0 / physics_hz
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0
+        self.pending_forces: Dict[int, Tuple[float, float]] = {}
+
+        # Subpassos adaptativos contra tunelamento: cada subpasso move os corpos
+        # no máximo o raio do segmento estático mais fino
+        self.max_substeps = max_substeps
+        self.min_static_radius = float('inf')
         
         self._setup_collision_handlers()
         
-        # Debug flags
-        self.debug_collisions = True
+        # Debug flags; o log por contato só é útil ao investigar colisões
+        self.debug_collisions = False
+
+    def _create_space(self) -> pymunk.Space:
+        space = pymunk.Space()
+        space.gravity = (self.default_gravity.x, self.default_gravity.y * self.gravity_multiplier)
+        space.iterations = self.broadphase.iterations
+        if self.broadphase.strategy == "spatial_hash":
+            space.use_spatial_hash(self.broadphase.cell_size, self.broadphase.cell_count)
+        return space
 
     def flip_gravity(self):
         """Inverte a direção da gravidade"""
@@ -40,20 +157,40 @@ class PymunkPhysicsAdapter(PhysicsPort):
             self.default_gravity.x,
             self.default_gravity.y * self.gravity_multiplier
         )
-        logging.debug(f"Gravidade invertida: {self.space.gravity}")
+        logging.debug("Gravidade invertida: %s", self.space.gravity)
 
     def apply_force(self, object_id: int, force: Vector2D) -> None:
-        if object_id in self.bodies:
-            body = self.bodies[object_id]
-            body.apply_force_at_local_point((force.x, force.y), (0, 0))
+        # A força vale para o frame inteiro e é reaplicada em cada passo fixo
+        if object_id in self.dynamic_bodies:
+            fx, fy = self.pending_forces.get(object_id, (0.0, 0.0))
+            self.pending_forces[object_id] = (fx + force.x, fy + force.y)
 
     def set_velocity(self, object_id: int, velocity: Vector2D) -> None:
         if object_id in self.bodies:
             body = self.bodies[object_id]
-            max_velocity = 400
-            vx = max(min(velocity.x, max_velocity), -max_velocity)
-            vy = max(min(velocity.y, max_velocity), -max_velocity)
+            max_x, max_y = self.velocity_limits.get(object_id, self.default_velocity_limit)
+            vx = max(min(velocity.x, max_x), -max_x)
+            vy = max(min(velocity.y, max_y), -max_y)
             body.velocity = (vx, vy)
+            self.state.write_velocity(self.state.slot_of(object_id), vx, vy)
+
+    def set_velocity_limit(self, object_id: int, max_x: float, max_y: float) -> None:
+        if object_id in self.dynamic_bodies:
+            self.velocity_limits[object_id] = (max_x, max_y)
+            self.dynamic_bodies[object_id].velocity_func = self._limited_velocity_func(max_x, max_y)
+
+    @staticmethod
+    def _limited_velocity_func(max_x: float, max_y: float):
+        """Integra a velocidade normalmente e limita o resultado dentro do passo do pymunk"""
+        update_velocity = pymunk.Body.update_velocity
+
+        def limited_velocity(body, gravity, damping, dt):
+            update_velocity(body, gravity, damping, dt)
+            vx, vy = body.velocity
+            if vx > max_x or vx < -max_x or vy > max_y or vy < -max_y:
+                body.velocity = (max(min(vx, max_x), -max_x), max(min(vy, max_y), -max_y))
+
+        return limited_velocity
 
     def get_velocity(self, object_id: int) -> Vector2D:
         if object_id in self.bodies:
@@ -67,91 +204,101 @@ class PymunkPhysicsAdapter(PhysicsPort):
             return Vector2D(body.position.x, body.position.y)
         return Vector2D(0, 0)
 
+    def get_interpolation_alpha(self) -> float:
+        return self.interpolation_alpha
+
+    def get_interpolated_position(self, object_id: int, alpha: float) -> Vector2D:
+        slot = self.state.slot_of(object_id)
+        if slot < 0:
+            return Vector2D(0, 0)
+        return self.state.get_interpolated_position(slot, alpha)
+
+    def snapshot(self) -> PhysicsSnapshot:
+        return self.state
+
     def set_position(self, object_id: int, position: Vector2D) -> None:
         if object_id in self.bodies:
             body = self.bodies[object_id]
             body.position = (position.x, position.y)
+            self._write_initial_state(object_id, body)
 
     def _setup_collision_handlers(self):
+        # Os callbacks só registram o evento; o processamento fica em _drain_contact_events
+        events = self.contact_events
+
         def begin_collision(arbiter, space, data):
-            if self.debug_collisions:
-                logging.debug(f"Colisão detectada! Normal: {arbiter.normal}")
-                logging.debug(f"Gravity multiplier: {self.gravity_multiplier}")
-            
-            shapes = arbiter.shapes
-            normal = arbiter.normal
-            logging.debug("Colisão com o chão detectada!")
-            # Identifica as shapes
-            dynamic_shape = None
-            ground_shape = None
-            
-            for shape in shapes:
-                if shape.collision_type == self.CATEGORY_DYNAMIC:
-                    dynamic_shape = shape
-                elif shape.collision_type == self.CATEGORY_GROUND:
-                    ground_shape = shape
-            
-            if dynamic_shape and ground_shape:
-                is_ground_collision = False
-                
-                if self.gravity_multiplier > 0:  # Gravidade normal
-                    is_ground_collision = normal.y > 0.5
-                else:  # Gravidade invertida
-                    is_ground_collision = normal.y < -0.5
-                
-                if is_ground_collision:
-                    if self.debug_collisions:
-                        logging.debug("Colisão com o chão detectada!")
-                    
-                    # Encontra o ID do corpo dinâmico
-                    for body_id, shape in self.shapes.items():
-                        if shape == dynamic_shape:
-                            self.grounded_bodies.add(body_id)
-                            if self.debug_collisions:
-                                logging.debug(f"Objeto {body_id} está no chão")
-                            break
-                return True
+            shape_a, shape_b = arbiter.shapes
+            events.append((True, shape_a, shape_b, arbiter.normal.y))
+            return True
 
         def separate_collision(arbiter, space, data):
-            if self.debug_collisions:
-                logging.debug("Separação detectada!")
-            
-            shapes = arbiter.shapes
-            dynamic_shape = None
-            
-            for shape in shapes:
-                if shape.collision_type == self.CATEGORY_DYNAMIC:
-                    dynamic_shape = shape
-                break
-                    
-            if dynamic_shape:
-                for body_id, shape in self.shapes.items():
-                    if shape == dynamic_shape:
-                        self.grounded_bodies.discard(body_id)
-                        if self.debug_collisions:
-                            logging.debug(f"Objeto {body_id} não está mais no chão")
-                        break
-                return True
+            shape_a, shape_b = arbiter.shapes
+            events.append((False, shape_a, shape_b, 0.0))
 
         ground_handler = self.space.add_collision_handler(
                 self.CATEGORY_DYNAMIC,
                 self.CATEGORY_GROUND
             )
-        
         ground_handler.begin = begin_collision
-         
         ground_handler.separate = separate_collision
 
         dynamic_handler = self.space.add_collision_handler(
-        self.CATEGORY_DYNAMIC,
+            self.CATEGORY_DYNAMIC,
             self.CATEGORY_DYNAMIC
         )
-        dynamic_handler.begin = lambda a, s, d: True
+        dynamic_handler.begin = begin_collision
+        dynamic_handler.separate = separate_collision
+
+    def _is_ground_normal(self, normal_y: float) -> bool:
+        if self.gravity_multiplier > 0:  # Gravidade normal
+            return normal_y > 0.5
+        return normal_y < -0.5  # Gravidade invertida
+
+    def _drain_contact_events(self) -> None:
+        """Processa em lote os eventos de contato registrados pelos callbacks"""
+        if not self.contact_events:
+            return
+
+        for began, shape_a, shape_b, normal_y in self.contact_events:
+            body_a = self.shape_to_body.get(shape_a)
+            body_b = self.shape_to_body.get(shape_b)
+            if body_a is None or body_b is None:
+                continue
+
+            is_ground = shape_b.collision_type == self.CATEGORY_GROUND
+            if began:
+                self.contacts.setdefault(body_a, set()).add(body_b)
+                self.contacts.setdefault(body_b, set()).add(body_a)
+                if is_ground and self._is_ground_normal(normal_y):
+                    self.ground_contacts.setdefault(body_a, set()).add(body_b)
+            else:
+                self.contacts.get(body_a, set()).discard(body_b)
+                self.contacts.get(body_b, set()).discard(body_a)
+                if is_ground:
+                    self.ground_contacts.get(body_a, set()).discard(body_b)
+
+            if self.ground_contacts.get(body_a):
+                self.grounded_bodies.add(body_a)
+            else:
+                self.grounded_bodies.discard(body_a)
+
+            if self.debug_collisions:
+                logging.debug("Contato %s entre %s e %s", "iniciado" if began else "encerrado", body_a, body_b)
+
+        self.contact_events.clear()
 
     def create_dynamic_body(self, position: Vector2D, size: Tuple[float, float], mass: float) -> int:
+        return self._register_body(*self._new_dynamic_box(position, size, mass))
+
+    def create_static_body(self, position: Vector2D, size: Tuple[float, float]) -> int:
+        return self._register_body(*self._take_static_segment(position, size))
+
+    def _new_dynamic_box(self, position: Vector2D, size: Tuple[float, float],
+                         mass: float) -> Tuple[pymunk.Body, pymunk.Poly]:
         moment = pymunk.moment_for_box(mass, size)
         body = pymunk.Body(mass, moment)
         body.position = (position.x, position.y)
+        body.velocity_func = self._limited_velocity_func(*self.default_velocity_limit)
         
         shape = pymunk.Poly.create_box(body, size)
         shape.collision_type = self.CATEGORY_DYNAMIC
@@ -160,19 +307,48 @@ class PymunkPhysicsAdapter(PhysicsPort):
             categories=self.CATEGORY_DYNAMIC,
             mask=self.CATEGORY_GROUND | self.CATEGORY_PLATFORM | self.CATEGORY_DYNAMIC
         )
-        
+        return body, shape
+
+    def _take_static_segment(self, position: Vector2D,
+                             size: Tuple[float, float]) -> Tuple[pymunk.Body, pymunk.Segment]:
+        if self.static_pool:
+            segment_body, segment = self.static_pool.pop()
+            segment.unsafe_set_endpoints((0, 0), (size[0], 0))
+            segment.unsafe_set_radius(size[1]/2)
+        else:
+            segment_body, segment = self._new_static_segment(size)
+        segment_body.position = position.x, position.y
+        self.min_static_radius = min(self.min_static_radius, size[1]/2)
+        return segment_body, segment
+
+    def _register_body(self, body: pymunk.Body, shape: pymunk.Shape, body_id: Optional[int] = None) -> int:
+        """Adiciona o corpo ao espaço; sem body_id, usa um ID e um slot novos"""
         self.space.add(body, shape)
-        
-        body_id = self.next_id
-        self.next_id += 1
+    
+        if body_id is None:
+            body_id = self.next_id
+            self.next_id += 1
+            self.state.allocate(body_id)
         self.bodies[body_id] = body
+        if body.body_type == pymunk.Body.DYNAMIC:
+            self.dynamic_bodies[body_id] = body
         self.shapes[body_id] = shape
-        
+        self.shape_to_body[shape] = body_id
+        self._write_initial_state(body_id, body)
+    
         return body_id
 
-    def create_static_body(self, position: Vector2D, size: Tuple[float, float]) -> int:
+    def _write_initial_state(self, body_id: int, body: pymunk.Body) -> None:
+        """Grava o estado do corpo sem histórico, para que não haja interpolação"""
+        slot = self.state.slot_of(body_id)
+        x, y = body.position
+        self.state.write_position(slot, x, y)
+        self.state.previous_positions[2 * slot] = x
+        self.state.previous_positions[2 * slot + 1] = y
+        self.state.write_velocity(slot, body.velocity.x, body.velocity.y)
+
+    def _new_static_segment(self, size: Tuple[float, float]) -> Tuple[pymunk.Body, pymunk.Segment]:
         segment_body = pymunk.Body(body_type=pymunk.Body.STATIC)
-        segment_body.position = position.x, position.y
 
         start_point = Vec2d(0, 0)  # Começa na posição do corpo
         end_point = Vec2d(size[0], 0)  # Estende horizontalmente pelo width especificado
@@ -183,29 +359,335 @@ class PymunkPhysicsAdapter(PhysicsPort):
             categories=self.CATEGORY_GROUND,
             mask=self.CATEGORY_DYNAMIC
         )
+        return segment_body, segment
 
-        self.space.add(segment_body, segment)
-    
-        body_id = self.next_id
-        self.next_id += 1
-        self.bodies[body_id] = segment_body
-        self.shapes[body_id] = segment
-    
-        return body_id
-        
+    def destroy_body(self, object_id: int) -> None:
+        body = self.bodies.pop(object_id, None)
+        if body is None:
+            return
+        self.dynamic_bodies.pop(object_id, None)
+        self.velocity_limits.pop(object_id, None)
+        shape = self.shapes.pop(object_id)
+        self.shape_to_body.pop(shape, None)
+        self.space.remove(body, shape)
+
+        self.state.release(object_id)
+        self.pending_forces.pop(object_id, None)
+        self.ground_contacts.pop(object_id, None)
+        self.grounded_bodies.discard(object_id)
+        for other_id in self.contacts.pop(object_id, ()):
+            self.contacts.get(other_id, set()).discard(object_id)
+            ground = self.ground_contacts.get(other_id)
+            if ground and object_id in ground:
+                ground.discard(object_id)
+                if not ground:
+                    self.grounded_bodies.discard(other_id)
+                    other_slot = self.state.slot_of(other_id)
+                    self.state.grounded[other_slot] = 0
+                    self.state.touch(other_slot)
+
+        if body.body_type == pymunk.Body.STATIC and len(self.static_pool) < self.max_pooled_static_bodies:
+            self.static_pool.append((body, shape))
+
+    def reset(self) -> None:
+        for body_id in list(self.bodies):
+            self.destroy_body(body_id)
+        self.next_id = 0
+        self.state.clear()
+        self.contact_events.clear()
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0
+        self.gravity_multiplier = 1
+        # Espaço novo: o índice espacial e o contador de hashids do antigo guardam a
+        # história das remoções. Segmentos reciclados também mudam a ordem interna
+        # das shapes; sem eles, um mundo resetado simula igual a um recém-criado
+        self.space = self._create_space()
+        self._setup_collision_handlers()
+        self.static_pool.clear()
+        self.min_static_radius = float('inf')
+
+    def save_state(self) -> bytes:
+        # Além dos corpos, o blob leva o que o pymunk guarda entre passos (hashids,
+        # timestamp e arbiters com os impulsos do warm start). A única coisa que
+        # fica de fora é o cache de pares do bbtree, com as dicas do GJK, que o
+        # pymunk não expõe; por isso o próprio mundo é refeito a partir do blob e
+        # segue simulando exatamente como qualquer restore_state dele
+        blob = self._pack_state()
+        self.restore_state(blob)
+        return blob
+
+    def _pack_state(self) -> bytes:
+        shapes = self.space.shapes
+        records = np.zeros(len(shapes), dtype=BODY_RECORD)
+        for record, shape in zip(records, shapes):
+            body_id = self.shape_to_body[shape]
+            body = shape.body
+            slot = self.state.slot_of(body_id)
+            record['id'] = body_id
+            record['slot'] = slot
+            record['hashid'] = shape._hashid
+            record['position'] = body.position
+            record['previous'] = self.state.previous_positions[2 * slot:2 * slot + 2]
+            record['velocity'] = body.velocity
+            record['angle'] = body.angle
+            record['angular_velocity'] = body.angular_velocity
+            if body_id in self.dynamic_bodies:
+                vertices = shape.get_vertices()
+                record['dynamic'] = True
+                record['size'] = (max(v.x for v in vertices) - min(v.x for v in vertices),
+                                  max(v.y for v in vertices) - min(v.y for v in vertices))
+                record['mass'] = body.mass
+                record['velocity_limit'] = self.velocity_limits.get(body_id, self.default_velocity_limit)
+            else:
+                record['size'] = (shape.b.x, 2 * shape.radius)
+                record['mass'] = float('inf')
+
+        return pack_arrays(
+            bodies=records,
+            arbiters=self._save_arbiters(),
+            free_slots=np.array(self.state.free_slots, dtype=np.int64),
+            contacts=self._contact_pairs(self.contacts),
+            ground_contacts=self._contact_pairs(self.ground_contacts),
+            pending_forces=np.array([(body_id, fx, fy) for body_id, (fx, fy) in self.pending_forces.items()],
+                                    dtype=np.float64).reshape(-1, 3),
+            space=np.array([lib.cpSpaceGetTimestamp(self.space._space),
+                            lib.cpSpaceGetShapeIDCounter(self.space._space)], dtype=np.uint64),
+            header=np.array([self.next_id, self.state.next_slot, self.gravity_multiplier, self.accumulator,
+                             self.space.current_time_step])
+        )
+
+    @staticmethod
+    def _contact_pairs(contacts: Dict[int, Set[int]]) -> np.ndarray:
+        return np.array([(body_id, other_id) for body_id, others in contacts.items() for other_id in others],
+                        dtype=np.int64).reshape(-1, 2)
+
+    def _save_arbiters(self) -> np.ndarray:
+        """Arbiters em cache do espaço, do mesmo jeito que o pickle do pymunk os guarda"""
+        ids = {shape._shape: body_id for shape, body_id in self.shape_to_body.items()}
+        arbiters = self.space._get_arbiters()
+        records = np.zeros(len(arbiters), dtype=ARBITER_RECORD)
+        for record, arbiter in zip(records, arbiters):
+            record['a'] = ids[arbiter.a]
+            record['b'] = ids[arbiter.b]
+            record['e'] = arbiter.e
+            record['u'] = arbiter.u
+            record['surface_vr'] = (arbiter.surface_vr.x, arbiter.surface_vr.y)
+            record['n'] = (arbiter.n.x, arbiter.n.y)
+            record['count'] = arbiter.count
+            record['swapped'] = arbiter.swapped
+            record['stamp'] = arbiter.stamp
+            record['state'] = arbiter.state
+            for index in range(arbiter.count):
+                contact = arbiter.contacts[index]
+                saved = record['contacts'][index]
+                saved['r1'] = (contact.r1.x, contact.r1.y)
+                saved['r2'] = (contact.r2.x, contact.r2.y)
+                saved['n_mass'] = contact.nMass
+                saved['t_mass'] = contact.tMass
+                saved['bounce'] = contact.bounce
+                saved['jn_acc'] = contact.jnAcc
+                saved['jt_acc'] = contact.jtAcc
+                saved['j_bias'] = contact.jBias
+                saved['bias'] = contact.bias
+                saved['hash'] = contact.hash
+        return records
+
+    def restore_state(self, blob: bytes) -> None:
+        data = unpack_arrays(blob)
+        next_id, next_slot, gravity_multiplier, accumulator, current_time_step = data['header'].tolist()
+        timestamp, shape_id_counter = data['space'].tolist()
+        records = data['bodies']
+
+        self.reset()
+        if int(gravity_multiplier) != self.gravity_multiplier:
+            self.flip_gravity()
+        self.state.restore_slots(
+            {int(record['id']): int(record['slot']) for record in records},
+            data['free_slots'].tolist(),
+            int(next_slot)
+        )
+        for record in records:
+            body_id = int(record['id'])
+            position = Vector2D(*record['position'].tolist())
+            size = tuple(record['size'].tolist())
+            if record['dynamic']:
+                body, shape = self._new_dynamic_box(position, size, float(record['mass']))
+                body.velocity = tuple(record['velocity'].tolist())
+            else:
+                body, shape = self._take_static_segment(position, size)
+            body.angle = float(record['angle'])
+            body.angular_velocity = float(record['angular_velocity'])
+            # Cada shape volta com o hashid original, que ordena o índice espacial e os arbiters
+            lib.cpSpaceSetShapeIDCounter(self.space._space, int(record['hashid']))
+            self._register_body(body, shape, body_id)
+            if record['dynamic']:
+                limit = tuple(record['velocity_limit'].tolist())
+                if limit != self.default_velocity_limit:
+                    self.set_velocity_limit(body_id, *limit)
+
+            slot = self.state.slot_of(body_id)
+            self.state.previous_positions[2 * slot] = float(record['previous'][0])
+            self.state.previous_positions[2 * slot + 1] = float(record['previous'][1])
+
+        lib.cpSpaceSetShapeIDCounter(self.space._space, int(shape_id_counter))
+        lib.cpSpaceSetTimestamp(self.space._space, int(timestamp))
+        lib.cpSpaceSetCurrentTimeStep(self.space._space, current_time_step)
+        self._restore_arbiters(data['arbiters'])
+
+        for body_id, other_id in data['contacts'].tolist():
+            self.contacts.setdefault(body_id, set()).add(other_id)
+        for body_id, other_id in data['ground_contacts'].tolist():
+            self.ground_contacts.setdefault(body_id, set()).add(other_id)
+        for body_id, others in self.ground_contacts.items():
+            if others:
+                self.grounded_bodies.add(body_id)
+                self.state.grounded[self.state.slot_of(body_id)] = 1
+        for body_id, fx, fy in data['pending_forces'].tolist():
+            self.pending_forces[int(body_id)] = (fx, fy)
+
+        self.next_id = int(next_id)
+        self.accumulator = accumulator
+        self.interpolation_alpha = accumulator / self.fixed_dt
+
+    def _restore_arbiters(self, records: np.ndarray) -> None:
+        for record in records:
+            arbiter = lib.cpArbiterNew(self.shapes[int(record['a'])]._shape, self.shapes[int(record['b'])]._shape)
+            arbiter.e = float(record['e'])
+            arbiter.u = float(record['u'])
+            arbiter.surface_vr = tuple(record['surface_vr'].tolist())
+            arbiter.n = tuple(record['n'].tolist())
+            count = int(record['count'])
+            contacts = lib.cpContactArrAlloc(count)
+            for index in range(count):
+                saved = record['contacts'][index]
+                contact = contacts[index]
+                contact.r1 = tuple(saved['r1'].tolist())
+                contact.r2 = tuple(saved['r2'].tolist())
+                contact.nMass = float(saved['n_mass'])
+                contact.tMass = float(saved['t_mass'])
+                contact.bounce = float(saved['bounce'])
+                contact.jnAcc = float(saved['jn_acc'])
+                contact.jtAcc = float(saved['jt_acc'])
+                contact.jBias = float(saved['j_bias'])
+                contact.bias = float(saved['bias'])
+                contact.hash = int(saved['hash'])
+            arbiter.count = count
+            arbiter.contacts = contacts
+            arbiter.swapped = bool(record['swapped'])
+            arbiter.stamp = int(record['stamp'])
+            arbiter.state = int(record['state'])
+            lib.cpSpaceAddCachedArbiter(self.space._space, arbiter)
 
     def is_grounded(self, object_id: int) -> bool:
         return object_id in self.grounded_bodies
 
+    def get_contacts(self, object_id: int) -> List[int]:
+        return list(self.contacts.get(object_id, ()))
+
+    @staticmethod
+    def _query_filter(categories: int) -> pymunk.ShapeFilter:
+        return pymunk.ShapeFilter(mask=categories)
+
+    def cast_segments(self, starts: np.ndarray, ends: np.ndarray,
+                      radius: float = 0.0, categories: int = PhysicsPort.CATEGORY_ALL) -> SegmentHits:
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+        hits = SegmentHits.missed(ends)
+        query_filter = self._query_filter(categories)
+        query = self.space.segment_query_first
+        for index, (start, end) in enumerate(zip(starts.tolist(), hits.points.tolist())):
+            info = query(start, end, radius, query_filter)
+            if info is None:
+                continue
+            hits.ids[index] = self.shape_to_body.get(info.shape, -1)
+            hits.points[index] = info.point
+            hits.normals[index] = info.normal
+            hits.fractions[index] = info.alpha
+        return hits
+
+    def query_boxes(self, boxes: np.ndarray, categories: int = PhysicsPort.CATEGORY_ALL) -> BoxHits:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        query_filter = self._query_filter(categories)
+        ids: List[int] = []
+        offsets = np.zeros(len(boxes) + 1, dtype=np.intp)
+        for index, (x_min, y_min, x_max, y_max) in enumerate(boxes.tolist()):
+            shapes = self.space.bb_query(pymunk.BB(x_min, y_min, x_max, y_max), query_filter)
+            ids.extend(self.shape_to_body[shape] for shape in shapes if shape in self.shape_to_body)
+            offsets[index + 1] = len(ids)
+        return BoxHits(ids=np.array(ids, dtype=np.int64), offsets=offsets)
+
+    def query_nearest(self, points: np.ndarray, max_distance: float,
+                      categories: int = PhysicsPort.CATEGORY_ALL) -> NearestHits:
+        hits = NearestHits.missed(points)
+        query_filter = self._query_filter(categories)
+        query = self.space.point_query_nearest
+        for index, point in enumerate(hits.points.tolist()):
+            info = query(point, max_distance, query_filter)
+            if info is None or info.shape not in self.shape_to_body:
+                continue
+            hits.ids[index] = self.shape_to_body[info.shape]
+            hits.points[index] = info.point
+            hits.distances[index] = info.distance
+        return hits
+
     def update(self, delta_time: float) -> None:
-        steps = max(1, delta_time)
-        dt = delta_time / steps
-    
-        for _ in range(steps):
-            for body_id in self.bodies:
-                body = self.bodies[body_id]
-                if body.body_type == pymunk.Body.DYNAMIC:
-                    if abs(body.velocity.y) > 500:
-                        body.velocity = (body.velocity.x, 500 if body.velocity.y > 0 else -500)
-            
-            self.space.step(dt)
\ No newline at end of file
+        self.accumulator += delta_time
+        steps = 0
+
+        while self.accumulator >= self.fixed_dt and steps < self.max_steps_per_frame:
+            self._step(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+
+        if self.accumulator >= self.fixed_dt:
+            # Limite de passos atingido: descarta o atraso para evitar a espiral da morte
+            self.accumulator = 0.0
+
+        if steps > 0:
+            self.pending_forces.clear()
+
+        self._drain_contact_events()
+        self._refresh_snapshot()
+
+        self.interpolation_alpha = self.accumulator / self.fixed_dt
+
+    def _refresh_snapshot(self) -> None:
+        positions = self.state.positions
+        velocities = self.state.velocities
+        grounded = self.state.grounded
+        stamps = self.state.stamps
+        slots = self.state.slots
+        self.state.version += 1
+        version = self.state.version
+        for body_id, body in self.dynamic_bodies.items():
+            i = slots[body_id]
+            positions[2 * i], positions[2 * i + 1] = body.position
+            velocities[2 * i], velocities[2 * i + 1] = body.velocity
+            grounded[i] = body_id in self.grounded_bodies
+            stamps[i] = version
+
+    def _step(self, dt: float) -> None:
+        previous = self.state.previous_positions
+        slots = self.state.slots
+        for body_id, body in self.dynamic_bodies.items():
+            i = slots[body_id]
+            previous[2 * i], previous[2 * i + 1] = body.position
+
+        substeps = self._required_substeps(dt)
+        substep_dt = dt / substeps
+        for _ in range(substeps):
+            # O pymunk zera as forças a cada step, então elas são reaplicadas
+            for body_id, force in self.pending_forces.items():
+                self.dynamic_bodies[body_id].apply_force_at_local_point(force, (0, 0))
+            self.space.step(substep_dt)
+
+    def _required_substeps(self, dt: float) -> int:
+        """Quantos subpassos o corpo mais rápido precisa para não atravessar um segmento"""
+        if not self.dynamic_bodies or self.min_static_radius == float('inf'):
+            return 1
+
+        max_speed = max(body.velocity.length for body in self.dynamic_bodies.values())
+        gravity_gain = abs(self.space.gravity.y) * dt
+        displacement = (max_speed + gravity_gain) * dt
+        if displacement <= self.min_static_radius:
+            return 1
+        return min(self.max_substeps, math.ceil(displacement / self.min_static_radius))
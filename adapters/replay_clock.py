@@ -0,0 +1,34 @@
+import time
+from typing import override
+
+from domain.input_recording import InputRecording
+from ports.clock_port import ClockPort
+
+
+class ReplayClock(ClockPort):
+    """Relógio que devolve, quadro a quadro, os deltas de uma partida gravada.
+
+    Com realtime, update espera o tempo real de cada quadro, para assistir ao
+    replay na velocidade em que a partida foi jogada.
+    """
+
+    def __init__(self, recording: InputRecording, realtime: bool = False):
+        self.delta_times = recording.delta_times().tolist()
+        self.realtime = realtime
+        self.frame = 0
+        self.frame_start = time.perf_counter()
+
+    @override
+    def get_delta_time(self) -> float:
+        if self.frame < len(self.delta_times):
+            return self.delta_times[self.frame]
+        return 0.0
+
+    @override
+    def update(self):
+        if self.realtime and self.frame < len(self.delta_times):
+            remaining = self.frame_start + self.delta_times[self.frame] - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        self.frame_start = time.perf_counter()
+        self.frame += 1
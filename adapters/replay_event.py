@@ -0,0 +1,26 @@
+from typing import override
+
+from adapters.null_event import NullEvent
+from domain.input_recording import RECORDED_KEYS, InputRecording
+
+# Conjunto de teclas de cada máscara possível
+KEYS_BY_MASK = [
+    {key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit)}
+    for mask in range(1 << len(RECORDED_KEYS))
+]
+
+
+class ReplayEvent(NullEvent):
+    """Entrada que devolve, quadro a quadro, as teclas de uma partida gravada"""
+
+    def __init__(self, recording: InputRecording):
+        super().__init__()
+        self.masks = recording.masks.tolist()
+
+    @override
+    def poll_events(self) -> bool:
+        if self.frame >= len(self.masks):
+            self.pressed = set()
+            return False
+        self.pressed = KEYS_BY_MASK[self.masks[self.frame]]
+        return super().poll_events()
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import pygame
+
+TEXT_CACHE_SIZE = 256
+DIGITS = "0123456789"
+
+
+class TextCache:
+    """Cache LRU das superfícies de texto já rasterizadas.
+
+    A chave é (texto, cor, fonte, antialias). Um texto que termina em
+    número, como "Score: 123", é desenhado como prefixo em cache mais um
+    glifo por dígito, então um placar que muda a cada frame não rasteriza
+    nada; se o mesmo texto aparecer outra vez, ele ganha uma superfície inteira.
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        # None marca um texto numérico visto uma vez, ainda sem superfície própria
+        self.entries: "OrderedDict[tuple, Optional[Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _lookup(self, key: tuple) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def _store(self, key: tuple, entry: Optional[Any]) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+               antialias: bool = True) -> pygame.Surface:
+        """Superfície do texto inteiro, rasterizada só na primeira vez"""
+        key = (text, color, font, antialias)
+        surface = self._lookup(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, antialias, color)
+            self._store(key, surface)
+        return surface
+
+    def digits(self, font: pygame.font.Font, color: Tuple[int, int, int],
+               antialias: bool = True) -> Tuple[List[pygame.Surface], List[int]]:
+        """Glifos de 0 a 9 e suas larguras, guardados como uma entrada só"""
+        key = (None, color, font, antialias)
+        glyphs = self._lookup(key)
+        if glyphs is None:
+            self.misses += 1
+            surfaces = [font.render(digit, antialias, color) for digit in DIGITS]
+            glyphs = (surfaces, [surface.get_width() for surface in surfaces])
+            self._store(key, glyphs)
+        return glyphs
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, text: str, position: Tuple[float, float],
+             color: Tuple[int, int, int], antialias: bool = True) -> None:
+        """Desenha o texto a partir de position, pela superfície inteira ou pelo prefixo mais os dígitos"""
+        key = (text, color, font, antialias)
+        number = len(text) - len(text.rstrip(DIGITS))
+        if number and self.entries.get(key, False) is False:
+            # Primeira vez do texto: fica só marcado e sai do prefixo mais os glifos
+            self._store(key, None)
+            x, y = position
+            blits = []
+            if number < len(text):
+                prefix = self.render(font, text[:-number], color, antialias)
+                blits.append((prefix, (x, y)))
+                x += prefix.get_width()
+            glyphs, widths = self.digits(font, color, antialias)
+            for digit in text[-number:]:
+                index = ord(digit) - 48
+                blits.append((glyphs[index], (x, y)))
+                x += widths[index]
+            screen.blits(blits, False)
+            return
+        screen.blit(self.render(font, text, color, antialias), position)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from adapters.asset_bundle import AssetBundle
+
+# Texturas sem referência continuam em memória até passar deste total
+TEXTURE_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class TextureEntry:
+    surface: pygame.Surface
+    references: int = 0
+    # Recortes da folha de sprites: subsurfaces que dividem os pixels da textura
+    sprites: Dict[Tuple[int, int, int, int], pygame.Surface] = field(default_factory=dict)
+
+    @property
+    def bytes(self) -> int:
+        return self.surface.get_width() * self.surface.get_height() * self.surface.get_bytesize()
+
+
+class TextureCache:
+    """Texturas carregadas uma vez por caminho e compartilhadas por contagem de referências.
+
+    Cada textura é convertida para o formato da tela, com alpha
+    pré-multiplicado, no carregamento, então os blits não convertem pixels.
+    Com um pacote de assets, as folhas empacotadas vêm do atlas sem tocar
+    no disco nem decodificar PNG. Texturas sem referências ficam numa fila
+    LRU e só saem quando o total passa de budget_bytes.
+    """
+
+    def __init__(self, budget_bytes: int = TEXTURE_BUDGET_BYTES, bundle: Optional[AssetBundle] = None):
+        self.budget_bytes = budget_bytes
+        self.bundle = bundle
+        self.entries: "OrderedDict[str, TextureEntry]" = OrderedDict()
+        self.paths: Dict[int, str] = {}  # id da superfície -> caminho, para achar a entrada
+        self.loads = 0
+
+    def acquire(self, path: str) -> Optional[pygame.Surface]:
+        entry = self.entries.get(path)
+        if entry is None:
+            if self.bundle is not None and self.bundle.has_sheet(path):
+                surface = self.bundle.sheet(path)
+            else:
+                surface = pygame.image.load(path)
+                self.loads += 1
+                if pygame.display.get_surface() is not None:
+                    surface = surface.convert_alpha()
+                elif not surface.get_flags() & pygame.SRCALPHA:
+                    opaque, surface = surface, pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+                    surface.blit(opaque, (0, 0))
+                # Mesmo formato das folhas do pacote: os sprites são desenhados com BLEND_PREMULTIPLIED
+                surface = surface.premul_alpha()
+            entry = self.entries[path] = TextureEntry(surface)
+            self.paths[id(surface)] = path
+        entry.references += 1
+        self.entries.move_to_end(path)
+        return entry.surface
+
+    def release(self, path: str) -> None:
+        entry = self.entries.get(path)
+        if entry is not None and entry.references > 0:
+            entry.references -= 1
+            if entry.references == 0:
+                self.evict()
+
+    def entry_of(self, surface: pygame.Surface) -> Optional[TextureEntry]:
+        path = self.paths.get(id(surface))
+        return self.entries.get(path) if path is not None else None
+
+    def sprite(self, texture: pygame.Surface, rect: Tuple[int, int, int, int]) -> pygame.Surface:
+        """Recorte da textura como subsurface, sem copiar pixels; recortes fora dela viram cópia"""
+        entry = self.entry_of(texture)
+        rect = tuple(rect)
+        sprite = entry.sprites.get(rect) if entry is not None else None
+        if sprite is None:
+            if texture.get_rect().contains(rect):
+                sprite = texture.subsurface(rect)
+            else:
+                sprite = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
+                sprite.blit(texture, (0, 0), rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+            if entry is not None:
+                entry.sprites[rect] = sprite
+        return sprite
+
+    def total_bytes(self) -> int:
+        return sum(entry.bytes for entry in self.entries.values())
+
+    def evict(self) -> None:
+        """Descarta as texturas sem referências mais antigas até caber no orçamento"""
+        total = self.total_bytes()
+        for path in list(self.entries):
+            if total <= self.budget_bytes:
+                break
+            entry = self.entries[path]
+            if entry.references == 0:
+                total -= entry.bytes
+                del self.paths[id(entry.surface)]
+                del self.entries[path]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes de pixels de cada textura carregada; os recortes dividem a memória da textura"""
+        return {path: entry.bytes for path, entry in self.entries.items()}
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.paths.clear()
+
+
+# Cache padrão, dividido por todos os PygameTexture que não recebem um próprio
+shared_texture_cache = TextureCache()
@@ -0,0 +1,19 @@
+from typing import override
+from ports.clock_port import ClockPort
+
+class VirtualClock(ClockPort):
+    """Relógio com passo fixo que não espera o tempo real passar"""
+
+    def __init__(self, delta_time: float = 1 / 60):
+        self.delta_time = delta_time
+        self.frame = 0
+        self.elapsed = 0.0
+
+    @override
+    def get_delta_time(self) -> float:
+        return self.delta_time
+
+    @override
+    def update(self):
+        self.frame += 1
+        self.elapsed += self.delta_time
@@ -0,0 +1,89 @@
+"""Compara o tempo de passo do AABBPhysicsAdapter com o PymunkPhysicsAdapter.
+
+Mede primeiro a carga real do jogo: partidas headless com o GapJumperBot,
+um corpo dinâmico e só as plataformas da janela de ativação. Depois mede
+mundos sintéticos com 1000 plataformas ativas e cada vez mais corpos.
+
+Uso: python -m benchmarks.aabb_benchmark
+"""
+import time
+from typing import Callable, Dict, List
+
+from adapters.aabb_physics import AABBPhysicsAdapter
+from adapters.pymunk_physics import BroadphaseConfig, PymunkPhysicsAdapter
+from benchmarks.broadphase_benchmark import measure_step_time, populate_world
+from domain.physics.vector2D import Vector2D
+from ports.physics_port import PhysicsPort
+from simulation.headless import PHYSICS_HZ, build_headless_game, run_policy
+from simulation.policies import GapJumperBot
+
+GRAVITY = Vector2D(0, 98.1)
+PLATFORM_COUNT = 1000
+DYNAMIC_COUNTS = (1, 8, 64, 256)
+GAME_SEEDS = range(5)
+GAME_FRAMES = 1200
+
+ENGINES: Dict[str, Callable[[], PhysicsPort]] = {
+    "pymunk_bbtree": lambda: PymunkPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ),
+    "pymunk_spatial_hash": lambda: PymunkPhysicsAdapter(
+        GRAVITY, physics_hz=PHYSICS_HZ, broadphase=BroadphaseConfig.spatial_hash_for_platforms()
+    ),
+    "aabb": lambda: AABBPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ),
+}
+
+
+def measure_game_frames(factory: Callable[[], PhysicsPort]) -> Dict:
+    """Tempo médio de physics.update por quadro nas partidas headless, e os corpos ativos por quadro"""
+    elapsed = 0.0
+    frames = 0
+    bodies = 0
+    for seed in GAME_SEEDS:
+        physics = factory()
+        game = build_headless_game(seed, physics)
+        step = physics.update
+
+        def timed_update(delta_time: float) -> None:
+            nonlocal elapsed, frames, bodies
+            start = time.perf_counter()
+            step(delta_time)
+            elapsed += time.perf_counter() - start
+            frames += 1
+            bodies += len(physics.snapshot().slots)
+
+        physics.update = timed_update
+        run_policy(game, GapJumperBot(), GAME_FRAMES)
+    return {"frame_us": elapsed / frames * 1e6, "bodies": bodies / frames}
+
+
+def run_game() -> List[Dict]:
+    return [{"engine": name, **measure_game_frames(factory)} for name, factory in ENGINES.items()]
+
+
+def run() -> List[Dict]:
+    results = []
+    for dynamic_count in DYNAMIC_COUNTS:
+        for name, factory in ENGINES.items():
+            physics = factory()
+            populate_world(physics, PLATFORM_COUNT, dynamic_count=dynamic_count)
+            results.append({
+                "engine": name,
+                "dynamic_bodies": dynamic_count,
+                "step_us": measure_step_time(physics) * 1e6,
+            })
+    return results
+
+
+def main():
+    print(f"jogo: {len(GAME_SEEDS)} partidas de até {GAME_FRAMES} quadros, {PHYSICS_HZ} Hz")
+    print(f"{'motor':>20} {'µs/quadro':>10} {'corpos':>7}")
+    for result in run_game():
+        print(f"{result['engine']:>20} {result['frame_us']:>10.1f} {result['bodies']:>7.1f}")
+
+    print(f"\n{PLATFORM_COUNT} plataformas")
+    print(f"{'dinâmicos':>10} {'motor':>20} {'µs/passo':>10}")
+    for result in run():
+        print(f"{result['dynamic_bodies']:>10} {result['engine']:>20} {result['step_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compara o tempo de passo do PymunkPhysicsAdapter entre estratégias de broadphase.
+
+Uso: python -m benchmarks.broadphase_benchmark
+"""
+import random
+import time
+from typing import Dict, List
+
+from adapters.pymunk_physics import BroadphaseConfig, PymunkPhysicsAdapter
+from domain.activation_window import ActivationWindow
+from domain.ground_generator import GroundGenerator
+from domain.physics.vector2D import Vector2D
+from domain.platform_descriptors import KIND_BOTTOM
+from ports.physics_port import PhysicsPort
+
+PLATFORM_COUNTS = (100, 1000, 10000)
+DYNAMIC_BODIES = 8
+WARMUP_STEPS = 30
+MEASURED_STEPS = 300
+
+STRATEGIES: Dict[str, BroadphaseConfig] = {
+    "bbtree": BroadphaseConfig(),
+    "spatial_hash": BroadphaseConfig.spatial_hash_for_platforms(),
+}
+
+
+def build_world(config: BroadphaseConfig, platform_count: int, seed: int = 0) -> PymunkPhysicsAdapter:
+    physics = PymunkPhysicsAdapter(Vector2D(0, 98.1), broadphase=config)
+    populate_world(physics, platform_count, seed)
+    return physics
+
+
+def populate_world(physics: PhysicsPort, platform_count: int, seed: int = 0,
+                   dynamic_count: int = DYNAMIC_BODIES) -> None:
+    random.seed(seed)
+    generator = GroundGenerator(seed)
+    generator.generate_initial_platforms(platform_count // 2)
+    # Todas as plataformas ativas, como se a câmera visse o mundo inteiro
+    ActivationWindow(physics, generator.descriptors).update_band(0, generator.last_platform_end)
+
+    # Caixas dinâmicas espalhadas sobre as plataformas inferiores
+    descriptors = generator.descriptors
+    bottom = [i for i in range(descriptors.first_index, descriptors.end_index)
+              if descriptors.kind[i] == KIND_BOTTOM]
+    for index in random.choices(bottom, k=dynamic_count):
+        x, y, width, _ = descriptors.get(index)
+        physics.create_dynamic_body(Vector2D(x + random.uniform(16, width - 16), y - 64), (32, 32), 50.0)
+
+
+def measure_step_time(physics: PhysicsPort) -> float:
+    for _ in range(WARMUP_STEPS):
+        physics.update(physics.fixed_dt)
+
+    start = time.perf_counter()
+    for _ in range(MEASURED_STEPS):
+        physics.update(physics.fixed_dt)
+    return (time.perf_counter() - start) / MEASURED_STEPS
+
+
+def run() -> List[Dict]:
+    results = []
+    for platform_count in PLATFORM_COUNTS:
+        for name, config in STRATEGIES.items():
+            physics = build_world(config, platform_count)
+            step_time = measure_step_time(physics)
+            results.append({
+                "strategy": name,
+                "platforms": platform_count,
+                "step_us": step_time * 1e6,
+            })
+    return results
+
+
+def main():
+    print(f"{'plataformas':>12} {'estratégia':>14} {'µs/passo':>10}")
+    for result in run():
+        print(f"{result['platforms']:>12} {result['strategy']:>14} {result['step_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Mede a vazão do VectorEnv em env-steps por segundo.
+
+Uso: python -m benchmarks.vector_env_benchmark
+"""
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from simulation.vector_env import VectorEnv
+
+CONFIGS = ((1, 1), (8, 1), (32, 1), (32, 4))  # (mundos, processos)
+MEASURED_STEPS = 200
+
+
+def measure(num_envs: int, workers: int, steps: int = MEASURED_STEPS) -> float:
+    rng = np.random.default_rng(0)
+    with VectorEnv(num_envs, workers=workers, max_frames=3600) as env:
+        env.reset()
+        actions = rng.integers(0, env.action_count, size=(steps, num_envs))
+        start = time.perf_counter()
+        for step_actions in actions:
+            env.step(step_actions)
+        elapsed = time.perf_counter() - start
+    return steps * num_envs / elapsed
+
+
+def run() -> List[Dict]:
+    return [
+        {"envs": envs, "workers": workers, "steps_per_second": measure(envs, workers)}
+        for envs, workers in CONFIGS
+    ]
+
+
+def main():
+    print(f"{'mundos':>7} {'processos':>10} {'env-steps/s':>12}")
+    for result in run():
+        print(f"{result['envs']:>7} {result['workers']:>10} {result['steps_per_second']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
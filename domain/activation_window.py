@@ -0,0 +1,123 @@
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+import numpy as np
+
+from domain.entity.camera import Camera
+from domain.entity.component_store import ComponentStore
+from domain.entity.ground_segment import GroundSegment
+from domain.physics.vector2D import Vector2D
+from domain.platform_descriptors import PlatformDescriptors
+from ports.physics_port import PhysicsPort
+
+ACTIVATION_MARGIN = 300
+
+
+# Recebe (segmentos adicionados, segmentos removidos) a cada mudança da faixa
+WindowListener = Callable[[List[GroundSegment], List[GroundSegment]], None]
+
+
+class ActivationWindow:
+    """Materializa em GroundSegments só as plataformas perto da câmera.
+
+    Plataformas que entram na faixa ganham corpo físico e animação; as que
+    saem são destruídas e voltam a existir apenas como descritores. Os
+    segmentos ativos ficam num deque ordenado por x: a faixa anda para a
+    direita, então os novos entram pela direita e os antigos saem pela
+    esquerda, e cada atualização custa só o número de mudanças.
+    """
+
+    def __init__(self, physics: PhysicsPort, descriptors: PlatformDescriptors,
+                 margin: float = ACTIVATION_MARGIN, store: Optional[ComponentStore] = None):
+        self.physics = physics
+        # Linhas dos segmentos ativos; o GameObjectManager passa o store compartilhado
+        self.store = store if store is not None else ComponentStore()
+        self.descriptors = descriptors
+        self.margin = margin
+        self.start = 0
+        self.end = 0
+        self.segments: Deque[GroundSegment] = deque()
+        self.listeners: List[WindowListener] = []
+
+    def add_listener(self, listener: WindowListener) -> None:
+        self.listeners.append(listener)
+
+    def _notify(self, added: List[GroundSegment], removed: List[GroundSegment]) -> None:
+        if added or removed:
+            for listener in self.listeners:
+                listener(added, removed)
+
+    def _segment(self, index: int, body_id: Optional[int] = None) -> GroundSegment:
+        x, y, width, _ = self.descriptors.get(index)
+        return GroundSegment(
+            physics=self.physics,
+            position=Vector2D(x, y),
+            width=width,
+            body_id=body_id,
+            store=self.store
+        )
+
+    def update(self, camera: Camera) -> Deque[GroundSegment]:
+        """Ajusta a faixa ativa à área visível da câmera mais a margem"""
+        return self.update_band(camera.world_x - self.margin,
+                                camera.world_x + camera.viewport_width + self.margin)
+
+    def update_band(self, min_x: float, max_x: float) -> Deque[GroundSegment]:
+        start, end = self.descriptors.index_range(min_x, max_x)
+        if (start, end) == (self.start, self.end):
+            return self.segments
+
+        segments = self.segments
+        added: List[GroundSegment] = []
+        removed: List[GroundSegment] = []
+        if start >= self.end or end <= self.start:
+            # Faixa nova sem nada em comum com a anterior
+            removed.extend(segments)
+            segments.clear()
+            self.start = self.end = start
+
+        while self.start < start:
+            removed.append(segments.popleft())
+            self.start += 1
+        while self.end > end:
+            removed.append(segments.pop())
+            self.end -= 1
+        # Destrói antes de criar, para os novos corpos reaproveitarem os slots liberados
+        for segment in removed:
+            segment.destroy()
+
+        while self.start > start:
+            self.start -= 1
+            segments.appendleft(self._segment(self.start))
+            added.append(segments[0])
+        while self.end < end:
+            segments.append(self._segment(self.end))
+            added.append(segments[-1])
+            self.end += 1
+
+        self._notify(added, removed)
+        return segments
+
+    def get_state(self) -> np.ndarray:
+        """Pares (índice do descritor, ID do corpo) dos segmentos ativos"""
+        return np.array([(self.start + offset, segment.body_id) for offset, segment in enumerate(self.segments)],
+                        dtype=np.int64).reshape(-1, 2)
+
+    def set_state(self, state: np.ndarray) -> None:
+        """Recria os segmentos ativos presos aos corpos já restaurados na física"""
+        removed = list(self.segments)
+        for segment in removed:
+            segment.release()
+        self.segments.clear()
+        self.segments.extend(self._segment(index, body_id) for index, body_id in state.tolist())
+        self.start, self.end = (int(state[0, 0]), int(state[-1, 0]) + 1) if len(state) else (0, 0)
+        self._notify(list(self.segments), removed)
+
+    def clear(self) -> None:
+        """Esquece os segmentos ativos; os corpos saem com o reset da física"""
+        removed = list(self.segments)
+        for segment in removed:
+            segment.release()
+        self.segments.clear()
+        self.start = self.end = 0
+        self._notify([], removed)
@@ -1,12 +1,24 @@
 from typing import Any, Dict, List, Tuple
 from domain.animation.animation import Animation
+from domain.animation.sprite_sheet import SpriteSheet
 from ports.texture_port import TexturePort
 
+# Variantes de orientação de cada quadro: bit 0 = virado para a esquerda, bit 1 = gravidade invertida
+ORIENTATION_FLIPS = ((False, False), (True, False), (False, True), (True, True))
+
+
+def orientation_index(facing_right: bool, gravity_inverted: bool) -> int:
+    return (not facing_right) | (gravity_inverted << 1)
+
 
 class AnimationController:
     def __init__(self, texture_port: TexturePort):
         self.texture_port = texture_port
         self.animations: Dict[str, Animation] = {}
+        # Quadros já virados, por animação e orientação; trocar de orientação não aloca nada
+        self.variants: Dict[str, List[List[Any]]] = {}
+        # Folhas de sprites obtidas do texture_port, devolvidas em release
+        self.sheet_paths: List[str] = []
         self.current_animation = "idle"
         self.facing_right = True
         self.gravity_inverted = True
@@ -15,6 +27,7 @@ class AnimationController:
                        frame_data: Dict[str, List[Tuple[int, int, int, int]]], 
                        frame_times: Dict[str, float]):
         sprite_sheet = self.texture_port.load_texture(sprite_sheet_path)
+        self.sheet_paths.append(sprite_sheet_path)
         
         for anim_name, frames in frame_data.items():
             sprite_frames = []
@@ -26,22 +39,44 @@ class AnimationController:
                 frames=sprite_frames,
                 frame_time=frame_times[anim_name]
             )
+            self.variants[anim_name] = self.bake_orientations(sprite_frames)
+
+    def load_sheet(self, sheet: SpriteSheet):
+        """Carrega as animações da folha; quadros e tempos vêm sempre do manifesto, só os pixels podem vir do pacote"""
+        self.load_animations(sheet.path, sheet.frames, sheet.frame_times)
+
+    def release(self):
+        """Devolve as folhas de sprites ao texture_port"""
+        for path in self.sheet_paths:
+            self.texture_port.release_texture(path)
+        self.sheet_paths.clear()
+
+    def bake_orientations(self, frames: List[Any]) -> List[List[Any]]:
+        """As quatro orientações de cada quadro, viradas uma vez só no carregamento"""
+        return [frames if (flip_x, flip_y) == (False, False)
+                else [self.texture_port.flip_sprite(frame, flip_x, flip_y) for frame in frames]
+                for flip_x, flip_y in ORIENTATION_FLIPS]
     
-    def set_animation(self, animation_name: str):
+    def set_animation(self, animation_name: str) -> bool:
+        """Troca a animação atual; retorna se ela mudou de fato"""
         if animation_name != self.current_animation and animation_name in self.animations:
             self.current_animation = animation_name
             self.animations[animation_name].current_frame = 0
             self.animations[animation_name].time_accumulated = 0
+            return True
+        return False
+
+    def sprite_at(self, frame: int) -> Any:
+        """Sprite do quadro da animação atual, já virado conforme a direção e a gravidade"""
+        variants = self.variants.get(self.current_animation)
+        if variants is None:
+            return None
+        frames = variants[orientation_index(self.facing_right, self.gravity_inverted)]
+        return frames[frame % len(frames)]
     
     def update(self, delta_time: float) -> Any:
         if self.current_animation in self.animations:
-            sprite = self.animations[self.current_animation].update(delta_time)
-            
-            if not self.facing_right:
-                sprite = self.texture_port.flip_sprite(sprite, True, False)
-                
-            if self.gravity_inverted:
-                sprite = self.texture_port.flip_sprite(sprite, False, True)
-                
-            return sprite
+            animation = self.animations[self.current_animation]
+            animation.update(delta_time)
+            return self.sprite_at(animation.current_frame)
         return None
\ No newline at end of file
@@ -0,0 +1,30 @@
+from domain.animation.sprite_sheet import SpriteSheet
+
+ASSETS_DIR = "domain/animation/assets"
+# Pacote gerado por simulation.bake_assets; sem ele os arquivos soltos são carregados
+ASSET_BUNDLE_PATH = f"{ASSETS_DIR}/assets.aora"
+
+PLAYER_SHEET = SpriteSheet(
+    path=f"{ASSETS_DIR}/personagem.png",
+    frames={
+        "idle": [(0, 0, 32, 32)],  # Apenas um frame para idle
+        "run": [
+            (0, 0, 32, 32),    # Frame 1 da corrida
+            (32, 0, 32, 32),   # Frame 2 da corrida
+            (64, 0, 32, 32),   # Frame 3 da corrida
+            (96, 0, 32, 32)    # Frame 4 da corrida
+        ],
+        "jump": [(0, 32, 32, 32)]  # Frame do pulo
+    },
+    frame_times={
+        "idle": 0.1,
+        "run": 0.08,
+        "jump": 0.1
+    }
+)
+
+JUMP_SOUND_PATH = f"{ASSETS_DIR}/Sound/jump-up.mp3"
+
+# O que o bake empacota: folhas de sprites e efeitos curtos (a música continua em streaming)
+SPRITE_SHEETS = (PLAYER_SHEET,)
+SOUND_EFFECTS = (JUMP_SOUND_PATH,)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+Rect = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class SpriteSheet:
+    """Folha de sprites e as animações recortadas dela: nome -> retângulos dos quadros e tempo por quadro"""
+    path: str
+    frames: Dict[str, List[Rect]]
+    frame_times: Dict[str, float]
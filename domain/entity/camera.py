@@ -1,5 +1,12 @@
+from typing import Optional
 from domain.physics.vector2D import Vector2D
 
+# Causas de morte: por qual lado o player saiu da área da câmera
+DEATH_LEFT_BEHIND = "left_behind"
+DEATH_AHEAD = "ahead"
+DEATH_ABOVE = "above"
+DEATH_BELOW = "below"
+
 class Camera:
     def __init__(self, viewport_width: int, viewport_height: int, world_bounds: tuple):
         self.viewport_width = viewport_width
@@ -35,12 +42,18 @@ class Camera:
         """
         Verifica se uma posição está na zona de morte (muito longe da câmera)
         """
-        min_x = self.world_x - self.death_margin
-        max_x = self.world_x + self.viewport_width + self.death_margin
-        min_y = self.world_y - self.death_margin
-        max_y = self.world_y + self.viewport_height + self.death_margin
-        
-        return (position.x < min_x or 
-                position.x > max_x or 
-                position.y < min_y or 
-                position.y > max_y)
+        return self.death_cause(position) is not None
+
+    def death_cause(self, position: Vector2D) -> Optional[str]:
+        """
+        Lado da zona de morte em que a posição está, ou None fora dela
+        """
+        if position.x < self.world_x - self.death_margin:
+            return DEATH_LEFT_BEHIND
+        if position.x > self.world_x + self.viewport_width + self.death_margin:
+            return DEATH_AHEAD
+        if position.y < self.world_y - self.death_margin:
+            return DEATH_ABOVE
+        if position.y > self.world_y + self.viewport_height + self.death_margin:
+            return DEATH_BELOW
+        return None
@@ -0,0 +1,139 @@
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from domain.entity.camera import Camera
+from domain.physics.physics_snapshot import PhysicsSnapshot
+
+KIND_PLAYER = 0
+KIND_GROUND = 1
+
+FLAG_STATIC = 1 << 0
+# Entidade com AnimationController: desenhada pelo próprio objeto, não como retângulo
+FLAG_ANIMATED = 1 << 1
+
+COLUMNS = (
+    ('alive', np.bool_),
+    ('slot', np.int64),        # slot do corpo no PhysicsSnapshot
+    ('body_id', np.int64),
+    ('width', np.float64),
+    ('height', np.float64),
+    ('kind', np.int8),
+    ('flags', np.uint8),
+    ('frame', np.int32),       # quadro atual da animação
+    ('frame_elapsed', np.float64),
+    ('frame_time', np.float64),
+    ('frame_count', np.int32),
+)
+
+
+class ComponentStore:
+    """Dados das entidades guardados em colunas, indexados pela entidade.
+
+    GameObjects são só views sobre uma linha do store; os sistemas por frame
+    (animação, interpolação, culling) rodam vetorizados sobre as colunas em
+    vez de chamar um método por objeto. Linhas liberadas são reaproveitadas,
+    então os índices ficam compactos mesmo com entidades entrando e saindo.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.count = 0  # linhas já usadas alguma vez; as vivas estão em alive[:count]
+        self.free_rows: List[int] = []
+        self.objects: List[Optional[Any]] = []
+        for name, dtype in COLUMNS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return self.count - len(self.free_rows)
+
+    def _grow(self, capacity: int) -> None:
+        for name, dtype in COLUMNS:
+            resized = np.zeros(capacity, dtype=dtype)
+            resized[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, resized)
+        self.objects.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def create(self, view: Any, body_id: int, slot: int, size: Tuple[float, float],
+               kind: int, flags: int = 0) -> int:
+        """Reserva uma linha para a entidade e retorna o seu índice"""
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow(2 * self.capacity)
+            row = self.count
+            self.count += 1
+        self.alive[row] = True
+        self.slot[row] = slot
+        self.body_id[row] = body_id
+        self.width[row], self.height[row] = size
+        self.kind[row] = kind
+        self.flags[row] = flags
+        self.frame[row] = 0
+        self.frame_elapsed[row] = 0.0
+        self.frame_time[row] = 0.0
+        self.frame_count[row] = 0
+        self.objects[row] = view
+        return row
+
+    def release(self, row: int) -> None:
+        if self.alive[row]:
+            self.alive[row] = False
+            self.objects[row] = None
+            self.free_rows.append(row)
+
+    def clear(self) -> None:
+        self.alive[:self.count] = False
+        self.objects[:self.count] = [None] * self.count
+        self.free_rows.clear()
+        self.count = 0
+
+    def set_animation(self, row: int, frame_time: float, frame_count: int) -> None:
+        """Troca a animação da entidade, voltando ao primeiro quadro"""
+        self.frame[row] = 0
+        self.frame_elapsed[row] = 0.0
+        self.frame_time[row] = frame_time
+        self.frame_count[row] = frame_count
+
+    def advance_animations(self, delta_time: float) -> None:
+        """Avança o quadro de todas as animações de uma vez, com a mesma regra de Animation.update"""
+        count = self.count
+        animated = self.alive[:count] & (self.frame_count[:count] > 0)
+        elapsed = self.frame_elapsed[:count]
+        elapsed[animated] += delta_time
+        wrapped = animated & (elapsed >= self.frame_time[:count])
+        elapsed[wrapped] = 0.0
+        frames = self.frame[:count]
+        frames[wrapped] = (frames[wrapped] + 1) % self.frame_count[:count][wrapped]
+
+    def positions(self, snapshot: PhysicsSnapshot, alpha: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Posições (x, y) de todas as linhas, interpoladas como GameObject.interpolated_position.
+
+        As views sobre os arrays do snapshot são feitas a cada chamada e
+        descartadas em seguida: guardá-las impediria o snapshot de crescer.
+        """
+        count = self.count
+        slots = np.where(self.alive[:count], self.slot[:count], 0)
+        current = np.frombuffer(snapshot.positions, dtype=np.float64).reshape(-1, 2)[slots]
+        if alpha >= 1.0:
+            return current[:, 0], current[:, 1]
+        previous = np.frombuffer(snapshot.previous_positions, dtype=np.float64).reshape(-1, 2)[slots]
+        moving = (self.flags[:count] & FLAG_STATIC) == 0
+        interpolated = previous + (current - previous) * alpha
+        current[moving] = interpolated[moving]
+        return current[:, 0], current[:, 1]
+
+    def visible(self, snapshot: PhysicsSnapshot, camera: Camera,
+                alpha: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Linhas vivas dentro da câmera, com a posição já em coordenadas de tela"""
+        x, y = self.positions(snapshot, alpha)
+        count = self.count
+        width, height = self.width[:count], self.height[:count]
+        inside = (self.alive[:count] &
+                  (x + width >= camera.world_x) & (x <= camera.world_x + camera.viewport_width) &
+                  (y + height >= camera.world_y) & (y <= camera.world_y + camera.viewport_height))
+        rows = np.flatnonzero(inside)
+        return rows, x[rows] - camera.world_x, y[rows] - camera.world_y
@@ -1,40 +1,98 @@
-from typing import List, Tuple
+from typing import Optional, Tuple
 from domain.animation.animation_controller import AnimationController
-from domain.physics.vector2D import Vector2D
+from domain.entity.component_store import FLAG_ANIMATED, FLAG_STATIC, ComponentStore
+from domain.physics.vector2D import FrozenVector2D, Vector2D
 from ports.physics_port import PhysicsPort
 from ports.renderer_port import RendererPort
 from ports.texture_port import TexturePort
 
 class GameObject:
+    """View sobre uma linha do ComponentStore, com o corpo físico correspondente.
+
+    Tamanho, tipo, flags e quadro de animação ficam nas colunas do store;
+    o objeto só guarda o índice da linha e o que é exclusivo dele.
+    """
+
     def __init__(self, 
                  physics: PhysicsPort,
                  position: Vector2D, 
                  size: Tuple[int, int], 
                  mass: float = 1.0,
                  texture_port: TexturePort = None,
-                 sprite_path: str = None):
-        self.size = size
+                 sprite_path: str = None,
+                 body_id: int = None,
+                 store: Optional[ComponentStore] = None,
+                 kind: int = 0):
         self.sprite = None
-        self.animator = AnimationController(texture_port)
+        # Só entidades animadas ganham AnimationController
+        self.animator: Optional[AnimationController] = None
         self.current_animation = "idle"
 
-        if mass == float('inf'):
+        if body_id is not None:
+            # Corpo já existente, como os recriados por PhysicsPort.restore_state
+            self.body_id = body_id
+        elif mass == float('inf'):
             self.body_id = physics.create_static_body(position, size)
         else:
             self.body_id = physics.create_dynamic_body(position, size, mass)
         self.physics = physics
+
+        # Leitura por índice no snapshot da física; o vetor só é refeito
+        # quando o slot do corpo é reescrito, e é somente leitura porque
+        # todos os leitores do frame recebem a mesma instância
+        self.snapshot = physics.snapshot()
+        self.slot = self.snapshot.slot_of(self.body_id)
+        # Objetos soltos, fora de um GameObjectManager, ficam num store só deles
+        self.store = store if store is not None else ComponentStore(capacity=1)
+        self.entity = self.store.create(self, self.body_id, self.slot, size, kind,
+                                        FLAG_STATIC if mass == float('inf') else 0)
+        self._position_stamp = -1
+        self._velocity_stamp = -1
+        self._position = None
+        self._velocity = None
+
+    @property
+    def size(self) -> Tuple[float, float]:
+        return float(self.store.width[self.entity]), float(self.store.height[self.entity])
+
+    @property
+    def is_static(self) -> bool:
+        return bool(self.store.flags[self.entity] & FLAG_STATIC)
+
+    def set_animator(self, animator: AnimationController):
+        """Liga um AnimationController já carregado à entidade; o quadro passa a andar no store"""
+        self.animator = animator
+        self.store.flags[self.entity] |= FLAG_ANIMATED
+        animation = animator.animations.get(animator.current_animation)
+        if animation is not None:
+            self.store.set_animation(self.entity, animation.frame_time, len(animation.frames))
         
     @property
     def position(self) -> Vector2D:
-        return self.physics.get_position(self.body_id)
+        stamp = self.snapshot.stamps[self.slot]
+        if self._position_stamp != stamp:
+            i = 2 * self.slot
+            self._position = FrozenVector2D(self.snapshot.positions[i], self.snapshot.positions[i + 1])
+            self._position_stamp = stamp
+        return self._position
     
     @position.setter
     def position(self, value: Vector2D):
         self.physics.set_position(self.body_id, value)
+
+    def interpolated_position(self, alpha: float) -> Vector2D:
+        if alpha >= 1.0 or self.is_static:
+            return self.position
+        return self.snapshot.get_interpolated_position(self.slot, alpha)
         
     @property
     def velocity(self) -> Vector2D:
-        return self.physics.get_velocity(self.body_id)
+        stamp = self.snapshot.stamps[self.slot]
+        if self._velocity_stamp != stamp:
+            i = 2 * self.slot
+            self._velocity = FrozenVector2D(self.snapshot.velocities[i], self.snapshot.velocities[i + 1])
+            self._velocity_stamp = stamp
+        return self._velocity
     
     @velocity.setter
     def velocity(self, value: Vector2D):
@@ -45,15 +103,25 @@ class GameObject:
         
     @property
     def is_grounded(self) -> bool:
-        return self.physics.is_grounded(self.body_id)
+        return self.snapshot.is_grounded(self.slot)
     
     def update(self, delta_time: float):
         pass
+
+    def destroy(self):
+        self.physics.destroy_body(self.body_id)
+        self.release()
+
+    def release(self):
+        """Libera a linha do store sem mexer no corpo, para quando a física já foi reiniciada"""
+        self.store.release(self.entity)
     
     def set_animation(self, animation_name: str):
         if self.current_animation != animation_name:
             self.current_animation = animation_name
-            self.animator.set_animation(animation_name)
+            if self.animator.set_animation(animation_name):
+                animation = self.animator.animations[animation_name]
+                self.store.set_animation(self.entity, animation.frame_time, len(animation.frames))
 
         
     def render(self, renderer: RendererPort):
@@ -63,8 +131,10 @@ class GameObject:
             renderer.draw_rect(self.position, self.size, (255, 0, 0))
 
     def render_at_position(self, renderer: RendererPort, screen_pos: Vector2D, delta_time: float):
-    
-        current_sprite = self.animator.update(delta_time)
+        """Desenha no quadro guardado no store; quem avança os quadros é ComponentStore.advance_animations"""
+        current_sprite = None
+        if self.animator is not None:
+            current_sprite = self.animator.sprite_at(int(self.store.frame[self.entity]))
         if current_sprite:
             renderer.draw_sprite(current_sprite, screen_pos)
         else:
@@ -1,33 +1,48 @@
+from typing import Optional
+
 from domain.animation.animation_controller import AnimationController
+from domain.animation.asset_manifest import JUMP_SOUND_PATH, PLAYER_SHEET
+from domain.entity.component_store import KIND_PLAYER, ComponentStore
 from domain.entity.game_object import GameObject
 from domain.physics.vector2D import Vector2D
 from ports.event_port import EventPort
+from ports.mixer_port import MixerPort
 from ports.physics_port import PhysicsPort
 import time
-import pygame
 
 from ports.texture_port import TexturePort
 
+# Física do player; a análise de alcance dos vãos usa os mesmos valores
+PLAYER_SIZE = (32, 32)
+PLAYER_MASS = 50.0
+PLAYER_MOVE_FORCE = 3000.0
+
 
 class Player(GameObject):
-    def __init__(self, physics: PhysicsPort, position: Vector2D, texture_port: TexturePort):
+    def __init__(self, physics: PhysicsPort, position: Vector2D, texture_port: TexturePort,
+                 mixer: MixerPort = None, body_id: int = None, store: Optional[ComponentStore] = None):
         super().__init__(
             physics=physics,
             position=position,
-            size=(32, 32),
-            mass=50.0,
+            size=PLAYER_SIZE,
+            mass=PLAYER_MASS,
+            body_id=body_id,
+            store=store,
+            kind=KIND_PLAYER
         )
         
 
-        self.move_force = 3000.0
+        self.move_force = PLAYER_MOVE_FORCE
         self.jump_force = 2000.0
         self.can_toggle_gravity = True
         self.jump_delay = 0.5 
         self.jump_timer = 0
         self.gravity_inverted = False
         self.movement_threshold = 10 
+        self.mixer = mixer
         self.animator = AnimationController(texture_port)
         self.setup_animations()
+        self.set_animator(self.animator)
         
     def update(self, delta_time: float):
         super().update(delta_time)
@@ -53,32 +68,15 @@ class Player(GameObject):
                 self.set_animation("fall")
         
     def setup_animations(self):
-        frame_data = {
-            "idle": [(0, 0, 32, 32)],  # Apenas um frame para idle
-            "run": [
-                (0, 0, 32, 32),    # Frame 1 da corrida
-                (32, 0, 32, 32),   # Frame 2 da corrida
-                (64, 0, 32, 32),   # Frame 3 da corrida
-                (96, 0, 32, 32)    # Frame 4 da corrida
-            ],
-            "jump": [(0, 32, 32, 32)]  # Frame do pulo
-        }
-        
-        frame_times = {
-            "idle": 0.1,
-            "run": 0.08,
-            "jump": 0.1
-        }
-        
         try:
-            self.animator.load_animations(
-                "domain/animation/assets/personagem.png",
-                frame_data,
-                frame_times
-            )
+            self.animator.load_sheet(PLAYER_SHEET)
         except Exception as e:
             print(f"Erro ao carregar animações: {e}")
     
+    def release(self):
+        super().release()
+        self.animator.release()
+
     def move_right(self):
         self.apply_force(Vector2D(self.move_force, 0))
         
@@ -94,6 +92,15 @@ class Player(GameObject):
                 self.can_toggle_gravity = False
                 self.play_engine_sound()
 
+    def get_state(self) -> tuple:
+        """Estado do player fora da física, para salvar junto com o mundo"""
+        return (self.gravity_inverted, self.can_toggle_gravity, self.jump_timer,
+                self.animator.facing_right, self.animator.gravity_inverted)
+
+    def set_state(self, state: tuple):
+        (self.gravity_inverted, self.can_toggle_gravity, self.jump_timer,
+         self.animator.facing_right, self.animator.gravity_inverted) = state
+
     def handle_input(self, event_handler: EventPort):
         if event_handler.is_key_pressed("left"):
             self.move_left()
@@ -103,11 +110,9 @@ class Player(GameObject):
             self.jump()
 
 
-    @staticmethod
-    def play_engine_sound():
-        engine = pygame.mixer.Sound(('domain/animation/assets/Sound/jump-up.mp3'))
-        engine.set_volume(0.2)
-        pygame.mixer.Sound.play(engine)
+    def play_engine_sound(self):
+        if self.mixer:
+            self.mixer.play_sound(JUMP_SOUND_PATH, 0.2)
 
     
 
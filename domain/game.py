@@ -3,21 +3,31 @@ from domain.game_object import GameObjectManager
 from domain.game_renderer import GameRenderer
 from domain.game_state import GameState
 from domain.game_state_manager import GameStateManager
+from domain.ghost_trajectory import GHOST_EXTENSION, GhostRecorder, animation_state, load_ghosts
 from domain.input_handler import InputHandler
+from domain.input_recording import InputRecorder, state_checksum
 from domain.menu import Menu
 from domain.name_input_manager import NameInputManager
+from domain.physics.state_blob import pack_arrays, unpack_arrays
 from domain.score_manager import ScoreManager
 from domain.score_tracker import ScoreTracker
+from domain.simulation_report import SimulationReport
 from ports.clock_port import ClockPort
 from ports.event_port import EventPort
+from ports.mixer_port import MixerPort
 from ports.physics_port import PhysicsPort
 from ports.renderer_port import RendererPort
 from ports.texture_port import TexturePort
-import pygame
+from typing import Optional
+import os
+import time
+import numpy as np
 
 WORLD_BOUNDS = (0, 0, 5000, float('inf'))
 SCORES_FILE = "scores.txt"
 MAX_NAME_LENGTH = 20
+MUSIC_PATH = 'domain/animation/assets/Sound/music.mp3'
+BEST_GHOST = "best" + GHOST_EXTENSION
 
 
 class Game:
@@ -26,23 +36,42 @@ class Game:
                  event_handler: EventPort, 
                  clock: ClockPort,
                  physics: PhysicsPort,
-                 texture_port: TexturePort
+                 texture_port: TexturePort,
+                 mixer: MixerPort,
+                 seed: int = None,
+                 recorder: Optional[InputRecorder] = None,
+                 ghost_dir: Optional[str] = None,
+                 background_generation: bool = False,
+                 level_path: Optional[str] = None
                  ):
         self.clock = clock
+        self.mixer = mixer
         self.physics = physics
         self.renderer = renderer
         self.event_handler = event_handler
         self.state_manager = GameStateManager()
-        self.object_manager = GameObjectManager(physics, texture_port)
+        self.camera = Camera(800, 600, WORLD_BOUNDS)
+        self.object_manager = GameObjectManager(physics, texture_port, self.camera, mixer, seed,
+                                                background_generation, level_path)
         self.input_handler = InputHandler(event_handler)
         self.game_renderer = GameRenderer(renderer)
         self.score_manager = ScoreManager(SCORES_FILE)
         self.name_input = NameInputManager(MAX_NAME_LENGTH)
         self.score_tracker = ScoreTracker()
+        # Mundo logo após o início da partida, usado para reiniciar sem reconstruir tudo
+        self.start_snapshot = None
+        self.death_cause = None
+        # Semente da partida atual e gravação opcional das teclas de cada quadro
+        self.run_seed = None
+        self.recorder = recorder
+        # Fantasmas das melhores partidas, desenhados junto com o player
+        self.ghost_dir = ghost_dir
+        self.ghosts = []
+        self.ghost_recorder = GhostRecorder()
+        self.run_time = 0.0
 
         
         
-        self.camera = Camera(800, 600, WORLD_BOUNDS)
         self.menu = self.create_menu()
         self.pause_menu = self.create_pause_menu()
         
@@ -59,8 +88,20 @@ class Game:
         self.state_manager.change_state(GameState.PLAYING)
 
     def restart_game(self):
-        self.reset_game()
-        self.start_game()
+        if self.start_snapshot is None:
+            self.reset_game()
+            self.start_game()
+            return
+        self.finish_recording()
+        self.restore_run(self.start_snapshot)
+        self.input_handler.last_mask = 0
+        self.state_manager.change_state(GameState.PLAYING)
+        if self.recorder is not None:
+            # O snapshot restaura o mundo exatamente como start_game(run_seed) o
+            # deixou, então o replay da nova gravação parte de uma partida nova
+            self.recorder.start(self.run_seed)
+        self.start_ghosts()
+        self.play_music()
 
     def exit_to_menu(self):
         self.reset_game()
@@ -81,31 +122,119 @@ class Game:
         elif current_state == GameState.PAUSED:
             self.state_manager.change_state(GameState.PLAYING)
 
-    def start_game(self):
+    def start_game(self, seed: Optional[int] = None):
         self.state_manager.change_state(GameState.PLAYING)
         self.score_tracker.reset()
+        self.run_seed = self.object_manager.ground_generator.reseed(seed)
         initial_position = self.object_manager.initialize_objects()
         self.score_tracker.initialize_position(initial_position)
-        pygame.mixer.music.load('domain/animation/assets/Sound/music.mp3')
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play()
+        self.start_snapshot = self.save_run()
+        self.input_handler.last_mask = 0
+        if self.recorder is not None:
+            self.recorder.start(self.run_seed)
+        self.start_ghosts()
+        self.play_music()
+
+    def start_ghosts(self):
+        self.run_time = 0.0
+        self.ghost_recorder.clear()
+        if self.ghost_dir is not None and os.path.isdir(self.ghost_dir):
+            self.close_ghosts()
+            self.ghosts = load_ghosts(self.ghost_dir)
+
+    def close_ghosts(self):
+        for ghost in self.ghosts:
+            ghost.close()
+        self.ghosts = []
+
+    def save_ghost(self):
+        """Guarda a trajetória da partida se ela superou o melhor fantasma salvo"""
+        if self.ghost_dir is None:
+            return
+        score = self.score_tracker.get_score()
+        path = os.path.join(self.ghost_dir, BEST_GHOST)
+        best = next((ghost for ghost in self.ghosts if ghost.score >= score), None)
+        if best is None:
+            os.makedirs(self.ghost_dir, exist_ok=True)
+            # O fantasma antigo ainda mapeia o arquivo, e no Windows isso impede o os.replace
+            kept = []
+            for ghost in self.ghosts:
+                if ghost.path is not None and os.path.abspath(ghost.path) == os.path.abspath(path):
+                    ghost.close()
+                else:
+                    kept.append(ghost)
+            self.ghosts = kept
+            self.ghost_recorder.to_trajectory(score).save(path)
+
+    def state_checksum(self) -> bytes:
+        """Checksum do estado da partida, comparado ao final de um replay"""
+        player = self.object_manager.get_player()
+        body = (player.position.x, player.position.y, player.velocity.x, player.velocity.y) if player else (0.0,) * 4
+        return state_checksum(
+            *body,
+            self.score_tracker.get_score(),
+            self.object_manager.ground_generator.last_platform_end
+        )
+
+    def finish_recording(self):
+        if self.recorder is not None and self.recorder.active:
+            self.recorder.stop(self.score_tracker.get_score(), self.state_checksum())
+
+    def play_music(self):
+        self.mixer.play_music(MUSIC_PATH, 0.1)
+
+    def save_run(self) -> bytes:
+        """Blob com o mundo e a pontuação da partida atual"""
+        score, furthest_right = self.score_tracker.get_state()
+        return pack_arrays(
+            world=np.frombuffer(self.object_manager.save_state(), dtype=np.uint8),
+            score=np.array([score, np.nan if furthest_right is None else furthest_right])
+        )
+
+    def restore_run(self, blob: bytes):
+        state = unpack_arrays(blob)
+        self.object_manager.restore_state(state['world'].tobytes())
+        score, furthest_right = state['score'].tolist()
+        self.score_tracker.set_state((int(score), None if np.isnan(furthest_right) else furthest_right))
+        player = self.object_manager.get_player()
+        self.camera.follow(player.position)
+
+    def suspend(self, path: str):
+        """Grava a partida em disco para continuar depois com resume"""
+        with open(path, 'wb') as file:
+            file.write(self.save_run())
+
+    def resume(self, path: str):
+        with open(path, 'rb') as file:
+            self.restore_run(file.read())
+        self.state_manager.change_state(GameState.PAUSED)
 
     def check_player_in_bounds(self):
         player = self.object_manager.get_player()
-        if player and self.camera.is_in_death_zone(player.position):
+        if not player:
+            return
+        self.death_cause = self.camera.death_cause(player.position)
+        if self.death_cause is not None:
             self.state_manager.change_state(GameState.GAME_OVER)
+            self.finish_recording()
+            self.save_ghost()
             self.name_input.start_input()
 
     def handle_input(self):
         current_state = self.state_manager.get_current_state()
+        # Só handle_game_input, que aplica as teclas ao player, preenche a máscara;
+        # nos outros quadros (início da partida, saída da pausa) grava-se 0
+        self.input_handler.last_mask = 0
         
         if current_state == GameState.MENU:
             self.input_handler.handle_menu_input(self.menu)
             
         elif current_state == GameState.PLAYING:
-            self.input_handler.handle_game_input(self.object_manager.get_player())
-            if self.input_handler.check_pause_input():  # Allow unpausing
+            # O quadro que pausa não chega a update, então não aplica teclas que ficariam fora da gravação
+            if self.input_handler.check_pause_input():
                 self.toggle_pause()
+            else:
+                self.input_handler.handle_game_input(self.object_manager.get_player())
             
         elif current_state == GameState.PAUSED:
             self.input_handler.handle_menu_input(self.pause_menu)
@@ -119,6 +248,11 @@ class Game:
 
     def update(self, delta_time):
         if self.state_manager.is_playing():
+            if self.recorder is not None:
+                # O quadro usa o delta quantizado que foi gravado, o mesmo que o replay vai usar
+                delta_time = self.recorder.record(self.input_handler.last_mask, delta_time)
+            self.record_ghost_sample()
+            self.run_time += delta_time
             self.physics.update(delta_time)
             self.object_manager.update(delta_time)
             
@@ -128,6 +262,13 @@ class Game:
                 self.score_tracker.update_score(player.position)
                 self.check_player_in_bounds()
 
+    def record_ghost_sample(self):
+        player = self.object_manager.get_player()
+        if player:
+            animator = player.animator
+            state = animation_state(animator.current_animation, animator.facing_right, animator.gravity_inverted)
+            self.ghost_recorder.record(self.run_time, player.position, state)
+
     def render(self, delta_time):
         current_state = self.state_manager.get_current_state()
     
@@ -135,19 +276,29 @@ class Game:
             self.game_renderer.render_menu(self.menu, self.score_manager.get_top_scores(5))
         
         elif current_state == GameState.PLAYING:
+            alpha = self.physics.get_interpolation_alpha()
+            self.follow_player_interpolated(alpha)
             self.game_renderer.render_game(
-            self.object_manager.get_objects(),
+            self.object_manager.store,
+            self.physics.snapshot(),
             self.camera,
             self.score_tracker.get_score(),
-            delta_time
+            delta_time,
+            alpha,
+            self.ghosts,
+            self.run_time
         )
         
         elif current_state == GameState.PAUSED:
             self.game_renderer.render_game(
-            self.object_manager.get_objects(),
+            self.object_manager.store,
+            self.physics.snapshot(),
             self.camera,
             self.score_tracker.get_score(),
-            delta_time
+            delta_time,
+            self.physics.get_interpolation_alpha(),
+            self.ghosts,
+            self.run_time
         )
             self.game_renderer.render_pause_menu(self.pause_menu)
         
@@ -159,6 +310,12 @@ class Game:
         
         self.game_renderer.present()
 
+    def follow_player_interpolated(self, alpha: float):
+        # A câmera acompanha a posição desenhada para o player não tremer na tela
+        player = self.object_manager.get_player()
+        if player:
+            self.camera.follow(player.interpolated_position(alpha))
+
     def process_text_input(self, char: str, is_backspace: bool, is_return: bool):
         if self.name_input.process_input(char, is_backspace, is_return):
             self.score_manager.save_score(
@@ -172,15 +329,11 @@ class Game:
 
    
     def reset_game(self):
+        self.finish_recording()
+        self.start_snapshot = None
         self.object_manager.clear()
         self.score_tracker.reset()
-        if hasattr(self.physics, 'space'):
-            self.physics.space.remove(*self.physics.space.bodies)
-            self.physics.space.remove(*self.physics.space.shapes)
-        self.physics.bodies.clear()
-        self.physics.shapes.clear()
-        self.physics.next_id = 0
-        self.physics.grounded_bodies.clear()
+        self.physics.reset()
 
 
     def run(self):
@@ -198,10 +351,51 @@ class Game:
             self.render(delta_time)
             self.clock.update()
             
+        self.finish_recording()
+        self.object_manager.close()
         if hasattr(self.physics, 'cleanup'):
             self.physics.cleanup()
         self.event_handler.quit()
 
+    def simulate(self, frames: int, input_source: EventPort = None, render: bool = False) -> SimulationReport:
+        """Roda até frames quadros de partida sem limitar o FPS, parando no game over.
+
+        Cada quadro usa o delta do clock configurado, então com um VirtualClock
+        o resultado independe da velocidade da máquina.
+        """
+        if input_source is not None:
+            self.event_handler = input_source
+            self.input_handler = InputHandler(input_source)
+        if not self.state_manager.is_playing():
+            self.start_game()
+
+        simulated = 0
+        simulated_time = 0.0
+        start = time.perf_counter()
+        while simulated < frames and self.state_manager.is_playing():
+            delta_time = self.clock.get_delta_time()
+            if not self.event_handler.poll_events():
+                break
+            self.handle_input()
+            self.update(delta_time)
+            if render:
+                self.render(delta_time)
+            self.clock.update()
+            simulated += 1
+            simulated_time += delta_time
+        wall_time = time.perf_counter() - start
+
+        player = self.object_manager.get_player()
+        return SimulationReport(
+            frames=simulated,
+            wall_time=wall_time,
+            simulated_time=simulated_time,
+            score=self.score_tracker.get_score(),
+            distance=player.position.x if player else 0.0,
+            game_over=self.state_manager.is_game_over(),
+            death_cause=self.death_cause
+        )
+
     def show_options(self):
         pass
 
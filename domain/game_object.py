@@ -1,50 +1,127 @@
-from typing import List
+from itertools import chain
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from domain.activation_window import ActivationWindow
+from domain.entity.camera import Camera
+from domain.entity.component_store import ComponentStore
 from domain.entity.game_object import GameObject
-from domain.entity.ground_segment import GroundSegment
 from domain.entity.player import Player
 from domain.ground_generator import GroundGenerator
+from domain.level_file import LevelFileSource
+from domain.physics.state_blob import pack_arrays, unpack_arrays
 from domain.physics.vector2D import Vector2D
+from ports.mixer_port import MixerPort
 from ports.physics_port import PhysicsPort
 from ports.texture_port import TexturePort
 
 
 class GameObjectManager:
-    def __init__(self, physics: PhysicsPort, texture_port: TexturePort):
+    def __init__(self, physics: PhysicsPort, texture_port: TexturePort, camera: Camera, mixer: MixerPort,
+                 seed: Optional[int] = None, background_generation: bool = False,
+                 level_path: Optional[str] = None):
         self.physics = physics
         self.texture_port = texture_port
-        self.game_objects: List[GameObject] = []
+        self.mixer = mixer
+        self.camera = camera
         self.player = None
-        self.ground_generator = GroundGenerator(physics)
+        # Colunas de todas as entidades; player e segmentos são views sobre elas
+        self.store = ComponentStore()
+        # Só os objetos que sobrescrevem update; mantida pelas notificações da janela
+        self.updating: List[GameObject] = []
+        # Com um arquivo de nível as plataformas vêm dele; senão o nível é gerado sem fim
+        self.ground_generator = (LevelFileSource(level_path) if level_path is not None
+                                 else GroundGenerator(seed, background=background_generation))
+        self.activation_window = ActivationWindow(physics, self.ground_generator.descriptors,
+                                                  store=self.store)
+        self.activation_window.add_listener(self._on_window_change)
+
+    def _on_window_change(self, added: List[GameObject], removed: List[GameObject]):
+        # Segmentos sem update próprio (os GroundSegments atuais) não entram na lista
+        removed = [obj for obj in removed if type(obj).update is not GameObject.update]
+        if removed:
+            self.updating = [obj for obj in self.updating if obj not in removed]
+        self.updating.extend(obj for obj in added if type(obj).update is not GameObject.update)
         
     def initialize_objects(self):
         self.player = Player(
             physics=self.physics,
             position=Vector2D(200, 400),
-            texture_port=self.texture_port
+            texture_port=self.texture_port,
+            mixer=self.mixer,
+            store=self.store
         )
         
-        ground_segments = self.ground_generator.generate_initial_platforms()
-        
-        self.game_objects = [self.player] + ground_segments
+        self.ground_generator.generate_initial_platforms()
+        self.ground_generator.update(self.player.position.x)
+        self.camera.follow(self.player.position)
+        self.activation_window.update(self.camera)
+        self.updating.insert(0, self.player)
         
         return self.player.position
         
     def update(self, delta_time: float):
         if self.player:
-            current_segments = self.ground_generator.update(self.player.position.x)
-            
-            self.game_objects = [self.player] + current_segments
-            
-        for obj in self.game_objects:
+            self.ground_generator.update(self.player.position.x)
+            # A janela só mexe nos segmentos que entraram ou saíram da faixa
+            self.activation_window.update(self.camera)
+
+        for obj in self.updating:
             obj.update(delta_time)
             
+    def save_state(self) -> bytes:
+        """Serializa física, gerador, segmentos ativos e player num blob"""
+        return pack_arrays(
+            physics=np.frombuffer(self.physics.save_state(), dtype=np.uint8),
+            window=self.activation_window.get_state(),
+            player=np.array([self.player.body_id, *self.player.get_state()], dtype=np.float64),
+            **self.ground_generator.get_state()
+        )
+
+    def restore_state(self, blob: bytes):
+        """Restaura o mundo salvo em save_state, reaproveitando o player já carregado"""
+        state = unpack_arrays(blob)
+        self.physics.restore_state(state['physics'].tobytes())
+        self.ground_generator.set_state(state)
+        self.activation_window.set_state(state['window'])
+
+        player_id, *player_state = state['player'].tolist()
+        if self.player is None or self.player.body_id != int(player_id):
+            if self.player is not None:
+                self.player.release()
+            self.player = Player(
+                physics=self.physics,
+                position=self.physics.get_position(int(player_id)),
+                texture_port=self.texture_port,
+                mixer=self.mixer,
+                body_id=int(player_id),
+                store=self.store
+            )
+            self.updating = [obj for obj in self.updating if not isinstance(obj, Player)]
+            self.updating.insert(0, self.player)
+        gravity_inverted, can_toggle, jump_timer, facing_right, sprite_inverted = player_state
+        self.player.set_state((bool(gravity_inverted), bool(can_toggle), jump_timer,
+                               bool(facing_right), bool(sprite_inverted)))
+
     def clear(self):
-        self.game_objects.clear()
+        if self.player is not None:
+            self.player.release()
         self.player = None
         self.ground_generator.clear()  # Limpa as plataformas geradas
+        self.activation_window.clear()
+        self.updating.clear()
+        self.store.clear()
+
+    def close(self):
+        """Para a geração em segundo plano; o manager não é usado depois disso"""
+        self.ground_generator.close()
         
     def get_player(self) -> Player:
         return self.player
         
-    def get_objects(self) -> List[GameObject]:
-        return self.game_objects
\ No newline at end of file
+    def get_objects(self) -> Iterable[GameObject]:
+        """Player seguido dos segmentos ativos, sem montar uma lista nova a cada frame"""
+        if self.player is None:
+            return ()
+        return chain((self.player,), self.activation_window.segments)
\ No newline at end of file
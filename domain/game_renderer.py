@@ -1,11 +1,17 @@
-from typing import Dict, List
+from typing import Dict, List, Sequence
 from domain.entity.camera import Camera
-from domain.entity.game_object import GameObject
+from domain.entity.component_store import FLAG_ANIMATED, ComponentStore
+from domain.ghost_trajectory import GhostTrajectory
 from domain.menu import Menu
 from domain.name_input_manager import NameInputManager
+from domain.physics.physics_snapshot import PhysicsSnapshot
 from domain.physics.vector2D import Vector2D
 from ports.renderer_port import RendererPort
 
+GHOST_SIZE = (32, 32)
+GHOST_COLOR = (60, 90, 140)
+ENTITY_COLOR = (255, 0, 0)
+
 
 class GameRenderer:
     def __init__(self, renderer: RendererPort):
@@ -23,14 +29,34 @@ class GameRenderer:
                 (255, 255, 255)
             )
             
-    def render_game(self, game_objects: List[GameObject], camera: Camera, score: int, delta_time: float):
+    def render_game(self, store: ComponentStore, snapshot: PhysicsSnapshot, camera: Camera, score: int,
+                    delta_time: float, alpha: float = 1.0, ghosts: Sequence[GhostTrajectory] = (),
+                    ghost_time: float = 0.0):
         self.renderer.clear()
-        for obj in game_objects:
-            if camera.is_in_view(obj.position, obj.size[0], obj.size[1]):
-                screen_pos = camera.world_to_screen(obj.position)
-                obj.render_at_position(self.renderer, screen_pos, delta_time)
+        self.render_ghosts(ghosts, camera, ghost_time)
+        # Animação, interpolação e culling rodam nas colunas; só os visíveis chegam ao laço
+        store.advance_animations(delta_time)
+        rows, screen_x, screen_y = store.visible(snapshot, camera, alpha)
+        animated = (store.flags[rows] & FLAG_ANIMATED) != 0
+        for row, x, y, is_animated, width, height in zip(rows.tolist(), screen_x.tolist(), screen_y.tolist(),
+                                                         animated.tolist(), store.width[rows].tolist(),
+                                                         store.height[rows].tolist()):
+            if is_animated:
+                store.objects[row].render_at_position(self.renderer, Vector2D(x, y), delta_time)
+            else:
+                self.renderer.draw_rect(Vector2D(x, y), (width, height), ENTITY_COLOR)
         self.renderer.draw_text(f"Score: {score}", 5, 5, (255, 255, 255))
         
+    def render_ghosts(self, ghosts: Sequence[GhostTrajectory], camera: Camera, time: float):
+        """Desenha, atrás dos objetos, onde cada fantasma estava no mesmo instante da partida"""
+        for ghost in ghosts:
+            sample = ghost.sample(time)
+            if sample is None:
+                continue
+            position, _ = sample
+            if camera.is_in_view(position, *GHOST_SIZE):
+                self.renderer.draw_rect(camera.world_to_screen(position), GHOST_SIZE, GHOST_COLOR)
+
     def render_game_over(self, score: int, name_input_manager: NameInputManager):
         self.renderer.clear()
         self.renderer.draw_text("Game Over!", 300, 250, (255, 0, 0))
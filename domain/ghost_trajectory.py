@@ -0,0 +1,226 @@
+import glob
+import mmap
+import os
+import struct
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.physics.vector2D import Vector2D
+
+GHOST_MAGIC = b"AORG"
+GHOST_VERSION = 1
+GHOST_EXTENSION = ".ghost"
+SAMPLE_RATE = 30           # amostras por segundo de jogo
+QUANTUM = 1 / 8            # posições guardadas em oitavos de pixel
+KEYFRAME_INTERVAL = 32     # uma posição absoluta a cada 32 amostras
+# magic, versão, taxa, quantum, intervalo entre keyframes, amostras, pontuação
+HEADER = struct.Struct("<4sHddIIq")
+
+# Estado de animação num byte: animação nos bits 0-1, direção no 2, gravidade no 3
+ANIMATIONS = ("idle", "run", "jump", "fall")
+FACING_RIGHT = 1 << 2
+GRAVITY_INVERTED = 1 << 3
+
+
+def animation_state(animation: str, facing_right: bool, gravity_inverted: bool) -> int:
+    index = ANIMATIONS.index(animation) if animation in ANIMATIONS else 0
+    return index | (FACING_RIGHT if facing_right else 0) | (GRAVITY_INVERTED if gravity_inverted else 0)
+
+
+class GhostTrajectory:
+    """Trajetória de uma partida: posições quantizadas em deltas e estado de animação.
+
+    Cada amostra guarda só a diferença para a anterior em int16, e a cada
+    KEYFRAME_INTERVAL amostras há uma posição absoluta em int32. Buscar
+    qualquer instante soma no máximo KEYFRAME_INTERVAL deltas, então o custo
+    não depende do tamanho da partida. Carregada de disco, a trajetória é um
+    memmap: só as páginas tocadas durante o replay vão para a memória.
+    """
+
+    def __init__(self, keyframes: np.ndarray, deltas: np.ndarray, states: Sequence[int],
+                 score: int = 0, sample_rate: float = SAMPLE_RATE, quantum: float = QUANTUM,
+                 keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.keyframes = keyframes
+        self.deltas = deltas
+        self.states = states
+        self.score = score
+        self.sample_rate = sample_rate
+        self.quantum = quantum
+        self.keyframe_interval = keyframe_interval
+        # Mapeamento do arquivo quando a trajetória vem de load; fechado por close
+        self.path: Optional[str] = None
+        self.buffer: Optional[mmap.mmap] = None
+        self._bind_views()
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @property
+    def duration(self) -> float:
+        return max(len(self) - 1, 0) / self.sample_rate
+
+    @classmethod
+    def from_samples(cls, x: np.ndarray, y: np.ndarray, states: np.ndarray, score: int = 0,
+                     sample_rate: float = SAMPLE_RATE, quantum: float = QUANTUM,
+                     keyframe_interval: int = KEYFRAME_INTERVAL) -> "GhostTrajectory":
+        quantized = np.stack([np.rint(np.asarray(x) / quantum), np.rint(np.asarray(y) / quantum)], axis=1)
+        quantized = quantized.astype(np.int64)
+        deltas = np.diff(quantized, axis=0, prepend=quantized[:1])
+        # Nos keyframes o delta não é usado; zera para não estourar o int16
+        deltas[::keyframe_interval] = 0
+        if len(deltas) and np.abs(deltas).max() > np.iinfo(np.int16).max:
+            raise ValueError("Deslocamento grande demais entre duas amostras")
+        return cls(
+            keyframes=quantized[::keyframe_interval].astype(np.int32),
+            deltas=deltas.astype(np.int16),
+            states=bytes(np.asarray(states, dtype=np.uint8)),
+            score=score,
+            sample_rate=sample_rate,
+            quantum=quantum,
+            keyframe_interval=keyframe_interval
+        )
+
+    def _bind_views(self) -> None:
+        # Leitura escalar por memoryview: bem mais barata que indexar o array NumPy
+        self._keyframe_view = memoryview(np.ascontiguousarray(self.keyframes).reshape(-1)).cast("B").cast("i")
+        self._delta_view = memoryview(np.ascontiguousarray(self.deltas).reshape(-1)).cast("B").cast("h")
+        self._cursor = -1
+        self._cursor_x = self._cursor_y = 0
+
+    def quantized_at(self, index: int) -> Tuple[int, int]:
+        """Posição quantizada da amostra.
+
+        Avançando pouco a partir da última consulta, como no replay quadro a
+        quadro, soma só os deltas novos; senão parte do keyframe anterior.
+        """
+        cursor = self._cursor
+        if cursor <= index < cursor + self.keyframe_interval and cursor >= 0:
+            x, y, start = self._cursor_x, self._cursor_y, cursor + 1
+        else:
+            key = index // self.keyframe_interval
+            x, y = self._keyframe_view[2 * key], self._keyframe_view[2 * key + 1]
+            start = key * self.keyframe_interval + 1
+
+        deltas = self._delta_view
+        interval = self.keyframe_interval
+        for i in range(start, index + 1):
+            if i % interval == 0:
+                x, y = self._keyframe_view[2 * (i // interval)], self._keyframe_view[2 * (i // interval) + 1]
+            else:
+                x += deltas[2 * i]
+                y += deltas[2 * i + 1]
+        self._cursor, self._cursor_x, self._cursor_y = index, x, y
+        return x, y
+
+    def sample(self, time: float) -> Optional[Tuple[Vector2D, int]]:
+        """Posição interpolada e estado de animação no instante; None fora da partida"""
+        count = len(self)
+        if not count or time < 0:
+            return None
+        position = time * self.sample_rate
+        index = int(position)
+        if index >= count - 1:
+            if index > count - 1:
+                return None
+            x, y = self.quantized_at(index)
+            return Vector2D(x * self.quantum, y * self.quantum), self.states[index]
+
+        x0, y0 = self.quantized_at(index)
+        if (index + 1) % self.keyframe_interval == 0:
+            key = 2 * ((index + 1) // self.keyframe_interval)
+            dx, dy = self._keyframe_view[key] - x0, self._keyframe_view[key + 1] - y0
+        else:
+            dx, dy = self._delta_view[2 * index + 2], self._delta_view[2 * index + 3]
+        fraction = position - index
+        return (Vector2D((x0 + dx * fraction) * self.quantum, (y0 + dy * fraction) * self.quantum),
+                self.states[index])
+
+    def close(self) -> None:
+        """Solta as views e fecha o mmap, liberando o arquivo para ser substituído.
+
+        No Windows um arquivo mapeado não pode ser trocado por os.replace,
+        então quem vai regravar uma trajetória fecha antes a que leu dela.
+        """
+        if self.buffer is None:
+            return
+        self._keyframe_view.release()
+        self._delta_view.release()
+        if isinstance(self.states, memoryview):
+            self.states.release()
+        self.keyframes = np.empty((0, 2), dtype=np.int32)
+        self.deltas = np.empty((0, 2), dtype=np.int16)
+        self.states = b""
+        self._bind_views()
+        self.buffer.close()
+        self.buffer = None
+
+    def save(self, path: str) -> None:
+        # Grava num arquivo novo e troca; um mmap aberto sobre path precisa ser fechado antes
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(GHOST_MAGIC, GHOST_VERSION, self.sample_rate, self.quantum,
+                                   self.keyframe_interval, len(self), self.score))
+            file.write(np.ascontiguousarray(self.keyframes, dtype=np.int32).tobytes())
+            file.write(np.ascontiguousarray(self.deltas, dtype=np.int16).tobytes())
+            file.write(self.states)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GhostTrajectory":
+        """Abre a trajetória com mmap, sem ler as amostras para a memória"""
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, sample_rate, quantum, interval, count, score = HEADER.unpack_from(buffer)
+        if magic != GHOST_MAGIC or version != GHOST_VERSION:
+            raise ValueError("Arquivo de fantasma inválido")
+
+        # As três colunas são views sobre o mesmo mapeamento do arquivo
+        keyframe_count = -(-count // interval)
+        offset = HEADER.size
+        keyframes = np.frombuffer(buffer, np.int32, 2 * keyframe_count, offset).reshape(-1, 2)
+        offset += keyframes.nbytes
+        deltas = np.frombuffer(buffer, np.int16, 2 * count, offset).reshape(-1, 2)
+        offset += deltas.nbytes
+        states = memoryview(buffer)[offset:offset + count]
+        trajectory = cls(keyframes, deltas, states, score, sample_rate, quantum, interval)
+        trajectory.path = path
+        trajectory.buffer = buffer
+        return trajectory
+
+
+def load_ghosts(directory: str) -> List[GhostTrajectory]:
+    """Todas as trajetórias salvas no diretório"""
+    return [GhostTrajectory.load(path) for path in sorted(glob.glob(os.path.join(directory, "*" + GHOST_EXTENSION)))]
+
+
+class GhostRecorder:
+    """Amostra a posição e o estado de animação do player na taxa fixa da trajetória"""
+
+    def __init__(self, sample_rate: float = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.x = array("d")
+        self.y = array("d")
+        self.states = bytearray()
+
+    def record(self, time: float, position: Vector2D, state: int) -> None:
+        # Quadros a 60 Hz com amostras a 30 Hz: grava só quando chega a vez da próxima
+        while len(self.states) <= time * self.sample_rate:
+            self.x.append(position.x)
+            self.y.append(position.y)
+            self.states.append(state)
+
+    def clear(self) -> None:
+        self.x = array("d")
+        self.y = array("d")
+        self.states = bytearray()
+
+    def to_trajectory(self, score: int) -> GhostTrajectory:
+        return GhostTrajectory.from_samples(
+            np.frombuffer(self.x, dtype=np.float64),
+            np.frombuffer(self.y, dtype=np.float64),
+            np.frombuffer(bytes(self.states), dtype=np.uint8),
+            score=score,
+            sample_rate=self.sample_rate
+        )
@@ -1,127 +1,256 @@
-from random import randint
-from typing import List, Tuple
-from domain.physics.vector2D import Vector2D
-from domain.entity.ground_segment import GroundSegment
-from ports.physics_port import PhysicsPort
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from domain.platform_descriptors import KIND_BOTTOM, KIND_TOP, PlatformDescriptors
+from domain.reachability import JumpParams, reachability_table
+
+MIN_PLATFORM_WIDTH = 150
+MAX_PLATFORM_WIDTH = 300
+INITIAL_PLATFORM_WIDTH = 300
+# Gerar descritores é barato, então o gerador pode olhar bem à frente da câmera
+LOOK_AHEAD_DISTANCE = 5000
+KEEP_BEHIND_DISTANCE = 1000
+# O nível é dividido em chunks de largura fixa em x; o chunk K depende só da semente e de K
+CHUNK_WIDTH = 2400
+PREFETCH_CHUNKS = 2
+BOTTOM_HEIGHT_RANGE = (400, 550)
+TOP_HEIGHT_RANGE = (50, 200)
+
+
+@dataclass(frozen=True)
+class ChunkParams:
+    min_gap: int
+    max_gap: int
+    min_platform_width: int
+    max_platform_width: int
+    bottom_base_height: int
+    top_base_height: int
+    height_variation: int
+    chunk_width: int = CHUNK_WIDTH
+    # Com parâmetros de pulo, vãos que o player não alcança são corrigidos
+    jump: Optional[JumpParams] = None
+
+
+def chunk_rng(seed: int, index: int) -> random.Random:
+    # Semente em texto: o Random a transforma com sha512, igual em qualquer processo
+    return random.Random(f"{seed}:{index}")
+
+
+def chunk_entry(rng: random.Random, index: int, params: ChunkParams) -> Tuple[int, int, int]:
+    """Início em x e alturas do primeiro par do chunk: os três primeiros sorteios do seu rng"""
+    offset = rng.randint(0, params.max_gap - params.min_gap)
+    bottom = rng.randint(*BOTTOM_HEIGHT_RANGE)
+    top = rng.randint(*TOP_HEIGHT_RANGE)
+    if index == 0:
+        # O primeiro chunk começa com o par garantido para o spawn
+        return 0, params.bottom_base_height, params.top_base_height
+    return index * params.chunk_width + offset, bottom, top
+
+
+def generate_chunk(seed: int, index: int, params: ChunkParams) -> Dict[str, np.ndarray]:
+    """Descritores dos pares de plataformas do chunk, calculados só a partir da semente e do índice.
+
+    O chunk termina a um vão válido do começo do próximo, e as alturas são
+    puxadas aos poucos para as do primeiro par dele, então chunks vizinhos
+    encaixam mesmo sendo gerados separadamente.
+    """
+    rng = chunk_rng(seed, index)
+    start_x, bottom, top = chunk_entry(rng, index, params)
+    next_x, next_bottom, next_top = chunk_entry(chunk_rng(seed, index + 1), index + 1, params)
+
+    min_gap, max_gap = params.min_gap, params.max_gap
+    min_width, max_width = params.min_platform_width, params.max_platform_width
+    # Sobras que ainda dá para fechar com mais uma plataforma e dois vãos válidos
+    fillable_min = 2 * min_gap + min_width
+    fillable_max = 2 * max_gap + max_width
+
+    width = INITIAL_PLATFORM_WIDTH if index == 0 else rng.randint(min_width, max_width)
+    xs, widths, bottoms, tops = [start_x], [width], [bottom], [top]
+    end = start_x + width
+    while next_x - end > max_gap:
+        remaining = next_x - end
+        gap = rng.randint(min_gap, max_gap)
+        width = rng.randint(min_width, max_width)
+        if remaining <= fillable_max:
+            # Última plataforma: escolhe vão e largura que deixam um vão válido até o próximo chunk
+            gap_low = max(min_gap, remaining - max_gap - max_width)
+            gap_high = min(max_gap, remaining - min_gap - min_width)
+            gap = rng.randint(gap_low, gap_high) if gap_low <= gap_high else min_gap
+            width_low = max(min_width, remaining - gap - max_gap)
+            width_high = min(max_width, remaining - gap - min_gap)
+            width = rng.randint(width_low, width_high) if width_low <= width_high else min_width
+        elif remaining - gap - width < fillable_min:
+            # Não deixa uma sobra curta demais para caber outra plataforma
+            width = max(min_width, min(width, remaining - gap - fillable_min))
+            gap = max(min_gap, min(gap, remaining - width - fillable_min))
+
+        bottom = max(BOTTOM_HEIGHT_RANGE[0], min(BOTTOM_HEIGHT_RANGE[1],
+                     bottom + rng.randint(-params.height_variation, params.height_variation)))
+        top = max(TOP_HEIGHT_RANGE[0], min(TOP_HEIGHT_RANGE[1],
+                  top + rng.randint(-params.height_variation, params.height_variation)))
+        xs.append(end + gap)
+        widths.append(width)
+        bottoms.append(bottom)
+        tops.append(top)
+        end += gap + width
+
+    # Puxa as alturas em direção às do primeiro par do próximo chunk
+    count = len(xs)
+    ramp = np.arange(count) / count
+    bottom_heights = np.rint(np.array(bottoms) + (next_bottom - bottoms[-1]) * ramp).clip(*BOTTOM_HEIGHT_RANGE)
+    top_heights = np.rint(np.array(tops) + (next_top - tops[-1]) * ramp).clip(*TOP_HEIGHT_RANGE)
+
+    widths = np.array(widths, dtype=np.float64)
+    if params.jump is not None:
+        # Valida também a passagem para o primeiro par do próximo chunk
+        table = reachability_table(params.jump)
+        patched, _ = table.patch(
+            np.append(np.array(xs, dtype=np.float64), next_x),
+            np.append(widths, 0.0),
+            np.append(bottom_heights, next_bottom),
+            np.append(top_heights, next_top)
+        )
+        widths = patched[:-1]
+
+    # Pares intercalados (inferior, superior) com o mesmo x, como os descritores esperam
+    return {
+        'x': np.repeat(np.array(xs, dtype=np.float64), 2),
+        'y': np.column_stack([bottom_heights, top_heights]).reshape(-1).astype(np.float64),
+        'width': np.repeat(widths, 2),
+        'kind': np.tile(np.array([KIND_BOTTOM, KIND_TOP], dtype=np.int8), count),
+    }
+
 
 class GroundGenerator:
-    def __init__(self, physics: PhysicsPort):
-        self.physics = physics
+    def __init__(self, seed: Optional[int] = None, background: bool = False,
+                 prefetch_chunks: int = PREFETCH_CHUNKS):
+        # Fonte das sementes das partidas: a mesma semente sempre produz os mesmos níveis
+        self.rng = random.Random(seed)
+        self.seed = seed if seed is not None else self.rng.getrandbits(32)
         self.last_platform_end = 0
         self.min_gap = 100
         self.max_gap = 200
-        self.min_platform_width = 150
-        self.max_platform_width = 300
-        
+        self.min_platform_width = MIN_PLATFORM_WIDTH
+        self.max_platform_width = MAX_PLATFORM_WIDTH
+        self.chunk_width = CHUNK_WIDTH
+        # Física do Player usada para garantir que todo vão gerado é alcançável
+        self.jump_params: Optional[JumpParams] = JumpParams.for_player(self.min_platform_width)
+
         # Configurações de altura
         self.bottom_base_height = 500  # Altura base para plataformas inferiores
         self.top_base_height = 100     # Altura base para plataformas superiores
         self.height_variation = 50      # Variação menor para manter equilíbrio
-        
-        self.last_bottom_height = self.bottom_base_height
-        self.last_top_height = self.top_base_height
-        
-        # Lista de tuplas (segmento, largura) para cada linha de plataformas
-        self.bottom_segments: List[Tuple[GroundSegment, float]] = []
-        self.top_segments: List[Tuple[GroundSegment, float]] = []
-        
-    def generate_initial_platforms(self, num_platforms: int = 5) -> List[GroundSegment]:
-        """Gera as plataformas iniciais do jogo em ambas as posições"""
-        # Plataformas iniciais garantidas para spawn seguro
-        initial_width = 300
-        
-        # Plataforma inferior inicial
-        bottom_platform = GroundSegment(
-            physics=self.physics,
-            position=Vector2D(0, self.bottom_base_height),
-            width=initial_width
-        )
-        self.bottom_segments.append((bottom_platform, initial_width))
-        
-        # Plataforma superior inicial
-        top_platform = GroundSegment(
-            physics=self.physics,
-            position=Vector2D(0, self.top_base_height),
-            width=initial_width
-        )
-        self.top_segments.append((top_platform, initial_width))
-        
-        self.last_platform_end = initial_width
-        
-        # Gera os próximos pares de plataformas
-        for _ in range(num_platforms - 1):
-            self.generate_next_platforms()
-            
-        # Retorna todas as plataformas
-        return ([segment for segment, _ in self.bottom_segments] + 
-                [segment for segment, _ in self.top_segments])
-    
-    def generate_next_platforms(self) -> Tuple[GroundSegment, GroundSegment]:
-        """Gera um novo par de plataformas (superior e inferior)"""
-        # Calcula a distância até o próximo par de plataformas
-        gap = randint(self.min_gap, self.max_gap)
-        start_x = self.last_platform_end + gap
-        
-        # Determina o tamanho das plataformas (mesmo tamanho para manter simetria)
-        width = randint(self.min_platform_width, self.max_platform_width)
-        
-        # Calcula as alturas com variações controladas
-        bottom_height_change = randint(-self.height_variation, self.height_variation)
-        top_height_change = randint(-self.height_variation, self.height_variation)
-        
-        new_bottom_height = max(400, min(550, self.last_bottom_height + bottom_height_change))
-        new_top_height = max(50, min(200, self.last_top_height + top_height_change))
-        
-        # Cria a plataforma inferior
-        bottom_platform = GroundSegment(
-            physics=self.physics,
-            position=Vector2D(start_x, new_bottom_height),
-            width=width
-        )
-        
-        # Cria a plataforma superior
-        top_platform = GroundSegment(
-            physics=self.physics,
-            position=Vector2D(start_x, new_top_height),
-            width=width
+
+        # Plataformas geradas ficam só como descritores; quem as materializa
+        # em GroundSegments é a ActivationWindow
+        self.descriptors = PlatformDescriptors()
+        self.next_chunk = 0
+
+        # Com background, uma thread calcula os próximos chunks antes de o player chegar
+        self.prefetch_chunks = prefetch_chunks
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunks") if background else None
+        self.pending: Dict[int, Future] = {}
+
+    def configure(self, **params: int) -> None:
+        """Troca parâmetros de geração e refaz os JumpParams que dependem da largura mínima"""
+        for name, value in params.items():
+            setattr(self, name, value)
+        if self.jump_params is not None:
+            self.jump_params = JumpParams.for_player(self.min_platform_width)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """Fixa a semente da próxima partida; sem semente, sorteia uma a partir do gerador atual"""
+        if seed is None:
+            seed = self.rng.getrandbits(32)
+        self.seed = seed
+        self.cancel_pending()
+        return seed
+
+    def cancel_pending(self) -> None:
+        """Descarta os chunks pedidos à thread; os que ainda não começaram nem chegam a rodar"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    def close(self) -> None:
+        """Para a thread de pré-geração; chamado quando o jogo fecha"""
+        self.cancel_pending()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def params(self) -> ChunkParams:
+        return ChunkParams(
+            min_gap=self.min_gap,
+            max_gap=self.max_gap,
+            min_platform_width=self.min_platform_width,
+            max_platform_width=self.max_platform_width,
+            bottom_base_height=self.bottom_base_height,
+            top_base_height=self.top_base_height,
+            height_variation=self.height_variation,
+            chunk_width=self.chunk_width,
+            jump=self.jump_params
         )
-        
-        # Atualiza as variáveis de controle
-        self.last_platform_end = start_x + width
-        self.last_bottom_height = new_bottom_height
-        self.last_top_height = new_top_height
-        
-        # Armazena as novas plataformas
-        self.bottom_segments.append((bottom_platform, width))
-        self.top_segments.append((top_platform, width))
-        
-        return bottom_platform, top_platform
-    
-    def update(self, player_x: float, view_distance: float = 1000) -> List[GroundSegment]:
-        """Atualiza as plataformas baseado na posição do player"""
-        # Gera novos pares de plataformas se necessário
-        while self.last_platform_end < player_x + view_distance:
-            self.generate_next_platforms()
-        
-        # Remove plataformas antigas que ficaram muito para trás
-        self.bottom_segments = [
-            (segment, width) for segment, width in self.bottom_segments 
-            if segment.position.x + width > player_x - view_distance
-        ]
-        
-        self.top_segments = [
-            (segment, width) for segment, width in self.top_segments 
-            if segment.position.x + width > player_x - view_distance
-        ]
-        
-        # Retorna todas as plataformas ativas
-        return ([segment for segment, _ in self.bottom_segments] + 
-                [segment for segment, _ in self.top_segments])
-    
+
+    def generate_initial_platforms(self, num_platforms: int = 5) -> None:
+        """Gera chunks a partir do início até ter pelo menos num_platforms pares"""
+        self.next_chunk = 0
+        while len(self.descriptors) < 2 * num_platforms:
+            self.materialize_next_chunk()
+
+    def materialize_next_chunk(self) -> None:
+        """Acrescenta aos descritores o próximo chunk, já pronto ou calculado agora"""
+        future = self.pending.pop(self.next_chunk, None)
+        chunk = future.result() if future is not None else generate_chunk(self.seed, self.next_chunk, self.params())
+        self.descriptors.extend(chunk['x'], chunk['y'], chunk['width'], chunk['kind'])
+        self.last_platform_end = float(chunk['x'][-1] + chunk['width'][-1])
+        self.next_chunk += 1
+
+    def prefetch(self) -> None:
+        if self.executor is None:
+            return
+        params = self.params()
+        for index in range(self.next_chunk, self.next_chunk + self.prefetch_chunks):
+            if index not in self.pending:
+                self.pending[index] = self.executor.submit(generate_chunk, self.seed, index, params)
+
+    def update(self, player_x: float,
+               look_ahead: float = LOOK_AHEAD_DISTANCE,
+               keep_behind: float = KEEP_BEHIND_DISTANCE) -> None:
+        """Materializa chunks à frente do player e descarta os descritores que ficaram para trás"""
+        while self.last_platform_end < player_x + look_ahead:
+            self.materialize_next_chunk()
+        self.prefetch()
+
+        self.descriptors.discard_before(player_x - keep_behind)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Descritores, semente e próximo chunk, e o estado da fonte de sementes"""
+        version, internal, gauss_next = self.rng.getstate()
+        return {
+            **self.descriptors.to_arrays(),
+            'cursor': np.array([self.last_platform_end]),
+            'chunk': np.array([self.seed, self.next_chunk], dtype=np.int64),
+            'rng_state': np.array((version,) + internal, dtype=np.int64),
+            'rng_gauss': np.array([np.nan if gauss_next is None else gauss_next]),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        self.descriptors.load_arrays(state)
+        self.last_platform_end = float(state['cursor'][0])
+        self.seed, self.next_chunk = state['chunk'].tolist()
+        self.cancel_pending()
+        version, *internal = state['rng_state'].tolist()
+        gauss_next = float(state['rng_gauss'][0])
+        self.rng.setstate((version, tuple(internal), None if np.isnan(gauss_next) else gauss_next))
+
     def clear(self):
         """Limpa todas as plataformas geradas"""
-        self.bottom_segments.clear()
-        self.top_segments.clear()
+        self.descriptors.clear()
+        self.cancel_pending()
         self.last_platform_end = 0
-        self.last_bottom_height = self.bottom_base_height
-        self.last_top_height = self.top_base_height
\ No newline at end of file
+        self.next_chunk = 0
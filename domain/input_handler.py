@@ -1,4 +1,5 @@
 from domain.entity.player import Player
+from domain.input_recording import key_mask
 from domain.menu import Menu
 from domain.name_input_manager import NameInputManager
 from ports.event_port import EventPort
@@ -7,6 +8,8 @@ from ports.event_port import EventPort
 class InputHandler:
     def __init__(self, event_handler: EventPort):
         self.event_handler = event_handler
+        # Teclas de jogo usadas no último quadro, para a gravação da partida
+        self.last_mask = 0
         
     def handle_menu_input(self, menu: Menu):
         if self.event_handler.is_key_pressed("jump"):
@@ -18,6 +21,7 @@ class InputHandler:
             
     def handle_game_input(self, player: Player):
         if player:
+            self.last_mask = key_mask(self.event_handler)
             player.handle_input(self.event_handler)
             
     def handle_game_over_input(self, name_input: NameInputManager) -> bool:
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import struct
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from ports.event_port import EventPort
+
+# Teclas de jogo gravadas, na ordem dos bits da máscara
+RECORDED_KEYS = ("left", "right", "jump")
+
+MAGIC = b"AORR"
+VERSION = 2
+# magic, versão, semente, quadros, pontuação, checksum, número de trechos
+HEADER = struct.Struct("<4sHQIq16sI")
+RUN = np.dtype([("mask", "u1"), ("delta", "<u4"), ("length", "<u2")])
+MAX_RUN = np.iinfo(np.uint16).max
+# O delta de cada quadro é gravado em microssegundos; deltas em milissegundos
+# inteiros, como os do PygameClock, voltam exatamente iguais
+DELTA_TICKS_PER_SECOND = 1_000_000
+
+
+def key_mask(event_handler: EventPort) -> int:
+    """Máscara de bits das teclas de jogo pressionadas agora"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if event_handler.is_key_pressed(key):
+            mask |= 1 << bit
+    return mask
+
+
+def quantize_delta(delta_time: float) -> int:
+    return round(delta_time * DELTA_TICKS_PER_SECOND)
+
+
+def state_checksum(*values: float) -> bytes:
+    """Hash dos valores exatos (em bits) que descrevem o estado final de uma partida"""
+    return hashlib.blake2b(struct.pack(f"<{len(values)}d", *values), digest_size=16).digest()
+
+
+@dataclass
+class InputRecording:
+    """Semente, máscara de teclas e delta de cada quadro de uma partida, com o checksum do fim"""
+    seed: int
+    masks: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    deltas: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint32))  # microssegundos
+    score: int = 0
+    checksum: bytes = bytes(16)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.masks)
+
+    def delta_times(self) -> np.ndarray:
+        """Delta em segundos de cada quadro, exatamente como o jogo o usou"""
+        return self.deltas / DELTA_TICKS_PER_SECOND
+
+    def to_bytes(self) -> bytes:
+        # Run-length: cada trecho é (máscara, delta, quantidade de quadros seguidos com eles)
+        keys = (self.deltas.astype(np.uint64) << np.uint64(8)) | self.masks
+        starts = np.flatnonzero(np.diff(keys, prepend=keys[:1] + 1) != 0) if len(keys) else np.empty(0, np.intp)
+        lengths = np.diff(np.append(starts, len(keys)))
+
+        # Trechos maiores que o limite de 16 bits são quebrados em vários
+        pieces = -(-lengths // MAX_RUN)
+        runs = np.zeros(int(pieces.sum()), dtype=RUN)
+        runs["mask"] = np.repeat(self.masks[starts], pieces)
+        runs["delta"] = np.repeat(self.deltas[starts], pieces)
+        runs["length"] = MAX_RUN
+        last_piece = np.cumsum(pieces) - 1
+        runs["length"][last_piece] = lengths - (pieces - 1) * MAX_RUN
+
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.frame_count,
+                             self.score, self.checksum, len(runs))
+        return header + runs.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputRecording":
+        magic, version, seed, frame_count, score, checksum, run_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Arquivo de gravação inválido")
+        runs = np.frombuffer(data, dtype=RUN, count=run_count, offset=HEADER.size)
+        masks = np.repeat(runs["mask"], runs["length"])
+        deltas = np.repeat(runs["delta"], runs["length"])
+        if len(masks) != frame_count:
+            raise ValueError("Gravação corrompida: número de quadros não confere")
+        return cls(seed=seed, masks=masks, deltas=deltas, score=score, checksum=checksum)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class InputRecorder:
+    """Grava a máscara e o delta de cada quadro jogado e salva a partida ao terminar"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.seed: Optional[int] = None
+        self.masks = bytearray()
+        self.deltas = array('I')
+        self.last_path: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.seed is not None
+
+    def start(self, seed: int) -> None:
+        self.seed = seed
+        self.masks = bytearray()
+        self.deltas = array('I')
+
+    def record(self, mask: int, delta_time: float) -> float:
+        """Grava o quadro e devolve o delta quantizado, que o jogo usa no lugar do original"""
+        if not self.active:
+            return delta_time
+        ticks = quantize_delta(delta_time)
+        self.masks.append(mask)
+        self.deltas.append(ticks)
+        return ticks / DELTA_TICKS_PER_SECOND
+
+    def stop(self, score: int, checksum: bytes) -> Optional[str]:
+        """Salva a partida gravada e retorna o caminho do arquivo"""
+        if not self.active:
+            return None
+        recording = InputRecording(
+            seed=self.seed,
+            masks=np.frombuffer(bytes(self.masks), dtype=np.uint8),
+            deltas=np.array(self.deltas, dtype=np.uint32),
+            score=score,
+            checksum=checksum
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.seed}"
+        path = os.path.join(self.directory, f"{name}.aorr")
+        # Um restart no mesmo segundo repete a semente: numera em vez de sobrescrever
+        attempt = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{name}-{attempt}.aorr")
+            attempt += 1
+        recording.save(path)
+        self.seed = None
+        self.last_path = path
+        return path
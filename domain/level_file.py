@@ -0,0 +1,213 @@
+import mmap
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from domain.ground_generator import (
+    CHUNK_WIDTH,
+    KEEP_BEHIND_DISTANCE,
+    LOOK_AHEAD_DISTANCE,
+    GroundGenerator,
+    generate_chunk,
+)
+
+LEVEL_MAGIC = b"AORL"
+LEVEL_VERSION = 1
+LEVEL_EXTENSION = ".aorl"
+# magic, versão, semente, largura do chunk, chunks, plataformas, offset do índice, offset dos registros
+HEADER = struct.Struct("<4sHQdQQQQ")
+ALIGNMENT = 64
+# Registro de largura fixa por plataforma, na ordem de x (par inferior/superior intercalado).
+# As buscas binárias de LevelFile.chunk_range e MappedDescriptors.index_range exigem
+# que x e x + largura nunca diminuam ao longo do arquivo, e por isso também min_x
+# e max_x ao longo do índice; write_level recusa níveis fora dessa ordem
+RECORD = np.dtype([('x', '<f8'), ('y', '<f4'), ('width', '<f4'), ('kind', 'i1'), ('pad', 'V7')])
+# Entrada do índice: primeiro registro do chunk, faixa de x coberta e quantidade de registros
+CHUNK_ENTRY = np.dtype([('first', '<u8'), ('min_x', '<f8'), ('max_x', '<f8'), ('count', '<u4'), ('pad', 'V4')])
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _check_order(values: np.ndarray, previous: float, chunk: int, name: str) -> None:
+    if not len(values):
+        raise ValueError(f"Chunk {chunk} sem plataformas")
+    if values[0] < previous or (np.diff(values) < 0).any():
+        raise ValueError(f"Chunk {chunk}: {name} das plataformas diminui; o nível precisa estar em ordem de x")
+
+
+def write_level(path: str, chunks: Iterable[Dict[str, np.ndarray]], chunk_count: int,
+                seed: int = 0, chunk_width: float = CHUNK_WIDTH) -> int:
+    """Grava os chunks (no formato de generate_chunk) num arquivo de nível e retorna o total de plataformas.
+
+    Os registros são escritos em sequência, um chunk por vez, e o índice é
+    preenchido no fim: a memória usada não depende do tamanho do nível.
+    Levanta ValueError se x ou x + largura diminuírem, dentro de um chunk ou
+    de um chunk para o seguinte.
+    """
+    index_offset = _aligned(HEADER.size)
+    records_offset = _aligned(index_offset + chunk_count * CHUNK_ENTRY.itemsize)
+    index = np.zeros(chunk_count, dtype=CHUNK_ENTRY)
+    total = 0
+    previous_x = previous_end = -np.inf
+    with open(path, "wb") as file:
+        file.seek(records_offset)
+        for number, chunk in enumerate(chunks):
+            records = np.zeros(len(chunk['x']), dtype=RECORD)
+            for name in ('x', 'y', 'width', 'kind'):
+                records[name] = chunk[name]
+            # Com os valores já convertidos para os tipos do registro, como o leitor os vê
+            end_x = records['x'] + records['width']
+            _check_order(records['x'], previous_x, number, "x")
+            _check_order(end_x, previous_end, number, "x + largura")
+            previous_x, previous_end = records['x'][-1], end_x[-1]
+            file.write(records.tobytes())
+            index[number] = (total, records['x'][0], end_x[-1], len(records), b"")
+            total += len(records)
+
+        file.seek(0)
+        file.write(HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, seed, chunk_width, chunk_count,
+                               total, index_offset, records_offset))
+        file.seek(index_offset)
+        file.write(index.tobytes())
+    return total
+
+
+def export_generated_level(path: str, seed: int, chunk_count: int,
+                           generator_params: Optional[Dict[str, int]] = None) -> int:
+    """Exporta os primeiros chunk_count chunks de uma semente do GroundGenerator"""
+    generator = GroundGenerator(seed)
+    generator.configure(**(generator_params or {}))
+    params = generator.params()
+    chunks = (generate_chunk(seed, index, params) for index in range(chunk_count))
+    return write_level(path, chunks, chunk_count, seed, params.chunk_width)
+
+
+class LevelFile:
+    """Nível gravado em disco, aberto com mmap: índice e registros são views sem cópia"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.seed, self.chunk_width, chunk_count, record_count,
+         index_offset, records_offset) = HEADER.unpack_from(self.buffer)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError("Arquivo de nível inválido")
+        self.index = np.frombuffer(self.buffer, CHUNK_ENTRY, chunk_count, index_offset)
+        # Os registros só são lidos sob demanda; o índice, pequeno, é conferido aqui
+        if (np.diff(self.index['min_x']) < 0).any() or (np.diff(self.index['max_x']) < 0).any():
+            raise ValueError("Arquivo de nível inválido: chunks fora de ordem de x")
+        self.records = np.frombuffer(self.buffer, RECORD, record_count, records_offset)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.index)
+
+    def chunk_range(self, min_x: float, max_x: float) -> Tuple[int, int]:
+        """Chunks [início, fim) que cruzam o intervalo de x"""
+        start = int(np.searchsorted(self.index['max_x'], min_x, side='left'))
+        end = int(np.searchsorted(self.index['min_x'], max_x, side='right'))
+        return start, max(start, end)
+
+    def record_range(self, first_chunk: int, end_chunk: int) -> Tuple[int, int]:
+        if end_chunk <= first_chunk:
+            return 0, 0
+        last = self.index[end_chunk - 1]
+        return int(self.index[first_chunk]['first']), int(last['first'] + last['count'])
+
+
+class MappedDescriptors:
+    """Descritores com a mesma interface de PlatformDescriptors, lidos direto do arquivo.
+
+    As colunas são views sobre os registros dos chunks carregados; trocar a
+    janela só refaz as views, e as páginas fora dela nunca são lidas.
+    """
+
+    def __init__(self, records: np.ndarray):
+        self.records = records
+        self.set_window(0, 0)
+
+    def set_window(self, start: int, end: int) -> None:
+        window = self.records[start:end]
+        self.x = window['x']
+        self.y = window['y']
+        self.width = window['width']
+        self.kind = window['kind']
+        # Fim de cada plataforma calculado uma vez por janela, não a cada consulta
+        self.end_x = self.x + self.width
+        self.first_index = start
+        self.count = end - start
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def end_index(self) -> int:
+        return self.first_index + self.count
+
+    def get(self, index: int):
+        """Retorna (x, y, largura, tipo) da plataforma com o índice absoluto"""
+        record = self.records[index]
+        return float(record['x']), float(record['y']), float(record['width']), int(record['kind'])
+
+    def index_range(self, min_x: float, max_x: float):
+        """Índices absolutos [início, fim) das plataformas da janela que cruzam o intervalo de x"""
+        start = int(np.searchsorted(self.end_x, min_x, side='left'))
+        end = int(np.searchsorted(self.x, max_x, side='right'))
+        return self.first_index + start, self.first_index + max(start, end)
+
+    def clear(self) -> None:
+        self.set_window(0, 0)
+
+
+class LevelFileSource:
+    """Fonte de plataformas lida de um arquivo de nível, no lugar do GroundGenerator.
+
+    Carrega só os chunks perto do player; o resto do arquivo fica mapeado
+    mas fora da memória, então níveis com milhões de plataformas abrem na hora.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.level = LevelFile(path)
+        self.seed = self.level.seed
+        self.descriptors = MappedDescriptors(self.level.records)
+        self.last_platform_end = 0.0
+        self.chunks = (0, 0)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """O nível do arquivo é fixo; a semente é a que o gerou"""
+        return self.seed
+
+    def load_chunks(self, first_chunk: int, end_chunk: int) -> None:
+        if (first_chunk, end_chunk) == self.chunks:
+            return
+        self.chunks = (first_chunk, end_chunk)
+        self.descriptors.set_window(*self.level.record_range(first_chunk, end_chunk))
+        self.last_platform_end = float(self.level.index['max_x'][end_chunk - 1]) if end_chunk else 0.0
+
+    def generate_initial_platforms(self, num_platforms: int = 5) -> None:
+        self.load_chunks(0, min(1, self.level.chunk_count))
+
+    def update(self, player_x: float,
+               look_ahead: float = LOOK_AHEAD_DISTANCE,
+               keep_behind: float = KEEP_BEHIND_DISTANCE) -> None:
+        """Mantém carregados só os chunks entre keep_behind atrás e look_ahead à frente do player"""
+        self.load_chunks(*self.level.chunk_range(player_x - keep_behind, player_x + look_ahead))
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        return {'level_chunks': np.array(self.chunks, dtype=np.int64)}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        self.chunks = (0, 0)
+        self.load_chunks(*state['level_chunks'].tolist())
+
+    def clear(self):
+        self.chunks = (0, 0)
+        self.descriptors.clear()
+        self.last_platform_end = 0.0
+
+    def close(self):
+        """Sem thread para parar: o arquivo continua mapeado enquanto houver views dos descritores"""
@@ -0,0 +1,7 @@
+from domain.physics.vector2D import Vector2D
+
+# Física do mundo do jogo, usada pelos adaptadores e pela análise de alcance dos vãos
+GRAVITY = Vector2D(0, 98.1)
+PHYSICS_HZ = 120
+# Limite padrão da velocidade vertical dos corpos dinâmicos: a velocidade terminal da queda
+MAX_FALL_SPEED = 500.0
@@ -0,0 +1,107 @@
+from array import array
+from typing import Dict, List
+
+from domain.physics.vector2D import Vector2D
+
+
+class PhysicsSnapshot:
+    """Estado de todos os corpos em arrays contíguos, indexados por slot"""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.positions = array('d')           # x, y intercalados
+        self.previous_positions = array('d')  # posição antes do último passo
+        self.velocities = array('d')          # vx, vy intercalados
+        self.grounded = array('b')
+        # Versão da última escrita em cada slot; permite que os leitores
+        # mantenham cache até o slot mudar
+        self.stamps = array('Q')
+        self.slots: Dict[int, int] = {}
+        self.free_slots: List[int] = []
+        self.next_slot = 0
+        self.version = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.positions.frombytes(bytes(16 * extra))
+        self.previous_positions.frombytes(bytes(16 * extra))
+        self.velocities.frombytes(bytes(16 * extra))
+        self.grounded.frombytes(bytes(extra))
+        self.stamps.frombytes(bytes(8 * extra))
+        self.capacity = capacity
+
+    def allocate(self, object_id: int) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.next_slot == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.next_slot
+            self.next_slot += 1
+        self.slots[object_id] = slot
+        return slot
+
+    def is_full(self) -> bool:
+        """Indica se o próximo allocate vai realocar os arrays"""
+        return not self.free_slots and self.next_slot == self.capacity
+
+    def release(self, object_id: int) -> None:
+        slot = self.slots.pop(object_id, None)
+        if slot is not None:
+            self.grounded[slot] = 0
+            self.touch(slot)
+            self.free_slots.append(slot)
+
+    def restore_slots(self, slots: Dict[int, int], free_slots: List[int], next_slot: int) -> None:
+        """Recria a tabela de slots de um estado salvo, crescendo os arrays se preciso"""
+        if next_slot > self.capacity:
+            self._grow(max(next_slot, 2 * self.capacity))
+        self.slots = dict(slots)
+        self.free_slots = list(free_slots)
+        self.next_slot = next_slot
+        self.version += 1
+
+    def clear(self) -> None:
+        self.slots.clear()
+        self.free_slots.clear()
+        self.next_slot = 0
+        self.version += 1
+
+    def touch(self, slot: int) -> None:
+        self.version += 1
+        self.stamps[slot] = self.version
+
+    def slot_of(self, object_id: int) -> int:
+        return self.slots.get(object_id, -1)
+
+    def write_position(self, slot: int, x: float, y: float) -> None:
+        i = 2 * slot
+        self.positions[i] = x
+        self.positions[i + 1] = y
+        self.touch(slot)
+
+    def write_velocity(self, slot: int, vx: float, vy: float) -> None:
+        i = 2 * slot
+        self.velocities[i] = vx
+        self.velocities[i + 1] = vy
+        self.touch(slot)
+
+    def get_position(self, slot: int) -> Vector2D:
+        i = 2 * slot
+        return Vector2D(self.positions[i], self.positions[i + 1])
+
+    def get_velocity(self, slot: int) -> Vector2D:
+        i = 2 * slot
+        return Vector2D(self.velocities[i], self.velocities[i + 1])
+
+    def get_interpolated_position(self, slot: int, alpha: float) -> Vector2D:
+        i = 2 * slot
+        px, py = self.previous_positions[i], self.previous_positions[i + 1]
+        return Vector2D(
+            px + (self.positions[i] - px) * alpha,
+            py + (self.positions[i + 1] - py) * alpha
+        )
+
+    def is_grounded(self, slot: int) -> bool:
+        return self.grounded[slot] != 0
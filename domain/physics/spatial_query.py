@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class SegmentHits:
+    """Primeiro corpo atingido por cada segmento de uma consulta em lote.
+
+    Segmentos sem acerto têm id -1, fração 1.0 e o ponto final como ponto.
+    """
+    ids: np.ndarray        # (n,) int64
+    points: np.ndarray     # (n, 2) ponto de contato
+    normals: np.ndarray    # (n, 2) normal da superfície atingida
+    fractions: np.ndarray  # (n,) posição do acerto ao longo do segmento (0 a 1)
+
+    @classmethod
+    def missed(cls, ends: np.ndarray) -> "SegmentHits":
+        count = len(ends)
+        return cls(
+            ids=np.full(count, -1, dtype=np.int64),
+            points=np.array(ends, dtype=np.float64).reshape(count, 2),
+            normals=np.zeros((count, 2), dtype=np.float64),
+            fractions=np.ones(count, dtype=np.float64)
+        )
+
+    @property
+    def hit(self) -> np.ndarray:
+        return self.ids >= 0
+
+
+@dataclass
+class BoxHits:
+    """Corpos que tocam cada caixa de uma consulta em lote.
+
+    Os IDs de todas as caixas ficam concatenados: os da caixa i estão em
+    ids[offsets[i]:offsets[i + 1]].
+    """
+    ids: np.ndarray      # int64
+    offsets: np.ndarray  # (n + 1,) intp
+
+    @classmethod
+    def empty(cls, count: int) -> "BoxHits":
+        return cls(ids=np.empty(0, dtype=np.int64), offsets=np.zeros(count + 1, dtype=np.intp))
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def ids_for(self, index: int) -> np.ndarray:
+        return self.ids[self.offsets[index]:self.offsets[index + 1]]
+
+
+@dataclass
+class NearestHits:
+    """Corpo mais próximo de cada ponto de uma consulta em lote.
+
+    Pontos sem corpo dentro da distância máxima têm id -1, distância infinita
+    e o próprio ponto consultado como ponto. A distância é negativa quando o
+    ponto está dentro do corpo.
+    """
+    ids: np.ndarray        # (n,) int64
+    points: np.ndarray     # (n, 2) ponto mais próximo na superfície do corpo
+    distances: np.ndarray  # (n,)
+
+    @classmethod
+    def missed(cls, points: np.ndarray) -> "NearestHits":
+        count = len(points)
+        return cls(
+            ids=np.full(count, -1, dtype=np.int64),
+            points=np.array(points, dtype=np.float64).reshape(count, 2),
+            distances=np.full(count, np.inf, dtype=np.float64)
+        )
+
+    @property
+    def found(self) -> np.ndarray:
+        return self.ids >= 0
@@ -0,0 +1,17 @@
+import io
+from typing import Dict
+
+import numpy as np
+
+
+def pack_arrays(**arrays: np.ndarray) -> bytes:
+    """Junta arrays nomeados num blob binário (.npz sem compressão)"""
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def unpack_arrays(blob: bytes) -> Dict[str, np.ndarray]:
+    """Lê os arrays gravados por pack_arrays"""
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
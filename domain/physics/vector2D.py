@@ -15,3 +15,25 @@ class Vector2D:
     def magnitude(self) -> float:
         return math.sqrt(self.x * self.x + self.y * self.y)
 
+class FrozenVector2D(Vector2D):
+    """Vector2D somente leitura, para valores em cache divididos entre vários leitores.
+
+    As operações devolvem Vector2D comuns; quem precisa alterar o vetor
+    trabalha numa cópia.
+    """
+    
+    def __init__(self, x: float, y: float):
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Vetor somente leitura; altere uma cópia")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Vetor somente leitura; altere uma cópia")
+    
+    def __eq__(self, other):
+        if not isinstance(other, Vector2D):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
@@ -0,0 +1,112 @@
+from typing import Dict
+
+import numpy as np
+
+KIND_BOTTOM = 0
+KIND_TOP = 1
+
+
+class PlatformDescriptors:
+    """Plataformas geradas guardadas como dados puros (x, y, largura, tipo).
+
+    As plataformas são acrescentadas em ordem de x, então as colunas ficam
+    ordenadas e um intervalo de x vira um intervalo de índices. Os índices são
+    absolutos: continuam valendo depois que as mais antigas são descartadas.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.x = np.empty(capacity, dtype=np.float64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self.width = np.empty(capacity, dtype=np.float64)
+        self.kind = np.empty(capacity, dtype=np.int8)
+        # Fim de cada plataforma (x + largura), mantido junto para index_range não alocar
+        self.end_x = np.empty(capacity, dtype=np.float64)
+        self.count = 0
+        self.first_index = 0  # índice absoluto da primeira plataforma guardada
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def end_index(self) -> int:
+        return self.first_index + self.count
+
+    def append(self, x: float, y: float, width: float, kind: int) -> int:
+        if self.count == len(self.x):
+            self._grow(2 * len(self.x))
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.width[i] = width
+        self.kind[i] = kind
+        self.end_x[i] = x + width
+        self.count += 1
+        return self.first_index + i
+
+    def extend(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, kind: np.ndarray) -> int:
+        """Acrescenta várias plataformas de uma vez e retorna o índice absoluto da primeira"""
+        added = len(x)
+        if self.count + added > len(self.x):
+            self._grow(max(2 * len(self.x), self.count + added))
+        i = self.count
+        self.x[i:i + added] = x
+        self.y[i:i + added] = y
+        self.width[i:i + added] = width
+        self.kind[i:i + added] = kind
+        self.end_x[i:i + added] = self.x[i:i + added] + self.width[i:i + added]
+        self.count += added
+        return self.first_index + i
+
+    def _grow(self, capacity: int) -> None:
+        for name in ('x', 'y', 'width', 'kind', 'end_x'):
+            column = getattr(self, name)
+            resized = np.empty(capacity, dtype=column.dtype)
+            resized[:self.count] = column[:self.count]
+            setattr(self, name, resized)
+
+    def get(self, index: int):
+        """Retorna (x, y, largura, tipo) da plataforma com o índice absoluto"""
+        i = index - self.first_index
+        return float(self.x[i]), float(self.y[i]), float(self.width[i]), int(self.kind[i])
+
+    def index_range(self, min_x: float, max_x: float):
+        """Índices absolutos [início, fim) das plataformas que cruzam o intervalo de x"""
+        # As linhas de cima e de baixo dividem x e largura, então o fim também é ordenado
+        start = int(np.searchsorted(self.end_x[:self.count], min_x, side='left'))
+        end = int(np.searchsorted(self.x[:self.count], max_x, side='right'))
+        return self.first_index + start, self.first_index + max(start, end)
+
+    def discard_before(self, min_x: float) -> None:
+        """Descarta as plataformas que terminam antes de min_x"""
+        dropped = int(np.searchsorted(self.end_x[:self.count], min_x, side='left'))
+        if dropped == 0:
+            return
+        kept = self.count - dropped
+        for column in (self.x, self.y, self.width, self.kind, self.end_x):
+            column[:kept] = column[dropped:self.count]
+        self.count = kept
+        self.first_index += dropped
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            'x': self.x[:self.count].copy(),
+            'y': self.y[:self.count].copy(),
+            'width': self.width[:self.count].copy(),
+            'kind': self.kind[:self.count].copy(),
+            'first_index': np.array([self.first_index], dtype=np.int64),
+        }
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        count = len(arrays['x'])
+        if count > len(self.x):
+            self.count = 0
+            self._grow(count)
+        for name in ('x', 'y', 'width', 'kind'):
+            getattr(self, name)[:count] = arrays[name]
+        self.end_x[:count] = self.x[:count] + self.width[:count]
+        self.count = count
+        self.first_index = int(arrays['first_index'][0])
+
+    def clear(self) -> None:
+        self.count = 0
+        self.first_index = 0
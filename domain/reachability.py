@@ -0,0 +1,155 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from domain.entity.ground_segment import PLATFORM_HEIGHT
+from domain.entity.player import PLAYER_MASS, PLAYER_MOVE_FORCE, PLAYER_SIZE
+from domain.physics.constants import GRAVITY, MAX_FALL_SPEED
+
+# Índices de direção da gravidade durante o voo
+GRAVITY_DOWN = 0
+GRAVITY_UP = 1
+# Maior vão e maior distância vertical cobertos pela tabela, em pixels
+MAX_TABLE_GAP = 1024
+MAX_TABLE_DROP = 1024
+
+
+@dataclass(frozen=True)
+class JumpParams:
+    """Parâmetros físicos que decidem até onde o player alcança num voo.
+
+    O modelo é conservador: o player sai da beirada com no máximo
+    takeoff_speed na horizontal, acelera com move_acceleration durante o voo
+    e cai com a gravidade até max_fall_speed. Mais devagar ele sempre pode ir,
+    freando no chão antes de trocar a gravidade. for_player monta os
+    parâmetros a partir das constantes do Player e da física do jogo.
+    """
+    gravity: float
+    max_fall_speed: float
+    move_acceleration: float   # move_force / massa do player
+    takeoff_speed: float
+    player_height: float
+
+    @classmethod
+    def for_player(cls, min_platform_width: float, gravity: float = GRAVITY.y,
+                   max_fall_speed: float = MAX_FALL_SPEED) -> "JumpParams":
+        """Parâmetros do Player na física do jogo; a velocidade de saída é a atingida
+        acelerando do zero na menor plataforma"""
+        acceleration = PLAYER_MOVE_FORCE / PLAYER_MASS
+        return cls(
+            gravity=gravity,
+            max_fall_speed=max_fall_speed,
+            move_acceleration=acceleration,
+            takeoff_speed=math.sqrt(2 * acceleration * min_platform_width),
+            player_height=float(PLAYER_SIZE[1])
+        )
+
+    def flight_time(self, drop: np.ndarray) -> np.ndarray:
+        """Tempo para percorrer drop pixels no sentido da gravidade, partindo do repouso"""
+        terminal_time = self.max_fall_speed / self.gravity
+        terminal_drop = 0.5 * self.gravity * terminal_time ** 2
+        drop = np.maximum(drop, 0.0)
+        return np.where(drop <= terminal_drop,
+                        np.sqrt(2 * drop / self.gravity),
+                        terminal_time + (drop - terminal_drop) / self.max_fall_speed)
+
+    def horizontal_reach(self, drop: np.ndarray) -> np.ndarray:
+        """Maior distância horizontal coberta enquanto o player percorre drop na vertical"""
+        time = self.flight_time(drop)
+        return self.takeoff_speed * time + 0.5 * self.move_acceleration * time ** 2
+
+
+class ReachabilityTable:
+    """Tabela (direção da gravidade, vão, distância vertical) -> alcançável.
+
+    A distância vertical é medida no sentido da gravidade durante o voo:
+    positiva quando a plataforma de destino fica "abaixo" do player. Vão e
+    distância são arredondados para o lado pessimista antes da consulta.
+    """
+
+    def __init__(self, params: JumpParams):
+        self.params = params
+        drops = np.arange(MAX_TABLE_DROP + 1, dtype=np.float64)
+        reach = params.horizontal_reach(drops)
+        reach[0] = 0.0
+        # A gravidade tem a mesma intensidade nos dois sentidos, então as duas metades coincidem
+        self.reach = np.stack([reach, reach])
+        gaps = np.arange(MAX_TABLE_GAP + 1, dtype=np.float64)
+        self.table = gaps[None, :, None] <= self.reach[:, None, :]
+
+    def is_reachable(self, gap: float, drop: float, direction: int = GRAVITY_DOWN) -> bool:
+        gap_index = math.ceil(max(gap, 0.0))
+        if gap_index > MAX_TABLE_GAP or drop <= 0:
+            return gap_index == 0 and drop == 0
+        return bool(self.table[direction, gap_index, min(int(drop), MAX_TABLE_DROP)])
+
+    def reachable(self, gaps: np.ndarray, drops: np.ndarray, direction: int) -> np.ndarray:
+        """Versão vetorizada de is_reachable para arrays de vãos e distâncias"""
+        gap_index = np.ceil(np.maximum(gaps, 0.0)).astype(np.int64)
+        drop_index = np.clip(drops, 0, MAX_TABLE_DROP).astype(np.int64)
+        inside = (gap_index <= MAX_TABLE_GAP) & (drops > 0)
+        result = self.table[direction, np.minimum(gap_index, MAX_TABLE_GAP), drop_index]
+        return (result & inside) | ((gap_index == 0) & (drops == 0))
+
+    def row_moves(self, x: np.ndarray, width: np.ndarray, bottom: np.ndarray,
+                  top: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Para cada par i -> i+1, se as linhas de baixo e de cima têm algum movimento possível.
+
+        Da linha de baixo: cair andando na plataforma de baixo seguinte ou
+        trocar a gravidade e subir até a de cima; da linha de cima, o espelho.
+        """
+        gaps = x[1:] - (x[:-1] + width[:-1])
+        # O voo entre linhas desconta a espessura da plataforma e a altura do player
+        clearance = PLATFORM_HEIGHT + self.params.player_height
+        bottom_ok = (self.reachable(gaps, bottom[1:] - bottom[:-1], GRAVITY_DOWN) |
+                     self.reachable(gaps, bottom[:-1] - top[1:] - clearance, GRAVITY_UP))
+        top_ok = (self.reachable(gaps, top[:-1] - top[1:], GRAVITY_UP) |
+                  self.reachable(gaps, bottom[1:] - top[:-1] - clearance, GRAVITY_DOWN))
+        return bottom_ok, top_ok
+
+    def passable(self, x: np.ndarray, width: np.ndarray, bottom: np.ndarray, top: np.ndarray) -> np.ndarray:
+        """Transições em que qualquer das duas linhas consegue seguir para o próximo par.
+
+        Se toda transição passa, o nível pode ser vencido partindo de qualquer linha.
+        """
+        bottom_ok, top_ok = self.row_moves(x, width, bottom, top)
+        return bottom_ok & top_ok
+
+    def max_gaps(self, bottom: np.ndarray, top: np.ndarray) -> np.ndarray:
+        """Maior vão que cada transição suporta com as alturas atuais"""
+        clearance = PLATFORM_HEIGHT + self.params.player_height
+
+        def reach(drops: np.ndarray, direction: int) -> np.ndarray:
+            index = np.clip(drops, 0, MAX_TABLE_DROP).astype(np.int64)
+            return np.where(drops > 0, np.floor(self.reach[direction, index]), 0.0)
+
+        bottom_reach = np.maximum(reach(bottom[1:] - bottom[:-1], GRAVITY_DOWN),
+                                  reach(bottom[:-1] - top[1:] - clearance, GRAVITY_UP))
+        top_reach = np.maximum(reach(top[:-1] - top[1:], GRAVITY_UP),
+                               reach(bottom[1:] - top[:-1] - clearance, GRAVITY_DOWN))
+        return np.minimum(bottom_reach, top_reach)
+
+    def patch(self, x: np.ndarray, width: np.ndarray, bottom: np.ndarray,
+              top: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Alarga as plataformas antes de vãos impossíveis até o vão caber no alcance.
+
+        Só as larguras mudam, então as posições dos pares seguintes continuam
+        as mesmas. Retorna as larguras corrigidas e quantas transições mudaram.
+        """
+        broken = ~self.passable(x, width, bottom, top)
+        if not broken.any():
+            return width, 0
+        gaps = x[1:] - (x[:-1] + width[:-1])
+        allowed = np.minimum(self.max_gaps(bottom, top), MAX_TABLE_GAP)
+        patched = width.copy()
+        patched[:-1][broken] += gaps[broken] - np.maximum(allowed[broken], 0.0)
+        return patched, int(broken.sum())
+
+
+@lru_cache(maxsize=8)
+def reachability_table(params: JumpParams) -> ReachabilityTable:
+    """Tabela calculada uma vez por conjunto de parâmetros físicos"""
+    return ReachabilityTable(params)
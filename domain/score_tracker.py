@@ -28,4 +28,10 @@ class ScoreTracker:
         return 0
         
     def get_score(self) -> int:
-        return self.score
\ No newline at end of file
+        return self.score
+
+    def get_state(self) -> tuple:
+        return self.score, self.furthest_right
+
+    def set_state(self, state: tuple):
+        self.score, self.furthest_right = state
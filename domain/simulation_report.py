@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SimulationReport:
+    """Resultado de uma chamada a Game.simulate"""
+    frames: int             # quadros efetivamente simulados
+    wall_time: float        # segundos reais gastos
+    simulated_time: float   # segundos de jogo simulados
+    score: int
+    distance: float         # posição x final do player
+    game_over: bool
+    death_cause: Optional[str] = None  # lado da zona de morte, ver Camera.death_cause
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.wall_time if self.wall_time > 0 else float('inf')
@@ -1,31 +1,51 @@
+import logging
+import sys
+
 import pygame
 
 
+from adapters.asset_bundle import AssetBundle
 from adapters.debug_pygame_renderer import DebugPygameRenderer
-from adapters.pygame_clock import PygameClock
 from adapters.pygame_event import PygameEvent
+from adapters.pygame_clock import PygameClock
+from adapters.pygame_mixer import PygameMixer
 from adapters.pygame_renderer import PygameRenderer
 from adapters.pygame_texture import PygameTexture
 from adapters.pymunk_physics import PymunkPhysicsAdapter
+from adapters.texture_cache import TextureCache
+from domain.animation.asset_manifest import ASSET_BUNDLE_PATH, SOUND_EFFECTS, SPRITE_SHEETS
 from domain.game import Game
-from domain.physics.vector2D import Vector2D
+from domain.input_recording import InputRecorder
+from domain.physics.constants import GRAVITY, PHYSICS_HZ
+
+REPLAYS_DIR = "replays"
+GHOSTS_DIR = "ghosts"
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     pygame.init()
     screen = pygame.display.set_mode((800, 600))
 
     renderer =  PygameRenderer(screen)
     event_handler = PygameEvent()
     clock = PygameClock()
-    physics = PymunkPhysicsAdapter(Vector2D(0, 98.1))
-    texture_handler = PygameTexture()
+    physics = PymunkPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ)
+    # Com o pacote gerado por simulation.bake_assets nada é decodificado; sem ele, arquivos soltos
+    bundle = AssetBundle.open_if_exists(ASSET_BUNDLE_PATH, SPRITE_SHEETS, SOUND_EFFECTS)
+    texture_handler = PygameTexture(TextureCache(bundle=bundle))
     
     game = Game(
         renderer=renderer,
         event_handler=event_handler,
         clock=clock,
         physics=physics,
-        texture_port=texture_handler
+        texture_port=texture_handler,
+        mixer=PygameMixer(bundle),
+        recorder=InputRecorder(REPLAYS_DIR),
+        ghost_dir=GHOSTS_DIR,
+        background_generation=True,
+        # Um arquivo .aorl na linha de comando troca o modo sem fim por aquele nível
+        level_path=sys.argv[1] if len(sys.argv) > 1 else None
     )
     game.run()
 
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class MixerPort(ABC):
+    @abstractmethod
+    def play_music(self, path: str, volume: float) -> None:
+        """Toca uma música em segundo plano, substituindo a atual"""
+        pass
+
+    @abstractmethod
+    def play_sound(self, path: str, volume: float) -> None:
+        """Toca um efeito sonoro curto"""
+        pass
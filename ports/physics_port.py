@@ -1,10 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import List, Tuple
 
+import numpy as np
+
+from domain.physics.physics_snapshot import PhysicsSnapshot
+from domain.physics.spatial_query import BoxHits, NearestHits, SegmentHits
 from domain.physics.vector2D import Vector2D
 
 
 class PhysicsPort(ABC):
+    # Categorias usadas para filtrar colisões e consultas espaciais
+    CATEGORY_DYNAMIC = 0b001
+    CATEGORY_GROUND = 0b010
+    CATEGORY_PLATFORM = 0b100
+    CATEGORY_ALL = CATEGORY_DYNAMIC | CATEGORY_GROUND | CATEGORY_PLATFORM
+
     @abstractmethod
     def apply_force(self, object_id: int, force: Vector2D) -> None:
         """Aplica uma força a um objeto específico"""
@@ -15,6 +25,10 @@ class PhysicsPort(ABC):
         """Define a velocidade de um objeto"""
         pass
     
+    def set_velocity_limit(self, object_id: int, max_x: float, max_y: float) -> None:
+        """Define a velocidade máxima de um objeto em cada eixo"""
+        pass
+    
     @abstractmethod
     def get_velocity(self, object_id: int) -> Vector2D:
         """Obtém a velocidade atual de um objeto"""
@@ -30,6 +44,16 @@ class PhysicsPort(ABC):
         """Cria um corpo estático e retorna seu ID"""
         pass
     
+    @abstractmethod
+    def destroy_body(self, object_id: int) -> None:
+        """Remove um objeto da simulação"""
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Remove todos os objetos e restaura o estado inicial da simulação"""
+        pass
+    
     @abstractmethod
     def update(self, delta_time: float) -> None:
         """Atualiza a simulação física"""
@@ -50,5 +74,46 @@ class PhysicsPort(ABC):
         """Verifica se um objeto está no chão"""
         pass
 
+    def get_contacts(self, object_id: int) -> List[int]:
+        """Obtém os IDs dos objetos em contato com o objeto"""
+        return []
+
+    @abstractmethod
+    def snapshot(self) -> PhysicsSnapshot:
+        """Obtém os arrays com o estado de todos os corpos no último passo"""
+        pass
+
+    @abstractmethod
+    def save_state(self) -> bytes:
+        """Serializa o mundo inteiro; os IDs e slots dos corpos são preservados"""
+        pass
+
+    @abstractmethod
+    def restore_state(self, blob: bytes) -> None:
+        """Substitui o mundo atual pelo salvo em save_state pelo mesmo tipo de adaptador"""
+        pass
+
     def flip_gravity(self) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def get_interpolation_alpha(self) -> float:
+        """Fração do passo fixo acumulada e ainda não simulada (0 a 1)"""
+        return 1.0
+
+    def get_interpolated_position(self, object_id: int, alpha: float) -> Vector2D:
+        """Obtém a posição interpolada entre o passo anterior e o atual"""
+        return self.get_position(object_id)
+
+    def cast_segments(self, starts: np.ndarray, ends: np.ndarray,
+                      radius: float = 0.0, categories: int = CATEGORY_ALL) -> SegmentHits:
+        """Primeiro corpo atingido por cada segmento (arrays n x 2 de início e fim)"""
+        return SegmentHits.missed(ends)
+
+    def query_boxes(self, boxes: np.ndarray, categories: int = CATEGORY_ALL) -> BoxHits:
+        """Corpos que tocam cada caixa (array n x 4 de x_min, y_min, x_max, y_max)"""
+        return BoxHits.empty(len(boxes))
+
+    def query_nearest(self, points: np.ndarray, max_distance: float,
+                      categories: int = CATEGORY_ALL) -> NearestHits:
+        """Corpo mais próximo de cada ponto (array n x 2) até a distância máxima"""
+        return NearestHits.missed(points)
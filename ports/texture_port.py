@@ -5,6 +5,11 @@ class TexturePort(ABC):
     @abstractmethod
     def load_texture(self, path: str) -> Any:
         pass
+
+    @abstractmethod
+    def release_texture(self, path: str) -> None:
+        """Devolve uma referência obtida com load_texture; a textura pode ser descartada depois"""
+        pass
     
     @abstractmethod
     def get_sprite_from_sheet(self, 
@@ -14,4 +19,10 @@ class TexturePort(ABC):
     
     @abstractmethod
     def flip_sprite(self, sprite: Any, flip_x: bool, flip_y: bool) -> Any:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes ocupados por textura carregada, pelo caminho"""
+        pass
+
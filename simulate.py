@@ -0,0 +1,18 @@
+import sys
+
+from simulation.headless import build_headless_game, run_policy
+from simulation.policies import run_right_and_jump
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    game = build_headless_game()
+    report = run_policy(game, run_right_and_jump, frames)
+    print(f"{report.frames} quadros em {report.wall_time:.2f}s "
+          f"({report.frames_per_second:.0f} quadros/s simulados), "
+          f"pontuação {report.score}, distância {report.distance:.0f}")
+
+
+if __name__ == "__main__":
+    main()
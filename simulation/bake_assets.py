@@ -0,0 +1,32 @@
+"""Empacota as folhas de sprites e os efeitos sonoros do jogo num pacote .aora.
+
+Uso: python -m simulation.bake_assets --output domain/animation/assets/assets.aora
+"""
+import argparse
+import os
+import time
+
+import pygame
+
+from adapters.asset_bundle import bake_assets
+from domain.animation.asset_manifest import ASSET_BUNDLE_PATH, SOUND_EFFECTS, SPRITE_SHEETS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=ASSET_BUNDLE_PATH, help="pacote a gravar")
+    args = parser.parse_args()
+
+    # O bake não abre janela nem toca som: só decodifica imagens e áudio
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    start = time.perf_counter()
+    index = bake_assets(args.output, SPRITE_SHEETS, SOUND_EFFECTS)
+    print(f"{len(index['sheets'])} folhas e {len(index['sounds'])} sons em {args.output} "
+          f"({os.path.getsize(args.output)} bytes, {time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
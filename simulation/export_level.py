@@ -0,0 +1,27 @@
+"""Exporta uma partida do GroundGenerator para um arquivo de nível .aorl.
+
+Uso: python -m simulation.export_level nivel.aorl --seed 42 --chunks 1000 --set max_gap=180
+"""
+import argparse
+import time
+
+from domain.level_file import export_generated_level
+from simulation.seed_sweep import _parse_params
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="arquivo de nível a gravar")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunks", type=int, default=100, help="quantidade de chunks exportados")
+    parser.add_argument("--set", nargs="*", default=[], metavar="PARAM=VALOR",
+                        help="parâmetros do GroundGenerator, ex.: min_gap=120")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    platforms = export_generated_level(args.path, args.seed, args.chunks, _parse_params(args.set))
+    print(f"{platforms} plataformas em {args.chunks} chunks gravadas em {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
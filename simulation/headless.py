@@ -0,0 +1,35 @@
+from typing import Callable, Iterable, Optional
+
+from adapters.null_event import ScriptedEvent
+from adapters.null_mixer import NullMixer
+from adapters.null_renderer import NullRenderer
+from adapters.null_texture import NullTexture
+from adapters.pymunk_physics import PymunkPhysicsAdapter
+from adapters.virtual_clock import VirtualClock
+from domain.game import Game
+from domain.physics.constants import GRAVITY, PHYSICS_HZ
+from domain.simulation_report import SimulationReport
+from ports.physics_port import PhysicsPort
+
+# Política de entrada: recebe o quadro e o jogo e retorna as teclas pressionadas
+Policy = Callable[[int, Game], Iterable[str]]
+
+
+def build_headless_game(seed: Optional[int] = None,
+                        physics: Optional[PhysicsPort] = None,
+                        delta_time: float = 1 / 60) -> Game:
+    """Game completo sem janela, áudio nem limite de FPS"""
+    return Game(
+        renderer=NullRenderer(),
+        event_handler=ScriptedEvent(lambda frame: ()),
+        clock=VirtualClock(delta_time),
+        physics=physics or PymunkPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ),
+        texture_port=NullTexture(),
+        mixer=NullMixer(),
+        seed=seed
+    )
+
+
+def run_policy(game: Game, policy: Policy, frames: int) -> SimulationReport:
+    """Simula uma partida com as teclas escolhidas pela política a cada quadro"""
+    return game.simulate(frames, ScriptedEvent(lambda frame: policy(frame, game)))
@@ -0,0 +1,38 @@
+from typing import Iterable
+
+import numpy as np
+
+from domain.game import Game
+
+
+def run_right_and_jump(frame: int, game: Game) -> Iterable[str]:
+    """Roteiro fixo: corre para a direita e troca a gravidade a cada segundo e meio"""
+    return ("right", "jump") if frame % 90 == 0 else ("right",)
+
+
+class GapJumperBot:
+    """Corre para a direita e troca de linha quando não há chão à frente.
+
+    Usa uma única consulta em lote por quadro: um segmento no sentido da
+    gravidade e outro no sentido oposto, ambos à frente do player.
+    """
+
+    def __init__(self, look_ahead: float = 96.0, reach: float = 600.0):
+        self.look_ahead = look_ahead
+        self.reach = reach
+
+    def __call__(self, frame: int, game: Game) -> Iterable[str]:
+        player = game.object_manager.get_player()
+        if player is None or not player.is_grounded:
+            return ("right",)
+
+        position = player.position
+        down = -1.0 if player.gravity_inverted else 1.0
+        x = position.x + self.look_ahead
+        starts = np.array([[x, position.y], [x, position.y]])
+        ends = np.array([[x, position.y + down * self.reach], [x, position.y - down * self.reach]])
+        hits = game.physics.cast_segments(starts, ends, categories=game.physics.CATEGORY_GROUND).hit
+
+        if not hits[0] and hits[1]:
+            return ("right", "jump")
+        return ("right",)
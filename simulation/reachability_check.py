@@ -0,0 +1,69 @@
+"""Gera os níveis de uma faixa de sementes e verifica se todo vão é alcançável.
+
+Uso: python -m simulation.reachability_check --seeds 0:1000 --chunks 50 --set max_gap=300
+"""
+import argparse
+import os
+import time
+from multiprocessing import Pool
+from typing import Dict, Tuple
+
+import numpy as np
+
+from domain.ground_generator import MIN_PLATFORM_WIDTH, GroundGenerator, generate_chunk
+from domain.reachability import JumpParams, reachability_table
+from simulation.seed_sweep import _parse_params, _parse_seeds
+
+
+def level_pairs(seed: int, chunks: int, generator_params: Dict[str, int]) -> Tuple[np.ndarray, ...]:
+    """Colunas (x, largura, inferior, superior) dos pares dos primeiros chunks, sem correção"""
+    generator = GroundGenerator(seed)
+    generator.configure(**generator_params)
+    generator.jump_params = None
+    params = generator.params()
+    parts = [generate_chunk(seed, index, params) for index in range(chunks)]
+    x = np.concatenate([part['x'][::2] for part in parts])
+    width = np.concatenate([part['width'][::2] for part in parts])
+    y = np.concatenate([part['y'] for part in parts])
+    return x, width, y[::2], y[1::2]
+
+
+def check_seed(args) -> Tuple[int, int, int]:
+    seed, chunks, generator_params = args
+    # Mesmos parâmetros que o GroundGenerator usa, com a menor largura de plataforma configurada
+    min_platform_width = generator_params.get("min_platform_width", MIN_PLATFORM_WIDTH)
+    table = reachability_table(JumpParams.for_player(min_platform_width))
+    passable = table.passable(*level_pairs(seed, chunks, generator_params))
+    return seed, len(passable), int((~passable).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", default="0:100", help="faixa início:fim de sementes")
+    parser.add_argument("--chunks", type=int, default=50, help="chunks gerados por semente")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--set", nargs="*", default=[], metavar="PARAM=VALOR",
+                        help="parâmetros do GroundGenerator, ex.: max_gap=300")
+    args = parser.parse_args()
+
+    tasks = [(seed, args.chunks, _parse_params(args.set)) for seed in _parse_seeds(args.seeds)]
+    start = time.perf_counter()
+    if args.workers <= 1:
+        results = list(map(check_seed, tasks))
+    else:
+        with Pool(args.workers) as pool:
+            results = pool.map(check_seed, tasks)
+    elapsed = time.perf_counter() - start
+
+    transitions = sum(count for _, count, _ in results)
+    broken = sum(bad for _, _, bad in results)
+    failing = sorted(seed for seed, _, bad in results if bad)
+    print(f"{len(results)} sementes, {transitions} transições em {elapsed:.2f}s")
+    print(f"impossíveis: {broken} ({broken / max(transitions, 1):.2%}) em {len(failing)} sementes")
+    if failing:
+        print("primeiras sementes com problema:", ", ".join(map(str, failing[:10])))
+    raise SystemExit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
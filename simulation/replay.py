@@ -0,0 +1,88 @@
+"""Repete uma partida gravada e confere se o estado final bate com o checksum.
+
+Uso: python -m simulation.replay replays/partida.aorr [--realtime] [--watch]
+"""
+import argparse
+from dataclasses import dataclass
+from typing import Optional
+
+from adapters.replay_clock import ReplayClock
+from adapters.replay_event import ReplayEvent
+from domain.game import Game
+from domain.input_recording import InputRecording
+from domain.simulation_report import SimulationReport
+from simulation.headless import build_headless_game
+
+
+@dataclass
+class ReplayResult:
+    report: SimulationReport
+    score_matches: bool
+    checksum_matches: bool
+
+    @property
+    def valid(self) -> bool:
+        return self.score_matches and self.checksum_matches
+
+
+def replay(recording: InputRecording, game: Optional[Game] = None,
+           realtime: bool = False, render: bool = False) -> ReplayResult:
+    """Roda a partida gravada num jogo novo, em tempo real ou o mais rápido possível"""
+    if game is None:
+        game = build_headless_game()
+    # Cada quadro recebe o delta com que foi jogado
+    game.clock = ReplayClock(recording, realtime)
+
+    game.exit_to_menu()
+    game.start_game(recording.seed)
+    report = game.simulate(recording.frame_count, ReplayEvent(recording), render=render)
+    return ReplayResult(
+        report=report,
+        score_matches=report.score == recording.score,
+        checksum_matches=game.state_checksum() == recording.checksum
+    )
+
+
+def _build_window_game(recording: InputRecording) -> Game:
+    import pygame
+
+    from adapters.null_mixer import NullMixer
+    from adapters.pygame_event import PygameEvent
+    from adapters.pygame_renderer import PygameRenderer
+    from adapters.pygame_texture import PygameTexture
+    from adapters.pymunk_physics import PymunkPhysicsAdapter
+    from simulation.headless import GRAVITY, PHYSICS_HZ
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    return Game(
+        renderer=PygameRenderer(screen),
+        event_handler=PygameEvent(),
+        clock=ReplayClock(recording, realtime=True),
+        physics=PymunkPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ),
+        texture_port=PygameTexture(),
+        mixer=NullMixer()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="arquivo .aorr gravado durante a partida")
+    parser.add_argument("--realtime", action="store_true", help="espera o tempo real de cada quadro")
+    parser.add_argument("--watch", action="store_true", help="abre a janela e desenha o replay em tempo real")
+    args = parser.parse_args()
+
+    recording = InputRecording.load(args.path)
+    game = _build_window_game(recording) if args.watch else None
+    result = replay(recording, game, realtime=args.realtime or args.watch, render=args.watch)
+
+    report = result.report
+    print(f"semente {recording.seed}: {report.frames}/{recording.frame_count} quadros "
+          f"em {report.wall_time:.2f}s ({report.frames_per_second:.0f} quadros/s)")
+    print(f"pontuação {report.score} (gravada {recording.score}), "
+          f"checksum {'confere' if result.checksum_matches else 'NÃO confere'}")
+    raise SystemExit(0 if result.valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Confere se uma partida restaurada de save_run segue exatamente como a original.
+
+Para cada semente joga até o quadro do save, continua por --frames quadros e
+guarda o checksum; depois restaura o blob e repete os mesmos quadros.
+
+Uso: python -m simulation.restore_check --seeds 0:20 --at 0,137,400 --frames 600 --physics aabb
+"""
+import argparse
+from typing import List, Optional, Tuple
+
+from domain.game_state import GameState
+from domain.physics.constants import GRAVITY, PHYSICS_HZ
+from simulation.headless import build_headless_game, run_policy
+from simulation.policies import GapJumperBot
+from simulation.seed_sweep import _parse_seeds
+
+
+def _build_physics(name: str):
+    if name == "aabb":
+        from adapters.aabb_physics import AABBPhysicsAdapter
+        return AABBPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ)
+    from adapters.pymunk_physics import PymunkPhysicsAdapter
+    return PymunkPhysicsAdapter(GRAVITY, physics_hz=PHYSICS_HZ)
+
+
+def check_seed(seed: int, save_frame: int, frames: int, physics: str) -> Optional[Tuple[bytes, bytes]]:
+    """Checksums da continuação original e da restaurada, ou None se a partida acabou antes do save"""
+    game = build_headless_game(physics=_build_physics(physics))
+    bot = GapJumperBot()
+    game.start_game(seed)
+    if save_frame:
+        run_policy(game, bot, save_frame)
+    if not game.state_manager.is_playing():
+        return None
+    blob = game.save_run()
+
+    run_policy(game, bot, frames)
+    original = game.state_checksum()
+
+    game.restore_run(blob)
+    game.state_manager.change_state(GameState.PLAYING)
+    run_policy(game, bot, frames)
+    return original, game.state_checksum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", default="0:20", help="faixa início:fim de sementes")
+    parser.add_argument("--at", default="0,1,137,400", help="quadros em que a partida é salva")
+    parser.add_argument("--frames", type=int, default=600, help="quadros jogados depois do save")
+    parser.add_argument("--physics", choices=("pymunk", "aabb"), default="pymunk")
+    args = parser.parse_args()
+
+    checked = 0
+    failing: List[Tuple[int, int]] = []
+    for seed in _parse_seeds(args.seeds):
+        for save_frame in map(int, args.at.split(",")):
+            result = check_seed(seed, save_frame, args.frames, args.physics)
+            if result is None:
+                continue
+            checked += 1
+            if result[0] != result[1]:
+                failing.append((seed, save_frame))
+
+    print(f"{checked} restaurações conferidas, {len(failing)} divergentes")
+    if failing:
+        print("primeiras divergências (semente@quadro):",
+              ", ".join(f"{seed}@{frame}" for seed, frame in failing[:10]))
+    raise SystemExit(1 if failing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Roda uma faixa de sementes em paralelo e agrega as estatísticas de sobrevivência.
+
+Uso: python -m simulation.seed_sweep --seeds 0:1000 --workers 8 --policy bot
+"""
+import argparse
+import csv
+import os
+import statistics
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from domain.game import Game
+from simulation.headless import Policy, build_headless_game, run_policy
+from simulation.policies import GapJumperBot, run_right_and_jump
+
+POLICIES: Dict[str, Policy] = {
+    "scripted": run_right_and_jump,
+    "bot": GapJumperBot(),
+}
+DEFAULT_FRAMES = 60 * 60
+SURVIVED = "survived"
+
+
+@dataclass
+class RunResult:
+    seed: int
+    frames: int
+    distance: float
+    score: int
+    death_cause: Optional[str]  # None quando a partida chegou ao limite de quadros
+
+
+@dataclass
+class SweepReport:
+    runs: int = 0
+    survived: int = 0
+    death_causes: Counter = field(default_factory=Counter)
+    distances: List[float] = field(default_factory=list)
+    scores: List[int] = field(default_factory=list)
+    frames: List[int] = field(default_factory=list)
+
+    def add(self, result: RunResult) -> None:
+        self.runs += 1
+        self.death_causes[result.death_cause or SURVIVED] += 1
+        if result.death_cause is None:
+            self.survived += 1
+        self.distances.append(result.distance)
+        self.scores.append(result.score)
+        self.frames.append(result.frames)
+
+    @property
+    def survival_rate(self) -> float:
+        return self.survived / self.runs if self.runs else 0.0
+
+    def summary(self) -> str:
+        if not self.runs:
+            return "nenhuma partida"
+        lines = [
+            f"partidas: {self.runs}  sobrevivência: {self.survival_rate:.1%}",
+            f"distância média {statistics.fmean(self.distances):.0f}  mediana {statistics.median(self.distances):.0f}",
+            f"pontuação média {statistics.fmean(self.scores):.0f}  mediana {statistics.median(self.scores):.0f}",
+            f"quadros médios {statistics.fmean(self.frames):.0f}",
+            "causas: " + ", ".join(f"{cause} {count}" for cause, count in self.death_causes.most_common()),
+        ]
+        return "\n".join(lines)
+
+
+# Um mundo por processo: criado no initializer e reaproveitado a cada semente
+_worker_game: Optional[Game] = None
+
+
+def _init_worker() -> None:
+    global _worker_game
+    _worker_game = build_headless_game()
+
+
+def run_seed(seed: int, policy_name: str, frames: int,
+             generator_params: Dict[str, int]) -> RunResult:
+    if _worker_game is None:
+        _init_worker()
+    game = _worker_game
+
+    # Partida limpa: reset da física e do gerador. A semente é a mesma de
+    # start_game, export_level e do cabeçalho .aorr, então uma semente com
+    # problema pode ser reproduzida nas outras ferramentas
+    game.exit_to_menu()
+    game.object_manager.ground_generator.configure(**generator_params)
+    game.start_game(seed)
+
+    report = run_policy(game, POLICIES[policy_name], frames)
+    return RunResult(
+        seed=game.run_seed,
+        frames=report.frames,
+        distance=report.distance,
+        score=report.score,
+        death_cause=report.death_cause
+    )
+
+
+def _run_seed_args(args) -> RunResult:
+    return run_seed(*args)
+
+
+def sweep(seeds: Sequence[int], policy_name: str = "bot", frames: int = DEFAULT_FRAMES,
+          workers: int = 1, generator_params: Optional[Dict[str, int]] = None,
+          chunk_size: int = 16) -> Iterator[RunResult]:
+    """Gera os resultados conforme as partidas terminam, em qualquer ordem.
+
+    Cada semente roda num mundo resetado, então o resultado de uma semente não
+    depende de quantos processos existem nem de quais sementes rodaram antes.
+    """
+    tasks = ((seed, policy_name, frames, generator_params or {}) for seed in seeds)
+    if workers <= 1:
+        yield from map(_run_seed_args, tasks)
+        return
+    with Pool(workers, initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(_run_seed_args, tasks, chunksize=chunk_size)
+
+
+def aggregate(results: Iterable[RunResult]) -> SweepReport:
+    report = SweepReport()
+    for result in results:
+        report.add(result)
+    return report
+
+
+def _parse_seeds(text: str) -> range:
+    start, _, stop = text.partition(":")
+    return range(int(start), int(stop)) if stop else range(int(start), int(start) + 1)
+
+
+def _parse_params(pairs: List[str]) -> Dict[str, int]:
+    params = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        params[name] = int(value)
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", default="0:100", help="faixa início:fim de sementes")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="bot")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="limite de quadros por partida")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--set", nargs="*", default=[], metavar="PARAM=VALOR",
+                        help="parâmetros do GroundGenerator, ex.: min_gap=120 height_variation=40")
+    parser.add_argument("--output", help="CSV com o resultado de cada semente")
+    args = parser.parse_args()
+
+    report = SweepReport()
+    writer = None
+    output = open(args.output, "w", newline="") if args.output else None
+    try:
+        for result in sweep(_parse_seeds(args.seeds), args.policy, args.frames,
+                            args.workers, _parse_params(args.set)):
+            report.add(result)
+            if output:
+                if writer is None:
+                    writer = csv.DictWriter(output, fieldnames=list(asdict(result)))
+                    writer.writeheader()
+                writer.writerow(asdict(result))
+    finally:
+        if output:
+            output.close()
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
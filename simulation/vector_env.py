@@ -0,0 +1,228 @@
+"""Ambiente vetorizado no estilo Gym: N mundos do runner avançando juntos.
+
+Cada mundo é um Game sem janela. A cada step, todos recebem uma ação, avançam
+frame_skip quadros e devolvem observações, recompensas e dones empilhados em
+arrays NumPy. Com workers > 1 os mundos são divididos em fatias, cada uma num
+processo próprio, e a comunicação é uma mensagem por fatia por step.
+
+O pymunk não tem passo em lote: cada mundo tem o próprio space e avança num
+laço Python, um depois do outro. O que é feito em lote é a montagem das
+observações, numa única passada vetorizada sobre todos os mundos da fatia.
+"""
+from multiprocessing import Pipe, Process
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from adapters.null_event import NullEvent
+from domain.game import Game
+from domain.input_handler import InputHandler
+from simulation.headless import build_headless_game
+
+# Ação discreta -> teclas pressionadas
+ACTIONS: Tuple[Tuple[str, ...], ...] = (
+    (),
+    ("right",),
+    ("left",),
+    ("jump",),
+    ("right", "jump"),
+    ("left", "jump"),
+)
+PLAYER_FEATURES = 5    # x, y, vx, vy, sinal da gravidade
+PLATFORM_FEATURES = 4  # dx, dy, largura, tipo
+
+StepResult = Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]
+
+
+def observation_size(platforms_ahead: int) -> int:
+    return PLAYER_FEATURES + PLATFORM_FEATURES * platforms_ahead
+
+
+class WorldShard:
+    """Fatia de mundos avançados um a um dentro de um único processo"""
+
+    def __init__(self, seeds: Sequence[int], frame_skip: int = 1,
+                 max_frames: Optional[int] = None, platforms_ahead: int = 4):
+        self.seeds = list(seeds)
+        self.frame_skip = frame_skip
+        self.max_frames = max_frames
+        self.platforms_ahead = platforms_ahead
+        self.games: List[Game] = []
+        self.inputs: List[NullEvent] = []
+        for seed in self.seeds:
+            game = build_headless_game(seed)
+            events = NullEvent()
+            game.event_handler = events
+            game.input_handler = InputHandler(events)
+            self.games.append(game)
+            self.inputs.append(events)
+
+        count = len(self.seeds)
+        self.frames = np.zeros(count, dtype=np.int64)
+        self.scores = np.zeros(count, dtype=np.int64)
+        self.observations = np.zeros((count, observation_size(platforms_ahead)), dtype=np.float32)
+
+    def reset(self) -> np.ndarray:
+        for index in range(len(self.games)):
+            self._reset_world(index)
+        self._observe()
+        return self.observations.copy()
+
+    def _reset_world(self, index: int) -> None:
+        # O gerador de cada mundo continua a sequência da própria semente entre episódios
+        game = self.games[index]
+        game.exit_to_menu()
+        game.start_game()
+        self.frames[index] = 0
+        self.scores[index] = 0
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        count = len(self.games)
+        rewards = np.zeros(count, dtype=np.float32)
+        dones = np.zeros(count, dtype=bool)
+        truncated = np.zeros(count, dtype=bool)
+        episode_scores = np.zeros(count, dtype=np.int64)
+        episode_frames = np.zeros(count, dtype=np.int64)
+
+        for index, (game, events, action) in enumerate(zip(self.games, self.inputs, actions.tolist())):
+            events.pressed = set(ACTIONS[action])
+            delta_time = game.clock.get_delta_time()
+            for _ in range(self.frame_skip):
+                game.handle_input()
+                game.update(delta_time)
+                self.frames[index] += 1
+                if not game.state_manager.is_playing():
+                    break
+
+            score = game.score_tracker.get_score()
+            rewards[index] = score - self.scores[index]
+            self.scores[index] = score
+
+            over = game.state_manager.is_game_over()
+            out_of_time = self.max_frames is not None and self.frames[index] >= self.max_frames
+            if over or out_of_time:
+                # Reset automático: a observação devolvida já é a do novo episódio
+                dones[index] = True
+                truncated[index] = not over
+                episode_scores[index] = score
+                episode_frames[index] = self.frames[index]
+                self._reset_world(index)
+
+        self._observe()
+        infos = {"truncated": truncated, "episode_score": episode_scores, "episode_frames": episode_frames}
+        return self.observations.copy(), rewards, dones, infos
+
+    def _observe(self) -> None:
+        """Observações de todos os mundos numa passada vetorizada.
+
+        O laço por mundo só lê o player e pega as fatias das próximas
+        plataformas; as posições relativas são calculadas de uma vez.
+        """
+        count = len(self.games)
+        players = np.zeros((count, PLAYER_FEATURES))
+        taken = np.zeros(count, dtype=np.intp)
+        columns: Tuple[List[np.ndarray], ...] = ([], [], [], [])
+        for index, game in enumerate(self.games):
+            player = game.object_manager.get_player()
+            if player is None:
+                continue
+            position, velocity = player.position, player.velocity
+            players[index] = (position.x, position.y, velocity.x, velocity.y,
+                              -1.0 if player.gravity_inverted else 1.0)
+
+            # Próximas plataformas a partir do player
+            descriptors = game.object_manager.ground_generator.descriptors
+            start, end = descriptors.index_range(position.x, float('inf'))
+            first = start - descriptors.first_index
+            last = min(end, start + self.platforms_ahead) - descriptors.first_index
+            if last > first:
+                taken[index] = last - first
+                for column, values in zip(columns, (descriptors.x, descriptors.y,
+                                                    descriptors.width, descriptors.kind)):
+                    column.append(values[first:last])
+
+        self.observations[:, :PLAYER_FEATURES] = players
+        platforms = self.observations[:, PLAYER_FEATURES:].reshape(count, self.platforms_ahead, PLATFORM_FEATURES)
+        platforms[:] = 0.0
+        if not taken.any():
+            return
+        # As plataformas concatenadas seguem a ordem dos mundos, a mesma da máscara
+        owner = np.repeat(np.arange(count), taken)
+        x, y, width, kind = (np.concatenate(column) for column in columns)
+        platforms[np.arange(self.platforms_ahead) < taken[:, None]] = np.column_stack(
+            (x - players[owner, 0], y - players[owner, 1], width, kind)
+        )
+
+
+def _shard_worker(connection, seeds: Sequence[int], options: dict) -> None:
+    shard = WorldShard(seeds, **options)
+    while True:
+        command, data = connection.recv()
+        if command == "step":
+            connection.send(shard.step(data))
+        elif command == "reset":
+            connection.send(shard.reset())
+        else:
+            break
+    connection.close()
+
+
+class VectorEnv:
+    """N mundos com reset()/step(actions) em lote, opcionalmente divididos entre processos"""
+
+    def __init__(self, num_envs: int, seeds: Optional[Sequence[int]] = None,
+                 frame_skip: int = 1, max_frames: Optional[int] = None,
+                 platforms_ahead: int = 4, workers: int = 1):
+        self.num_envs = num_envs
+        self.seeds = list(seeds) if seeds is not None else list(range(num_envs))
+        if len(self.seeds) != num_envs:
+            raise ValueError("É preciso uma semente por mundo")
+        self.observation_size = observation_size(platforms_ahead)
+        self.action_count = len(ACTIONS)
+        options = dict(frame_skip=frame_skip, max_frames=max_frames, platforms_ahead=platforms_ahead)
+
+        self.local_shard: Optional[WorldShard] = None
+        self.shards: List[Tuple[Process, object, int]] = []
+        if workers <= 1:
+            self.local_shard = WorldShard(self.seeds, **options)
+        else:
+            for shard_seeds in np.array_split(np.array(self.seeds), min(workers, num_envs)):
+                parent, child = Pipe()
+                process = Process(target=_shard_worker, args=(child, shard_seeds.tolist(), options), daemon=True)
+                process.start()
+                child.close()
+                self.shards.append((process, parent, len(shard_seeds)))
+
+    def reset(self) -> np.ndarray:
+        if self.local_shard is not None:
+            return self.local_shard.reset()
+        for _, connection, _ in self.shards:
+            connection.send(("reset", None))
+        return np.concatenate([connection.recv() for _, connection, _ in self.shards])
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        actions = np.asarray(actions, dtype=np.int64)
+        if self.local_shard is not None:
+            return self.local_shard.step(actions)
+
+        offset = 0
+        for _, connection, size in self.shards:
+            connection.send(("step", actions[offset:offset + size]))
+            offset += size
+        results = [connection.recv() for _, connection, _ in self.shards]
+        observations, rewards, dones, infos = zip(*results)
+        merged = {name: np.concatenate([info[name] for info in infos]) for name in infos[0]}
+        return np.concatenate(observations), np.concatenate(rewards), np.concatenate(dones), merged
+
+    def close(self) -> None:
+        for process, connection, _ in self.shards:
+            connection.send(("close", None))
+            connection.close()
+            process.join()
+        self.shards = []
+
+    def __enter__(self) -> "VectorEnv":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()